@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+# pylint:disable=redefined-outer-name
+# pylint:disable=protected-access
+from os.path import dirname, join
+
+import pytest
+
+from shawl.config import SHAWL_CONFIG as CONFIG
+from shawl.testing import FakeRemoteEnd
+from shawl.transport import clear_pools, connect
+
+PAGE_URL = 'http://app/benchmark'
+FIXTURES = join(dirname(__file__), 'fixtures')
+FIXTURE = join(FIXTURES, 'page.html')
+
+
+def pytest_addoption(parser):
+    parser.addoption('--latency',
+                     type=float,
+                     default=0.0,
+                     help='latency of fake remote end in seconds')
+
+
+@pytest.fixture(scope='session', autouse=True)
+def yaml_path():
+    default = CONFIG.source_yaml_path
+    CONFIG.source_yaml_path = join(FIXTURES, 'pages')
+    CONFIG._yaml_map = dict()
+    yield
+    CONFIG.source_yaml_path = default
+    CONFIG._yaml_map = dict()
+
+
+@pytest.fixture(scope='session')
+def remote_end(request):
+    remote = FakeRemoteEnd(latency=request.config.getoption('--latency'))
+    remote.add_page_from_file(PAGE_URL, FIXTURE)
+    with remote:
+        yield remote
+    clear_pools()
+
+
+@pytest.fixture(scope='session')
+def driver(remote_end):
+    driver = connect(remote_end.url, {'browserName': 'fake'})
+    yield driver
+    driver.quit()
+
+
+@pytest.fixture()
+def page_driver(driver):
+    with CONFIG.override(elements_classes_module='default'):
+        driver.get(PAGE_URL)
+        yield driver
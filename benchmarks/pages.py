@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+from shawl import BasePage
+
+
+class BenchmarkPage(BasePage):
+
+    def search(self, text: str):
+        self.fill({'query_input': text, 'agree_input': True})
+        self.submit_button.click()
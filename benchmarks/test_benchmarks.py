@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# pylint:disable=redefined-outer-name
+import subprocess
+import sys
+from importlib import import_module
+from shutil import copy
+
+import pytest
+
+from benchmarks import pages
+from benchmarks.pages import BenchmarkPage
+from shawl.config import SHAWL_CONFIG as CONFIG
+from shawl.utils._stubber import stub_file
+
+pytest.importorskip('pytest_benchmark')
+
+
+def test_page_construction(benchmark, page_driver):
+    page = benchmark(BenchmarkPage, page_driver)
+    assert repr(page) == 'Benchmark page'
+
+
+def test_element_access(benchmark, page_driver):
+    page = BenchmarkPage(page_driver)
+
+    def read():
+        page.query_input._element = None  # pylint:disable=protected-access
+        return page.query_input.element.tag_name
+
+    assert benchmark(read) == 'input'
+
+
+def test_collection_iteration(benchmark, page_driver):
+    page = BenchmarkPage(page_driver)
+
+    def iterate():
+        return [element.text for element in page.price_td]
+
+    assert len(benchmark(iterate)) == 50
+
+
+def test_extract_fields(benchmark, page_driver):
+    page = BenchmarkPage(page_driver)
+    fields = benchmark(page.extract, ['query', 'rows', 'prices'])
+    assert fields.rows == 50
+
+
+def test_wait_visible(benchmark, page_driver):
+    page = BenchmarkPage(page_driver)
+    assert benchmark(page.submit_button.is_visible, wait=1)
+
+
+def test_wait_invisible(benchmark, page_driver):
+    page = BenchmarkPage(page_driver)
+    assert benchmark(page.spinner_div.is_invisible, wait=1)
+
+
+@pytest.mark.parametrize('use_allure', [True, False])
+def test_allure_wrapping(benchmark, page_driver, use_allure):
+    page = BenchmarkPage(page_driver)
+    page.query_input.is_present()
+    with CONFIG.override(use_allure=use_allure):
+        benchmark(page.query_input.get_attribute, 'id')
+
+
+def test_stub_generation(benchmark, tmp_path, monkeypatch):
+    package = tmp_path / 'stubbed'
+    package.mkdir()
+    (package / '__init__.py').touch()
+    copy(pages.__file__, package / 'pages.py')
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    import_module('stubbed')
+
+    benchmark(stub_file, 'stubbed', 'pages.py')
+    assert 'class BenchmarkPage' in (package / 'pages.pyi').read_text()
+
+
+@pytest.mark.parametrize('statement', ['import shawl',
+                                       'from shawl import BasePage'])
+def test_import_time(benchmark, statement):
+    # Each round is a new interpreter, as each worker of a test run
+    benchmark.pedantic(subprocess.run,
+                       args=([sys.executable, '-c', statement],),
+                       kwargs={'check': True},
+                       rounds=5)
@@ -1,16 +1,70 @@
 # -*- coding: utf-8 -*-
-from shawl.config import SHAWL_CONFIG
-from shawl.core._base_collection import BaseCollection
-from shawl.core._base_element import BaseElement
-from shawl.core._base_page import BasePage
-from shawl.decorators import catch_timeout_error, check_server_error_after
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from shawl.config import SHAWL_CONFIG
+    from shawl.core._action_queue import ActionQueue
+    from shawl.core._base_collection import BaseCollection
+    from shawl.core._base_component import BaseComponent
+    from shawl.core._base_element import BaseElement
+    from shawl.core._base_page import BasePage
+    from shawl.core._router import PageRouter
+    from shawl.core._templates import ElementTemplate
+    from shawl.decorators import (
+        catch_timeout_error,
+        check_server_error_after
+    )
+    from shawl.utils._budget import budget
+    from shawl.utils._profiler import Profiler
+    from shawl.utils._read_cache import CachingDriver
 
 __version__ = '0.0.1'
+
+# Modules of exported names. Modules are imported on first access
+# of a name, so that `import shawl` doesn't import selenium and yaml
+_EXPORTS: Dict[str, str] = {
+    'SHAWL_CONFIG': 'shawl.config',
+    'ActionQueue': 'shawl.core._action_queue',
+    'BaseCollection': 'shawl.core._base_collection',
+    'BaseComponent': 'shawl.core._base_component',
+    'BaseElement': 'shawl.core._base_element',
+    'BasePage': 'shawl.core._base_page',
+    'PageRouter': 'shawl.core._router',
+    'ElementTemplate': 'shawl.core._templates',
+    'catch_timeout_error': 'shawl.decorators',
+    'check_server_error_after': 'shawl.decorators',
+    'budget': 'shawl.utils._budget',
+    'Profiler': 'shawl.utils._profiler',
+    'CachingDriver': 'shawl.utils._read_cache'
+    }
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value: Any = getattr(import_module(_EXPORTS[name]), name)
+    # Next access doesn't call this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
 __all__ = [
     'SHAWL_CONFIG',
     'BaseElement',
     'BaseCollection',
+    'BaseComponent',
     'BasePage',
+    'ActionQueue',
+    'ElementTemplate',
+    'PageRouter',
+    'CachingDriver',
+    'Profiler',
+    'budget',
     'check_server_error_after',
     'catch_timeout_error'
     ]
@@ -1,12 +1,20 @@
 # -*- coding: utf-8 -*-
 import argparse
+import json
+import sys
+from typing import List
 
+from shawl.config import SHAWL_CONFIG as CONFIG
 from shawl.utils import create_stubs
+from shawl.utils._locator_profiler import format_report, profile_locators
+
+PROFILE_LOCATORS = 'profile-locators'
 
 
 def parse_arguments():
     parser = argparse.ArgumentParser(
-        description='Shawl: YAML powered Selenium wrapper')
+        description='Shawl: YAML powered Selenium wrapper. '
+                    f'Run with "{PROFILE_LOCATORS}" to profile locators.')
     parser.add_argument(
         'yaml_path',
         type=str,
@@ -19,9 +27,94 @@ def parse_arguments():
         help='Path to root module with classes',
         default=None
         )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Number of processes, number of CPUs by default'
+        )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Create stubs of unchanged modules too'
+        )
     return parser.parse_args()
 
 
+def parse_profile_arguments(args: List[str]):
+    parser = argparse.ArgumentParser(
+        prog=f'python -m shawl {PROFILE_LOCATORS}',
+        description='Measure how long locators of page yaml files take '
+                    'to evaluate in a browser and rank them by cost.')
+    parser.add_argument(
+        'url',
+        type=str,
+        help='URL of a page to evaluate locators on'
+        )
+    parser.add_argument(
+        '--remote',
+        type=str,
+        default='http://127.0.0.1:4444/wd/hub',
+        help='WebDriver remote end URL'
+        )
+    parser.add_argument(
+        '--browser',
+        type=str,
+        default='chrome',
+        help='Browser name capability'
+        )
+    parser.add_argument(
+        '--yaml-path',
+        type=str,
+        default=None,
+        help='Path to yaml files (SHAWL_YAML_PATH by default)'
+        )
+    parser.add_argument(
+        '--page',
+        action='append',
+        dest='pages',
+        help='Name of yaml file without extension, all files by default'
+        )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='Number of evaluations of each locator'
+        )
+    parser.add_argument(
+        '--json',
+        type=str,
+        default=None,
+        help='Path to save report as json'
+        )
+    return parser.parse_args(args)
+
+
+def run_profile_locators(args: List[str]):
+    # pylint: disable=import-outside-toplevel
+    from shawl.transport import connect
+
+    options = parse_profile_arguments(args)
+    if options.yaml_path:
+        CONFIG.source_yaml_path = options.yaml_path
+    driver = connect(options.remote, {'browserName': options.browser})
+    try:
+        driver.get(options.url)
+        costs = profile_locators(driver, options.pages, options.repeat)
+    finally:
+        driver.quit()
+    print(format_report(costs))
+    if options.json:
+        with open(options.json, 'w', encoding='utf-8') as file:
+            json.dump([cost._asdict() for cost in costs], file, indent=2)
+
+
 if __name__ == '__main__':
-    args = parse_arguments()
-    create_stubs(args.yaml_path, args.class_root_path)
+    if sys.argv[1:2] == [PROFILE_LOCATORS]:
+        run_profile_locators(sys.argv[2:])
+    else:
+        arguments = parse_arguments()
+        create_stubs(arguments.yaml_path,
+                     arguments.class_root_path,
+                     jobs=arguments.jobs,
+                     force=arguments.force)
@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+from ._base_collection import AsyncBaseCollection
+from ._base_element import AsyncBaseElement
+from ._base_page import AsyncBasePage
+from ._client import AsyncWebDriver, AsyncWebElement
+
+__all__ = [
+    'AsyncBaseCollection',
+    'AsyncBaseElement',
+    'AsyncBasePage',
+    'AsyncWebDriver',
+    'AsyncWebElement'
+    ]
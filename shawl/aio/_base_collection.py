@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException
+)
+
+from ..config import SHAWL_CONFIG as CONFIG
+from ..core._locators import collect_selectors
+from ..exceptions import NoSuchElementsException
+from ..utils._browser_context import Frames, parse_frames
+from ._client import AsyncWebDriver, AsyncWebElement
+from ._waits import (
+    POLL_FREQUENCY,
+    in_frames,
+    switch_frames,
+    wait_for,
+    wait_until
+)
+
+
+class AsyncBaseCollection:
+    """
+    This class is base for all asynchronous PageElement collections.
+
+    Coroutine `collection` returns list of AsyncWebElement and provide
+    lazy load of it. It will wait for any of AsyncWebElement to be present
+    on the DOM for `SHAWL_LAZY_LOAD_TIMEOUT` seconds.
+
+    For example::
+
+
+        base_collection = AsyncBaseCollection(driver,
+                                              **{'css selector': 'div'})
+        for element in await base_collection.collection():
+            print(await element.text())
+
+        assert await base_collection.count() == 50
+    """
+
+    # pylint:disable=too-many-instance-attributes
+    def __init__(self,
+                 driver: AsyncWebDriver,
+                 repr_name: Optional[str] = None,
+                 frame: Any = None,
+                 timeout: Optional[float] = None,
+                 poll: Optional[float] = None,
+                 lazy_timeout: Optional[float] = None,
+                 alternatives: Optional[List[Dict[str, str]]] = None,
+                 **locators):
+        # pylint: disable=too-many-arguments
+        self._driver: AsyncWebDriver = driver
+        self._selectors: List[Tuple[str, str]] = collect_selectors(
+            locators, alternatives)
+        self._selector: Tuple[str, str] = self._selectors[0]
+        self._collection: List[AsyncWebElement] = []
+        self._frames: Frames = parse_frames(frame)
+        self._timeout: Optional[float] = timeout
+        self._poll: float = poll or POLL_FREQUENCY
+        self._lazy_timeout: Optional[float] = lazy_timeout
+        self._repr_name: str = repr_name or (f'{self.__class__.__name__}: '
+                                             f'{self._selector}')
+
+    def __str__(self) -> str:
+        return f'Selector: {self._selector}, Collection: {self._collection}'
+
+    def __repr__(self) -> str:
+        return self._repr_name
+
+    async def _find_all(self,
+                        driver: AsyncWebDriver) -> List[AsyncWebElement]:
+        # Alternatives are tried in declared order, selector which
+        # found elements is the only one tried from then on
+        for selector in self._selectors:
+            elements: List[AsyncWebElement] = await driver.find_elements(
+                *selector)
+            if elements:
+                self._selectors = [selector]
+                self._selector = selector
+                return elements
+        return list()
+
+    async def _load(self):
+        try:
+            self._collection = await wait_for(
+                self._driver,
+                self._lazy_timeout or CONFIG.lazy_load_timeout,
+                in_frames(self._frames, self._find_all),
+                self._poll)
+        except TimeoutException as t_exc:
+            raise NoSuchElementsException(
+                'no such elements: '
+                'Unable to locate elements: '
+                '{"method":"%s","selector":"%s"}' % self._selector) from t_exc
+
+    async def _wait_until(self,
+                          wait: Optional[float],
+                          method: Callable[[AsyncWebDriver], Awaitable[Any]]
+                          ) -> bool:
+        # Frames are switched on each poll, so that frame, which is not
+        # rendered yet, is waited for
+        return await wait_until(self._driver,
+                                self._timeout if wait is None else wait,
+                                in_frames(self._frames, method),
+                                self._poll)
+
+    async def _visible(self, driver: AsyncWebDriver) -> List[bool]:
+        return [await element.is_displayed()
+                for element in await self._find_all(driver)]
+
+    @property
+    def selector(self) -> Tuple[str, str]:
+        return self._selector
+
+    @property
+    def frames(self) -> Frames:
+        return self._frames
+
+    async def collection(self) -> List[AsyncWebElement]:
+        if (not self._collection
+                or not await switch_frames(self._driver, self._frames)):
+            await self._load()
+        try:
+            for element in self._collection:
+                await element.is_enabled()
+        except StaleElementReferenceException:
+            await self._load()
+        return self._collection
+
+    async def count(self) -> int:
+        return len(await self.collection())
+
+    async def any_is_visible(self, wait: Optional[float] = None) -> bool:
+        """
+        Check that at least one element from collection is visible
+        on a web page during 'wait' seconds.
+        Returns True if at least one element from collection is visible,
+        False otherwise
+        """
+
+        async def any_visible(driver: AsyncWebDriver) -> bool:
+            return any(await self._visible(driver))
+
+        return await self._wait_until(wait, any_visible)
+
+    async def all_are_visible(self, wait: Optional[float] = None) -> bool:
+        """
+        Check that all elements from collection are present on the DOM of
+        a page and visible during 'wait' seconds.
+        Returns True if all elements from collection are visible,
+        False otherwise
+        """
+
+        async def all_visible(driver: AsyncWebDriver) -> bool:
+            visible: List[bool] = await self._visible(driver)
+            return bool(visible) and all(visible)
+
+        return await self._wait_until(wait, all_visible)
+
+    async def any_is_present(self, wait: Optional[float] = None) -> bool:
+        """
+        Check that at least one element from collection is present
+        on a web page during 'wait' seconds.
+        Returns True if at least one element from collection is present,
+        False otherwise
+        """
+        return await self._wait_until(wait, self._find_all)
+
+
+__all__ = ['AsyncBaseCollection']
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+from contextlib import suppress
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    cast
+)
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException
+)
+
+from ..config import SHAWL_CONFIG as CONFIG
+from ..core._locators import collect_selectors
+from ..utils._browser_context import Frames, parse_frames
+from ._client import AsyncWebDriver, AsyncWebElement
+from ._waits import (
+    POLL_FREQUENCY,
+    in_frames,
+    switch_frames,
+    wait_for,
+    wait_until
+)
+
+
+class AsyncBaseElement:
+    """
+    This class is base for all asynchronous PageElement.
+
+    It is the same as BaseElement, but `element` is a coroutine,
+    which lazily loads AsyncWebElement and waits for it to be present
+    on the DOM for `SHAWL_LAZY_LOAD_TIMEOUT` seconds.
+
+    Any AsyncWebElement method can be awaited just from AsyncBaseElement
+    instance.
+
+    For example::
+
+
+        base_element = AsyncBaseElement(driver, **{'css selector': 'div'})
+        await base_element.click()
+        print(await base_element.text())
+        assert await base_element.is_visible()
+    """
+
+    # pylint:disable=too-many-instance-attributes
+    def __init__(self,
+                 driver: AsyncWebDriver,
+                 repr_name: Optional[str] = None,
+                 keystrokes: bool = False,
+                 frame: Any = None,
+                 timeout: Optional[float] = None,
+                 poll: Optional[float] = None,
+                 lazy_timeout: Optional[float] = None,
+                 alternatives: Optional[List[Dict[str, str]]] = None,
+                 **locators):
+        # pylint: disable=too-many-arguments
+        self._driver: AsyncWebDriver = driver
+        self._selectors: List[Tuple[str, str]] = collect_selectors(
+            locators, alternatives)
+        self._selector: Tuple[str, str] = self._selectors[0]
+        self._element: Optional[AsyncWebElement] = None
+        self._keystrokes: bool = keystrokes
+        self._frames: Frames = parse_frames(frame)
+        self._timeout: Optional[float] = timeout
+        self._poll: float = poll or POLL_FREQUENCY
+        self._lazy_timeout: Optional[float] = lazy_timeout
+        self._repr_name: str = repr_name or (f'{self.__class__.__name__}: '
+                                             f'{self._selector}')
+
+    def __getattr__(self, item: str) -> Callable[..., Awaitable[Any]]:
+        # This magic method will be invoked if current class has no item.
+        if item.startswith('_') or not callable(getattr(AsyncWebElement,
+                                                        item,
+                                                        None)):
+            raise AttributeError(f'{self.__class__.__name__} object '
+                                 f'has no attribute {item}')
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            element: AsyncWebElement = await self.element()
+            return await getattr(element, item)(*args, **kwargs)
+
+        return call
+
+    def __str__(self) -> str:
+        return f'Selector: {self._selector}, Element: {self._element}'
+
+    def __repr__(self) -> str:
+        return self._repr_name
+
+    async def _load(self):
+        self._element = await wait_for(
+            self._driver,
+            self._lazy_timeout or CONFIG.lazy_load_timeout,
+            in_frames(self._frames, self._find),
+            self._poll)
+
+    async def _find(self, driver: AsyncWebDriver) -> AsyncWebElement:
+        # Alternatives are tried in declared order, selector which
+        # found the element is the only one tried from then on
+        for selector in self._selectors[:-1]:
+            with suppress(NoSuchElementException):
+                return self._pin(selector,
+                                 await driver.find_element(*selector))
+        return self._pin(self._selectors[-1],
+                         await driver.find_element(*self._selectors[-1]))
+
+    def _pin(self,
+             selector: Tuple[str, str],
+             element: AsyncWebElement) -> AsyncWebElement:
+        self._selectors = [selector]
+        self._selector = selector
+        return element
+
+    async def _wait_until(self,
+                          wait: Optional[float],
+                          method: Callable[[AsyncWebDriver], Awaitable[Any]],
+                          missing: bool = False) -> bool:
+        # Frames are switched on each poll, so that frame, which is not
+        # rendered yet, is waited for, poll returns `missing` without it
+        return await wait_until(self._driver,
+                                self._timeout if wait is None else wait,
+                                in_frames(self._frames, method, missing),
+                                self._poll)
+
+    async def _find_displayed(self, driver: AsyncWebDriver) -> bool:
+        element: AsyncWebElement = await self._find(driver)
+        return await element.is_displayed()
+
+    @property
+    def selector(self) -> Tuple[str, str]:
+        return self._selector
+
+    @property
+    def keystrokes(self) -> bool:
+        return self._keystrokes
+
+    @property
+    def frames(self) -> Frames:
+        return self._frames
+
+    async def element(self) -> AsyncWebElement:
+        if (self._element is None
+                or not await switch_frames(self._driver, self._frames)):
+            await self._load()
+        else:
+            try:
+                await self._element.is_enabled()
+            except StaleElementReferenceException:
+                await self._load()
+        return cast(AsyncWebElement, self._element)
+
+    async def type_text(self, text: str):
+        element: AsyncWebElement = await self.element()
+        await element.clear()
+        await element.send_keys(text)
+
+    async def is_present(self, wait: Optional[float] = None) -> bool:
+        """
+        Check that element is present on the DOM of a page
+        during 'wait' seconds.
+        Returns True if element is present, False otherwise
+        """
+        return await self._wait_until(wait, self._find)
+
+    async def is_visible(self, wait: Optional[float] = None) -> bool:
+        """
+        Check that element is present on the DOM of a page and visible
+        during 'wait' seconds.
+        Returns True if element is visible, False otherwise
+        """
+        return await self._wait_until(wait, self._find_displayed)
+
+    async def is_invisible(self, wait: Optional[float] = None) -> bool:
+        """
+        Check that element is either invisible or not present on the DOM
+        during 'wait' seconds.
+        Returns True if element is invisible, False otherwise
+        """
+
+        async def invisible(driver: AsyncWebDriver) -> bool:
+            try:
+                return not await self._find_displayed(driver)
+            except (NoSuchElementException, StaleElementReferenceException):
+                return True
+
+        return await self._wait_until(wait, invisible, missing=True)
+
+    async def is_clickable(self, wait: Optional[float] = None) -> bool:
+        """
+        Check that element is visible and enabled during 'wait' seconds.
+        Returns True if element is clickable, False otherwise
+        """
+
+        async def clickable(driver: AsyncWebDriver) -> bool:
+            element: AsyncWebElement = await self._find(driver)
+            return (await element.is_displayed()
+                    and await element.is_enabled())
+
+        return await self._wait_until(wait, clickable)
+
+    async def is_selected(self, wait: Optional[float] = None) -> bool:
+        """
+        Check that element is selected during 'wait' seconds.
+        Returns True if element is selected, False otherwise
+        """
+
+        async def selected(driver: AsyncWebDriver) -> bool:
+            element: AsyncWebElement = await self._find(driver)
+            return await element.is_selected()
+
+        return await self._wait_until(wait, selected)
+
+    async def has_text(self, text: str, wait: Optional[float] = None) -> bool:
+        """
+        Check that element contains `text` during 'wait' seconds.
+        Returns True if element has text, False otherwise
+        """
+
+        async def has_text(driver: AsyncWebDriver) -> bool:
+            element: AsyncWebElement = await self._find(driver)
+            return text in await element.text()
+
+        return await self._wait_until(wait, has_text)
+
+    async def has_text_in_value(self,
+                                text: str,
+                                wait: Optional[float] = None) -> bool:
+        """
+        Check that value of element contains `text` during 'wait' seconds.
+        Returns True if element value has text, False otherwise
+        """
+
+        async def has_text_in_value(driver: AsyncWebDriver) -> bool:
+            element: AsyncWebElement = await self._find(driver)
+            return text in (await element.get_property('value') or '')
+
+        return await self._wait_until(wait, has_text_in_value)
+
+    async def is_stale(self, wait: Optional[float] = None) -> bool:
+        """
+        Check that element is no longer attached to the DOM
+        during 'wait' seconds.
+        Returns True if element is stale, False otherwise
+        """
+        element: Optional[AsyncWebElement] = self._element
+        if element is None:
+            return False
+
+        async def stale(_: AsyncWebDriver) -> bool:
+            try:
+                await element.is_enabled()
+            except StaleElementReferenceException:
+                return True
+            return False
+
+        return await self._wait_until(wait, stale)
+
+
+__all__ = ['AsyncBaseElement']
@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import re
+from collections import namedtuple
+from types import ModuleType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+
+from ..core._page_spec import (
+    COLLECTION_OPTIONS,
+    ELEMENT_OPTIONS,
+    PageSpec,
+    create_elements,
+    get_element_class,
+    get_element_modules,
+    load_page_spec
+)
+from ..core._templates import create_template
+from ..exceptions import InvalidComponentException
+from ._base_collection import AsyncBaseCollection
+from ._base_element import AsyncBaseElement
+from ._client import AsyncWebDriver
+from ._waits import wait_until
+
+_INVISIBLE = namedtuple('_INVISIBLE', ['all_invisible', 'not_invisible'])
+_PRESENT = namedtuple('_PRESENT', ['all_present', 'not_present'])
+
+AsyncShawlElems = Union[AsyncBaseElement, AsyncBaseCollection]
+
+
+def _get_list(item: Union[List[str], str, None]) -> List[str]:
+    if isinstance(item, list):
+        return item
+    return [item] if isinstance(item, str) else list()
+
+
+class AsyncBasePage:
+    """
+    This class is base for all asynchronous PageObject.
+
+    It reads the same ClassName.yaml files as BasePage does, but
+    elements are looked up as `AsyncHtmltagElement` and
+    `AsyncHtmltagCollection` classes (`AsyncBaseElement` and
+    `AsyncBaseCollection` are used if there are no such classes).
+
+    All checks are coroutines, which await conditions without blocking
+    event loop, so one loop can drive pages of many sessions. Yaml files
+    with `components` section are not supported yet.
+
+    For example::
+
+
+        async def check(url: str):
+            driver = await AsyncWebDriver.start(hub, {'browserName': 'chrome'})
+            await driver.get(url)
+            page = CustomPage(driver)
+            await page.wait_to_page_load(to_be_present=['search_input'])
+            await page.search_input.send_keys('shawl')
+            await driver.quit()
+
+
+        await asyncio.gather(*(check(url) for url in urls))
+    """
+
+    def __init__(self, driver: AsyncWebDriver):
+        self._driver: AsyncWebDriver = driver
+        spec: PageSpec = load_page_spec(self.__class__)
+        if spec.components:
+            raise InvalidComponentException(
+                f'{self.__class__.__name__}: components are not supported '
+                f'by asynchronous pages ({", ".join(spec.components)})')
+        # Description of page is shared by all instances, so each page
+        # has own copies of dicts, which may be changed
+        self._page_strings: Dict[str, str] = dict(spec.page_strings)
+        self._repr_name: str = spec.repr_name
+        self._url_pattern: str = spec.url_pattern
+        self._element_defaults: Dict[str, Any] = dict(spec.element_defaults)
+        self._fields: Dict[str, Dict[str, str]] = {
+            name: dict(field) for name, field in spec.fields.items()}
+
+        base_module, init_module = get_element_modules(self.__class__)
+        self._init_elements(spec.elements,
+                            base_module,
+                            init_module,
+                            'Async{}Element',
+                            AsyncBaseElement,
+                            ELEMENT_OPTIONS)
+        self._init_elements(spec.collections,
+                            base_module,
+                            init_module,
+                            'Async{}Collection',
+                            AsyncBaseCollection,
+                            COLLECTION_OPTIONS)
+        for name, template in spec.templates.items():
+            setattr(self, name, create_template(
+                self._driver,
+                template,
+                ('Async{}Element', AsyncBaseElement),
+                ('Async{}Collection', AsyncBaseCollection),
+                base_module,
+                init_module,
+                self._element_defaults))
+
+    def __str__(self) -> str:
+        return (f'{self.__class__.__name__} elements: \n'
+                + '\n'.join((f'- {k}' for k, v
+                             in self.__dict__.items()
+                             if not k.startswith('_')
+                             and v is not None)))
+
+    def __repr__(self) -> str:
+        return self._repr_name
+
+    def _init_elements(self,
+                       yaml_part: Dict[str, Dict[str, Any]],
+                       base_module: ModuleType,
+                       init_module: Optional[ModuleType],
+                       mask: str,
+                       elem_init: type,
+                       options: Tuple[str, ...] = ()):
+        # pylint:disable=too-many-arguments
+        def get_class(html_elem: str) -> type:
+            return get_element_class(html_elem,
+                                     mask,
+                                     elem_init,
+                                     base_module,
+                                     init_module)
+
+        for name, element_obj in create_elements(self._driver,
+                                                 yaml_part,
+                                                 get_class,
+                                                 options,
+                                                 self._element_defaults):
+            setattr(self, name, element_obj)
+
+    async def _wait_driver(self,
+                           wait: Optional[float],
+                           read: Callable[[AsyncWebDriver], Awaitable[Any]],
+                           check: Callable[[Any], bool]) -> bool:
+
+        async def condition(driver: AsyncWebDriver) -> bool:
+            return check(await read(driver))
+
+        return await wait_until(self._driver, wait, condition)
+
+    @property
+    def url_pattern(self) -> str:
+        return self._url_pattern
+
+    @property
+    def driver(self) -> AsyncWebDriver:
+        return self._driver
+
+    @property
+    def page_strings(self) -> Dict[str, str]:
+        return self._page_strings
+
+    @property
+    def fields(self) -> Dict[str, Dict[str, str]]:
+        return self._fields
+
+    async def title_is(self, title: str, wait: Optional[float] = None) -> bool:
+        """
+        Check that page title equals expected during `wait` seconds.
+        Returns True if the title matches, False otherwise
+        """
+        return await self._wait_driver(wait,
+                                       AsyncWebDriver.title,
+                                       lambda value: value == title)
+
+    async def title_contains(self,
+                             title: str,
+                             wait: Optional[float] = None) -> bool:
+        """
+        Check that page title contains expected as substring
+        during `wait` seconds.
+        Returns True if the title matches, False otherwise
+        """
+        return await self._wait_driver(wait,
+                                       AsyncWebDriver.title,
+                                       lambda value: title in value)
+
+    async def url_contains(self,
+                           url: str,
+                           wait: Optional[float] = None) -> bool:
+        """
+        Check that url contains a case-sensitive substring during 'wait'
+        seconds.
+        Returns True if the url matches, False otherwise
+        """
+        return await self._wait_driver(wait,
+                                       AsyncWebDriver.current_url,
+                                       lambda value: url in value)
+
+    async def url_matches(self,
+                          pattern: str,
+                          wait: Optional[float] = None) -> bool:
+        """
+        Check that url is the exact match of the pattern during 'wait'
+        seconds.
+        Returns True if the url matches, False otherwise
+        """
+        return await self._wait_driver(
+            wait,
+            AsyncWebDriver.current_url,
+            lambda value: re.search(pattern, value) is not None)
+
+    async def url_to_be(self, url: str, wait: Optional[float] = None) -> bool:
+        """
+        Check that url is the exact match expected url during 'wait'
+        seconds.
+        Returns True if the url matches, False otherwise
+        """
+        return await self._wait_driver(wait,
+                                       AsyncWebDriver.current_url,
+                                       lambda value: value == url)
+
+    async def url_changes(self,
+                          url: str,
+                          wait: Optional[float] = None) -> bool:
+        """
+        Check that url is not matched to expected during 'wait'
+        seconds.
+        Returns True if the url is different, False otherwise
+        """
+        return await self._wait_driver(wait,
+                                       AsyncWebDriver.current_url,
+                                       lambda value: value != url)
+
+    async def validate_current_page(self,
+                                    elements_list: Optional[List[str]] = None,
+                                    page_name: Optional[str] = None,
+                                    url: Optional[str] = None,
+                                    validate_all: bool = False):
+        """
+        Validate current page, the same way as
+        `BasePage.validate_current_page` does.
+        """
+        to_check: List[AsyncBaseElement] = list()
+
+        if isinstance(elements_list, list) and elements_list:
+            to_check.extend((v for k, v in self.__dict__.items()
+                             if k in elements_list
+                             and isinstance(v, AsyncBaseElement)))
+        elif validate_all and not elements_list:
+            to_check.extend((v for k, v in self.__dict__.items()
+                             if not k.startswith('_')
+                             and isinstance(v, AsyncBaseElement)))
+
+        for elem in to_check:
+            assert await elem.is_present(), f'{elem} is not present'
+
+        if page_name:
+            title: str = await self._driver.title()
+            assert page_name in title, (f'"{page_name}" '
+                                        f'is not in title "{title}"')
+        if url:
+            current_url: str = await self._driver.current_url()
+            assert current_url == url, ('URL mismatch. \n'
+                                        f'Expected: {url}\n'
+                                        f'Actual: {current_url}')
+
+    async def is_elements_invisible(
+            self,
+            to_be_invisible: Union[List[str], str, None],
+            wait: Optional[float] = None) -> _INVISIBLE:
+        """
+        Returned NamedTuple has attributes `all_invisible: bool`
+        and `not_invisible: List[str]`
+        """
+        result: List[str] = [
+            element for element in _get_list(to_be_invisible)
+            if not await getattr(self, element).is_invisible(wait=wait)
+            ]
+        return _INVISIBLE(all_invisible=not bool(result), not_invisible=result)
+
+    async def is_elements_present(self,
+                                  to_be_present: Union[List[str], str, None],
+                                  wait: Optional[float] = None) -> _PRESENT:
+        """
+        Returned NamedTuple has attributes `all_present: bool`
+        and `not_present: List[str]`
+        """
+        result: List[str] = [
+            element for element in _get_list(to_be_present)
+            if not await getattr(self, element).is_present(wait=wait)
+            ]
+        return _PRESENT(all_present=not bool(result), not_present=result)
+
+    async def wait_to_page_load(self,
+                                to_be_present: Union[List[str], str,
+                                                     None] = None,
+                                to_be_invisible: Union[List[str], str,
+                                                       None] = None,
+                                wait_present: Optional[float] = None,
+                                wait_invisible: Optional[float] = None,
+                                sleep_after: float = 0):
+        # pylint:disable=too-many-arguments
+        present: _PRESENT = await self.is_elements_present(
+            to_be_present,
+            wait=wait_present)
+        invisible: _INVISIBLE = await self.is_elements_invisible(
+            to_be_invisible,
+            wait=wait_invisible)
+
+        if not present.all_present or not invisible.all_invisible:
+            raise AssertionError(
+                'Page was not loaded properly! '
+                f'Next items were not present {present.not_present}. '
+                f'Next items were visible {invisible.not_invisible}.')
+
+        if sleep_after > 0:
+            await asyncio.sleep(sleep_after)
+
+
+__all__ = ['AsyncBasePage']
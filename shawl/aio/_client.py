@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+import aiohttp
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+
+from ..utils._browser_context import Frames
+
+_ELEMENT_KEY = 'element-6066-11e4-a52e-4f735466cecf'
+
+
+def to_w3c_locator(by: str, value: str) -> Tuple[str, str]:
+    """
+    Convert Selenium locator to one of W3C locator strategies,
+    the same way as Selenium does it for W3C browsers.
+    """
+    if by == 'id':
+        return 'css selector', f'[id="{value}"]'
+    if by == 'name':
+        return 'css selector', f'[name="{value}"]'
+    if by == 'class name':
+        return 'css selector', f'.{value}'
+    if by == 'tag name':
+        return 'css selector', value
+    return by, value
+
+
+class AsyncWebElement:
+    """
+    Reference to an element of a web page in asynchronous session.
+    """
+
+    def __init__(self, driver: 'AsyncWebDriver', element_id: str):
+        self._driver: 'AsyncWebDriver' = driver
+        self._id: str = element_id
+
+    def __repr__(self) -> str:
+        return (f'<{self.__class__.__name__} (session="'
+                f'{self._driver.session_id}", element="{self._id}")>')
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, AsyncWebElement) and self._id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self._id)
+
+    @property
+    def id(self) -> str:
+        # pylint: disable=invalid-name
+        return self._id
+
+    async def _execute(self,
+                       method: str,
+                       command: str,
+                       body: Optional[Dict[str, Any]] = None) -> Any:
+        return await self._driver.execute(
+            method, f'/element/{self._id}{command}', body)
+
+    async def click(self):
+        await self._execute('POST', '/click', dict())
+
+    async def clear(self):
+        await self._execute('POST', '/clear', dict())
+
+    async def send_keys(self, *value: str):
+        await self._execute('POST', '/value', {'text': ''.join(value)})
+
+    async def text(self) -> str:
+        return str(await self._execute('GET', '/text'))
+
+    async def get_attribute(self, name: str) -> Optional[str]:
+        value: Any = await self._execute('GET', f'/attribute/{name}')
+        return None if value is None else str(value)
+
+    async def get_property(self, name: str) -> Any:
+        return await self._execute('GET', f'/property/{name}')
+
+    async def is_displayed(self) -> bool:
+        return bool(await self._execute('GET', '/displayed'))
+
+    async def is_enabled(self) -> bool:
+        return bool(await self._execute('GET', '/enabled'))
+
+    async def is_selected(self) -> bool:
+        return bool(await self._execute('GET', '/selected'))
+
+    async def rect(self) -> Dict[str, float]:
+        return dict(await self._execute('GET', '/rect'))
+
+    async def find_element(self, by: str, value: str) -> 'AsyncWebElement':
+        using, value = to_w3c_locator(by, value)
+        return cast(AsyncWebElement,
+                    await self._execute('POST', '/element',
+                                        {'using': using, 'value': value}))
+
+    async def find_elements(self,
+                            by: str,
+                            value: str) -> List['AsyncWebElement']:
+        using, value = to_w3c_locator(by, value)
+        return list(await self._execute('POST', '/elements',
+                                        {'using': using, 'value': value}))
+
+
+class AsyncWebDriver:
+    """
+    Asynchronous client of W3C WebDriver protocol.
+
+    One event loop can drive many sessions, because commands of a session
+    are awaited instead of blocking a thread.
+
+    For example::
+
+
+        driver = await AsyncWebDriver.start('http://127.0.0.1:4444/wd/hub',
+                                            {'browserName': 'chrome'})
+        await driver.get('https://example.com')
+        print(await driver.title())
+        await driver.quit()
+    """
+
+    def __init__(self,
+                 url: str,
+                 session_id: str = '',
+                 http: Optional[aiohttp.ClientSession] = None):
+        self._url: str = url.rstrip('/')
+        self._http: Optional[aiohttp.ClientSession] = http
+        self._own_http: bool = http is None
+        self._error_handler: ErrorHandler = ErrorHandler()
+        self._frames: Optional[Frames] = ()
+        self.session_id: str = session_id
+        self.capabilities: Dict[str, Any] = dict()
+
+    @classmethod
+    async def start(cls,
+                    url: str,
+                    capabilities: Optional[Dict[str, Any]] = None,
+                    http: Optional[aiohttp.ClientSession] = None
+                    ) -> 'AsyncWebDriver':
+        """
+        Create new session on remote end with `url`.
+        """
+        driver = cls(url, http=http)
+        value: Dict[str, Any] = await driver.request(
+            'POST',
+            '/session',
+            {'capabilities': {'alwaysMatch': capabilities or dict()}})
+        driver.session_id = value['sessionId']
+        driver.capabilities = value.get('capabilities', dict())
+        return driver
+
+    def _wrap_value(self, value: Any) -> Any:
+        if isinstance(value, AsyncWebElement):
+            return {_ELEMENT_KEY: value.id}
+        if isinstance(value, dict):
+            return {k: self._wrap_value(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self._wrap_value(v) for v in value]
+        return value
+
+    def _unwrap_value(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            if _ELEMENT_KEY in value:
+                return AsyncWebElement(self, value[_ELEMENT_KEY])
+            return {k: self._unwrap_value(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self._unwrap_value(v) for v in value]
+        return value
+
+    async def request(self,
+                      method: str,
+                      path: str,
+                      body: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Send HTTP request to remote end and return `value` of response.
+        W3C errors are raised as Selenium exceptions.
+        """
+        if self._http is None:
+            self._http = aiohttp.ClientSession()
+        async with self._http.request(method,
+                                      f'{self._url}{path}',
+                                      json=body) as response:
+            data: Any = await response.json(content_type=None)
+        value: Any = data.get('value') if isinstance(data, dict) else None
+        if isinstance(value, dict) and 'error' in value:
+            self._error_handler.check_response({'status': value['error'],
+                                                'value': value})
+        if response.status >= 400:
+            raise WebDriverException(f'{method} {path} failed with '
+                                     f'status {response.status}: {data}')
+        return value
+
+    async def execute(self,
+                      method: str,
+                      command: str,
+                      body: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Execute `command` of current session.
+        """
+        value: Any = await self.request(
+            method,
+            f'/session/{self.session_id}{command}',
+            self._wrap_value(body) if body is not None else None)
+        return self._unwrap_value(value)
+
+    async def quit(self):
+        try:
+            await self.request('DELETE', f'/session/{self.session_id}')
+        finally:
+            if self._own_http and self._http is not None:
+                await self._http.close()
+                self._http = None
+
+    async def get(self, url: str):
+        await self.execute('POST', '/url', {'url': url})
+        self._frames = ()
+
+    async def refresh(self):
+        await self.execute('POST', '/refresh', dict())
+        self._frames = ()
+
+    async def title(self) -> str:
+        return str(await self.execute('GET', '/title') or '')
+
+    async def current_url(self) -> str:
+        return str(await self.execute('GET', '/url'))
+
+    async def window_handles(self) -> List[str]:
+        return list(await self.execute('GET', '/window/handles'))
+
+    async def switch_to_window(self, handle: str):
+        await self.execute('POST', '/window', {'handle': handle})
+        self._frames = ()
+
+    async def switch_to_frames(self, frames: Frames):
+        """
+        Switch to a path of frames from the top level document,
+        switch commands are sent only if session is not there yet.
+        """
+        if self._frames == frames:
+            return
+        self._frames = None
+        await self.execute('POST', '/frame', {'id': None})
+        for by, value in frames:
+            await self.execute('POST', '/frame',
+                               {'id': await self.find_element(by, value)})
+        self._frames = frames
+
+    async def find_element(self, by: str, value: str) -> AsyncWebElement:
+        using, value = to_w3c_locator(by, value)
+        return cast(AsyncWebElement,
+                    await self.execute('POST', '/element',
+                                       {'using': using, 'value': value}))
+
+    async def find_elements(self,
+                            by: str,
+                            value: str) -> List[AsyncWebElement]:
+        using, value = to_w3c_locator(by, value)
+        return list(await self.execute('POST', '/elements',
+                                       {'using': using, 'value': value}))
+
+    async def execute_script(self, script: str, *args: Any) -> Any:
+        return await self.execute('POST', '/execute/sync',
+                                  {'script': script, 'args': list(args)})
+
+
+__all__ = ['AsyncWebDriver', 'AsyncWebElement', 'to_w3c_locator']
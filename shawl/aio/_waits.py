@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from contextlib import suppress
+from typing import Any, Awaitable, Callable, Optional
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    NoSuchFrameException,
+    StaleElementReferenceException,
+    TimeoutException
+)
+
+from ..config import SHAWL_CONFIG as CONFIG
+from ..utils._browser_context import Frames
+
+POLL_FREQUENCY = 0.5
+
+AsyncCondition = Callable[[Any], Awaitable[Any]]
+
+
+async def wait_for(driver: Any,
+                   wait: Optional[float],
+                   method: AsyncCondition,
+                   poll: float = POLL_FREQUENCY) -> Any:
+    """
+    Await `method` until it returns truthy value for `wait` seconds,
+    polling every `poll` seconds without blocking event loop.
+    Raises TimeoutException if value was not returned in time.
+    """
+    loop = asyncio.get_running_loop()
+    timeout: float = CONFIG.wait_timeout if wait is None else wait
+    deadline: float = loop.time() + timeout
+    while True:
+        with suppress(NoSuchElementException):
+            value: Any = await method(driver)
+            if value:
+                return value
+        if loop.time() > deadline:
+            raise TimeoutException(f'Condition was not met in {timeout} s')
+        await asyncio.sleep(poll)
+
+
+async def wait_until(driver: Any,
+                     wait: Optional[float],
+                     method: AsyncCondition,
+                     poll: float = POLL_FREQUENCY) -> bool:
+    with suppress(Exception):
+        return bool(await wait_for(driver, wait, method, poll))
+    return False
+
+
+async def switch_frames(driver: Any, frames: Frames) -> bool:
+    """
+    Switch `driver` to `frames`. Returns False if a frame
+    is not in the DOM (yet).
+    """
+    try:
+        await driver.switch_to_frames(frames)
+    except (NoSuchElementException,
+            NoSuchFrameException,
+            StaleElementReferenceException):
+        return False
+    return True
+
+
+def in_frames(frames: Frames,
+              method: AsyncCondition,
+              missing: bool = False) -> AsyncCondition:
+    """
+    Return condition, which switches to `frames` on each poll before
+    awaiting `method`. Poll returns `missing` if a frame was not found.
+    """
+
+    async def poll(driver: Any) -> Any:
+        if not await switch_frames(driver, frames):
+            return missing
+        return await method(driver)
+
+    return poll
+
+
+__all__ = [
+    'POLL_FREQUENCY',
+    'in_frames',
+    'switch_frames',
+    'wait_for',
+    'wait_until'
+    ]
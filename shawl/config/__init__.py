@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from copy import copy
 from os import environ, getcwd, walk
 from os.path import isabs, isdir, join
-from typing import Dict, Union, cast
-
-from dotenv import find_dotenv, load_dotenv
+from threading import Lock
+from typing import Any, Dict, Iterator, TypeVar, Union, cast
 
 from . import _localization as steps_descr
 
@@ -13,13 +15,42 @@ class ShawlConfigError(Exception):
     pass
 
 
+# Options overridden in current thread or asyncio task by option name,
+# the default mapping is never changed
+_OVERRIDES: ContextVar[Dict[str, Any]] = ContextVar('shawl_config_overrides',
+                                                    default=dict())
+
+_T = TypeVar('_T')
+_LOAD_LOCK = Lock()
+
+
+def _option(name: str, default: _T) -> _T:
+    """
+    Return value of option `name` overridden in current context
+    or its process `default`.
+    """
+    return cast(_T, _OVERRIDES.get().get(name, default))
+
+
 class ShawlConfig:
     """
     Config class for framework.
+
+    Options are process defaults, which are loaded from environment and
+    changed by setters. They can be overridden for current thread or
+    asyncio task with `override` context manager.
+
+    If `lazy` is set, `.shawlrc` file is looked for and options are loaded
+    on the first access of an option instead of creation of config.
     """
 
     # pylint:disable=too-many-instance-attributes
-    def __init__(self):
+    def __init__(self, lazy: bool = False):
+        if lazy:
+            return
+        # pylint:disable=import-outside-toplevel
+        from dotenv import find_dotenv, load_dotenv
+
         self._rc_file: str = find_dotenv(filename='.shawlrc', usecwd=True)
         self._source_yaml_path: str = ''
         self._lazy_load_timeout: int = 0
@@ -32,17 +63,55 @@ class ShawlConfig:
         self._log_level: str = ''
         self._log_message: str = ''
         self._step_localization: str = ''
+        self._timing_stats_path: str = ''
+        self._adaptive_timeouts: bool = False
+        self._adaptive_timeout_factor: float = 0.0
+        self._max_cached_handles: int = 0
+        self._reload_yaml: bool = False
+        # Maps of yaml files of paths overridden in contexts
+        self._yaml_maps: Dict[str, Dict[str, str]] = dict()
         if self._rc_file:
             load_dotenv(dotenv_path=self._rc_file)
         self.load_from_env()
 
+    def __getattr__(self, name: str) -> Any:
+        # Called only for attributes, which are missing,
+        # e.g. options of lazy config, which were not loaded yet
+        if name.startswith('__') or not self._load():
+            raise AttributeError(name)
+        return getattr(self, name)
+
+    def __setattr__(self, name: str, value: Any):
+        if name != '_rc_file':
+            self._load()
+        super().__setattr__(name, value)
+
+    def _load(self) -> bool:
+        """
+        Load options of lazy config, if they were not loaded yet.
+        Returns True if options were loaded by this call.
+        """
+        if '_rc_file' in self.__dict__:
+            return False
+        with _LOAD_LOCK:
+            if '_rc_file' in self.__dict__:
+                return False
+            # Options appear at once for other threads
+            self.__dict__.update(ShawlConfig().__dict__)
+        return True
+
     @property
     def yaml_map(self) -> Dict[str, str]:
         """
         Loaded map of yaml files for easier loading BasePages.
         """
+        path: str = self.source_yaml_path
+        if path != self._source_yaml_path:
+            if path not in self._yaml_maps:
+                self._yaml_maps[path] = _get_yaml_files_path_dict(path)
+            return self._yaml_maps[path]
         if not self._yaml_map:
-            self._yaml_map = _get_yaml_files_path_dict(self.source_yaml_path)
+            self._yaml_map = _get_yaml_files_path_dict(path)
         return self._yaml_map
 
     @property
@@ -51,7 +120,7 @@ class ShawlConfig:
         Path to yaml files with page description.
         Default value is 'resources/dicts/pages'
         """
-        return self._source_yaml_path
+        return _option('source_yaml_path', self._source_yaml_path)
 
     @source_yaml_path.setter
     def source_yaml_path(self, path: str):
@@ -73,7 +142,7 @@ class ShawlConfig:
         Time in seconds, how long to wait BaseElement.element to be present.
         Default value is 5.
         """
-        return self._lazy_load_timeout
+        return _option('lazy_load_timeout', self._lazy_load_timeout)
 
     @lazy_load_timeout.setter
     def lazy_load_timeout(self, timeout: int):
@@ -94,7 +163,7 @@ class ShawlConfig:
         Possible values: RU, EN.
         Default value is EN.
         """
-        return self._step_localization
+        return _option('step_localization', self._step_localization)
 
     @step_localization.setter
     def step_localization(self, language: str):
@@ -129,7 +198,7 @@ class ShawlConfig:
         """
         return cast(
             Dict[str, str],
-            getattr(steps_descr, self._step_localization, steps_descr.EN))
+            getattr(steps_descr, self.step_localization, steps_descr.EN))
 
     @property
     def wait_timeout(self) -> int:
@@ -137,7 +206,7 @@ class ShawlConfig:
         Time in seconds, how long to wait during waiter methods.
         Default value is 5.
         """
-        return self._wait_timeout
+        return _option('wait_timeout', self._wait_timeout)
 
     @wait_timeout.setter
     def wait_timeout(self, timeout: int):
@@ -157,7 +226,7 @@ class ShawlConfig:
         Your project root path.
         Default value is current working dir.
         """
-        return self._project_root_path
+        return _option('project_root_path', self._project_root_path)
 
     @project_root_path.setter
     def project_root_path(self, path: str):
@@ -178,12 +247,13 @@ class ShawlConfig:
         Must be as in `sys.modules` keys.
         Default value is empty.
         """
-        if (self._elements_classes_module != 'default'
-                and self._elements_classes_module not in sys.modules):
+        module: str = _option('elements_classes_module',
+                              self._elements_classes_module)
+        if module != 'default' and module not in sys.modules:
             raise ShawlConfigError(
-                f'Unable to load "{self._elements_classes_module}" module. '
+                f'Unable to load "{module}" module. '
                 'Check if this module was already imported and loaded.')
-        return self._elements_classes_module
+        return module
 
     @elements_classes_module.setter
     def elements_classes_module(self, module: str):
@@ -201,7 +271,7 @@ class ShawlConfig:
         module first. Must be boolean.
         Default value is False.
         """
-        return self._use_package_init_first
+        return _option('use_package_init_first', self._use_package_init_first)
 
     @use_package_init_first.setter
     def use_package_init_first(self, value: Union[bool, str]):
@@ -219,7 +289,7 @@ class ShawlConfig:
         """
         Option to wrap captured selenium WebElement methods with allure steps.
         """
-        return self._use_allure
+        return _option('use_allure', self._use_allure)
 
     @use_allure.setter
     def use_allure(self, value: Union[bool, str]):
@@ -237,7 +307,7 @@ class ShawlConfig:
         Log level for check_server_error_after using across the framework.
         Default value is 'SEVERE'.
         """
-        return self._log_level
+        return _option('log_level', self._log_level)
 
     @log_level.setter
     def log_level(self, value: str):
@@ -253,7 +323,7 @@ class ShawlConfig:
         Log message for check_server_error_after using across the framework.
         Default value is '500 (Internal Server Error)'.
         """
-        return self._log_message
+        return _option('log_message', self._log_message)
 
     @log_message.setter
     def log_message(self, value: str):
@@ -264,6 +334,148 @@ class ShawlConfig:
         if isinstance(value, str):
             self._log_message = value
 
+    @property
+    def timing_stats_path(self) -> str:
+        """
+        Path to json file, where durations of waits by locator are stored
+        across runs. Stats are not collected if path is empty.
+        Default value is empty.
+        """
+        return _option('timing_stats_path', self._timing_stats_path)
+
+    @timing_stats_path.setter
+    def timing_stats_path(self, path: str):
+        """
+        Set path to json file with durations of waits.
+        """
+        if isinstance(path, str):
+            self._timing_stats_path = path
+
+    @property
+    def adaptive_timeouts(self) -> bool:
+        """
+        Option to wait for elements as long as they took to appear
+        in previous runs (see `timing_stats_path`) instead of
+        `wait_timeout` and `lazy_load_timeout`.
+        Default value is False.
+        """
+        return _option('adaptive_timeouts', self._adaptive_timeouts)
+
+    @adaptive_timeouts.setter
+    def adaptive_timeouts(self, value: Union[bool, str]):
+        """
+        Set if to use timeouts learned from previous runs.
+        """
+        if isinstance(value, bool):
+            self._adaptive_timeouts = value
+        else:
+            self._adaptive_timeouts = str(value).lower() == 'true'
+
+    @property
+    def adaptive_timeout_factor(self) -> float:
+        """
+        Multiplier of the 99th percentile of previous durations,
+        which gives adaptive timeout of an element.
+        Default value is 3.
+        """
+        return _option('adaptive_timeout_factor',
+                       self._adaptive_timeout_factor)
+
+    @adaptive_timeout_factor.setter
+    def adaptive_timeout_factor(self, factor: float):
+        """
+        Set multiplier of previous durations for adaptive timeouts.
+        """
+        if isinstance(factor, (int, float)) and factor > 0:
+            self._adaptive_timeout_factor = float(factor)
+        else:
+            raise ShawlConfigError(
+                'Unable to set adaptive_timeout_factor. '
+                f'Check if "{factor}" valid value.')
+
+    @property
+    def max_cached_handles(self) -> int:
+        """
+        How many WebElement handles elements and collections of one driver
+        may keep cached. Handles of least recently used elements are
+        released above this number and all of them are released on
+        navigation. Handles are not counted if value is 0.
+        Default value is 0.
+        """
+        return _option('max_cached_handles', self._max_cached_handles)
+
+    @max_cached_handles.setter
+    def max_cached_handles(self, number: int):
+        """
+        Set limit of cached WebElement handles of one driver.
+        """
+        if isinstance(number, int) and number >= 0:
+            self._max_cached_handles = number
+        else:
+            raise ShawlConfigError(
+                'Unable to set max_cached_handles. '
+                f'Check if "{number}" valid value.')
+
+    @property
+    def reload_yaml(self) -> bool:
+        """
+        Option to check on each creation of a page, if its yaml files
+        were modified, and load them again. Otherwise yaml files are
+        loaded once per process. Must be boolean.
+        Default value is False.
+        """
+        return _option('reload_yaml', self._reload_yaml)
+
+    @reload_yaml.setter
+    def reload_yaml(self, value: Union[bool, str]):
+        """
+        Set if to reload modified yaml files.
+        """
+        if isinstance(value, bool):
+            self._reload_yaml = value
+        else:
+            self._reload_yaml = str(value).lower() == 'true'
+
+    @contextmanager
+    def override(self, **options: Any) -> Iterator['ShawlConfig']:
+        """
+        Override `options` inside `with` block for current thread or
+        asyncio task only. Values are checked as by setters, nested blocks
+        override options of outer ones.
+
+        For example::
+
+
+            with SHAWL_CONFIG.override(wait_timeout=30, use_allure=False):
+                page.title_is('Slow page')
+
+        Asyncio tasks created inside the block and functions run with
+        `contextvars.copy_context().run` get the same overrides.
+        """
+        layer: Dict[str, Any] = dict(_OVERRIDES.get())
+        layer.update(self._checked(options))
+        token = _OVERRIDES.set(layer)
+        try:
+            yield self
+        finally:
+            _OVERRIDES.reset(token)
+
+    def _checked(self, options: Dict[str, Any]) -> Dict[str, Any]:
+        # Values are set to a copy of config, so that setters check
+        # and convert them as usual without changing process defaults
+        self._load()
+        probe: ShawlConfig = copy(self)
+        checked: Dict[str, Any] = dict()
+        for name, value in options.items():
+            option: Any = getattr(type(self), name, None)
+            if (not isinstance(option, property) or option.fset is None
+                    or f'_{name}' not in self.__dict__):
+                raise ShawlConfigError(f'Unable to override "{name}". '
+                                       'Check if it is an option name.')
+            option.fset(probe, value)
+            checked[name] = probe.__dict__[f'_{name}']
+        return checked
+
     def load_from_env(self):
         """
         Method will set for properties values from system environment,
@@ -289,6 +501,16 @@ class ShawlConfig:
             'SHAWL_LOG_MESSAGE_TO_FAIL_ON', '500 (Internal Server Error)')
         self.step_localization = environ.get(
             'SHAWL_STEP_LOCALIZATION', 'EN')
+        self.timing_stats_path = environ.get(
+            'SHAWL_TIMING_STATS_PATH', '')
+        self.adaptive_timeouts = environ.get(
+            'SHAWL_ADAPTIVE_TIMEOUTS', False)  # type: ignore
+        self.adaptive_timeout_factor = float(environ.get(
+            'SHAWL_ADAPTIVE_TIMEOUT_FACTOR', 3))
+        self.max_cached_handles = int(environ.get(
+            'SHAWL_MAX_CACHED_HANDLES', 0))
+        self.reload_yaml = environ.get(
+            'SHAWL_RELOAD_YAML', False)  # type: ignore
 
 
 def _get_yaml_files_path_dict(yaml_path: str) -> Dict[str, str]:
@@ -304,6 +526,6 @@ def _get_yaml_files_path_dict(yaml_path: str) -> Dict[str, str]:
     return result
 
 
-SHAWL_CONFIG = ShawlConfig()
+SHAWL_CONFIG = ShawlConfig(lazy=True)
 
 __all__ = ['SHAWL_CONFIG']
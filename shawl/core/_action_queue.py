@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+from collections import namedtuple
+from typing import Any, List, Optional
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    NoSuchFrameException,
+    TimeoutException
+)
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from ..utils._browser_context import switch_context
+from ..utils._waits import wait_for
+from ._base_element import BaseElement
+from ._locators import call_scoped_helper
+
+_ACTION = namedtuple('_ACTION', ['name', 'kind', 'element', 'value'])
+
+
+class ActionQueue:
+    """
+    Queue of fill and click actions with page elements.
+
+    Queued actions are executed on `flush` or on exit from `with` block.
+    Actions are executed in order they were added, all actions between
+    two elements with `keystrokes` option (and in the same frame) are sent
+    to a browser by one script call and run in one JavaScript turn.
+    If an element is missing, the rest of the batch is retried until
+    it appears or lazy load timeout expires. Values are set by script with
+    dispatching of `input` and `change` events, elements with `keystrokes`
+    option are filled with real keystrokes. Elements of components are
+    looked up under root element of their component, so `page` can be
+    a component too.
+
+    For example::
+
+
+        with page.actions() as queue:
+            queue.fill('login_input', 'user')
+            queue.fill('remember_checkbox', True)
+            queue.click('submit_button')
+    """
+
+    def __init__(self, page: Any):
+        self._page: Any = page
+        self._actions: List[_ACTION] = []
+
+    def __enter__(self) -> 'ActionQueue':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.flush()
+        else:
+            self._actions.clear()
+
+    def __len__(self) -> int:
+        return len(self._actions)
+
+    def _get_element(self, name: str) -> BaseElement:
+        element: Any = getattr(self._page, name, None)
+        if not isinstance(element, BaseElement):
+            raise AttributeError(f'{self._page.__class__.__name__} has no '
+                                 f'element "{name}"')
+        return element
+
+    def fill(self, name: str, value: Any) -> 'ActionQueue':
+        """
+        Add setting of `value` to the page element `name`.
+        Boolean values check or uncheck checkboxes and radio buttons,
+        other values are set as strings, None is not allowed.
+        """
+        if value is None:
+            raise TypeError(f'Unable to fill "{name}" with None')
+        if not isinstance(value, bool):
+            value = str(value)
+        self._actions.append(
+            _ACTION(name, 'fill', self._get_element(name), value))
+        return self
+
+    def click(self, name: str) -> 'ActionQueue':
+        """
+        Add click on the page element `name`.
+        """
+        self._actions.append(
+            _ACTION(name, 'click', self._get_element(name), None))
+        return self
+
+    def flush(self):
+        """
+        Execute all queued actions.
+        """
+        actions, self._actions = self._actions, []
+        batch: List[_ACTION] = []
+        for action in actions:
+            if batch and batch[0].element.frames != action.element.frames:
+                self._run_script(batch)
+                batch = []
+            if not action.element.keystrokes:
+                batch.append(action)
+                continue
+            self._run_script(batch)
+            batch = []
+            if action.kind == 'fill':
+                action.element.type_text(str(action.value))
+            else:
+                action.element.element.click()
+        self._run_script(batch)
+
+    def _run_script(self, batch: List[_ACTION]):
+        """
+        Execute `batch` of actions by one script call, i.e. in one
+        JavaScript turn: element rendered asynchronously after a click
+        of the same batch is not there yet. If an element was not found,
+        script is called again with the rest of the batch starting from
+        this element until it appears or lazy load timeout of elements
+        of the batch expires.
+        """
+        if not batch:
+            return
+        driver: WebDriver = self._page.driver
+        remaining: List[_ACTION] = batch
+
+        def run(_: WebDriver) -> bool:
+            nonlocal remaining
+            try:
+                switch_context(driver, remaining[0].element.frames)
+            except (NoSuchElementException, NoSuchFrameException):
+                return False
+            failed: Optional[int] = call_scoped_helper(
+                driver,
+                'runActions',
+                [(action.element.scope,
+                  [action.kind,
+                   [list(selector) for selector in action.element.selectors],
+                   action.value])
+                 for action in remaining])
+            if failed is None or failed < 0:
+                return True
+            remaining = remaining[failed:]
+            return False
+
+        try:
+            wait_for(driver,
+                     max(action.element.lazy_timeout for action in batch),
+                     run)
+        except TimeoutException as t_exc:
+            action: _ACTION = remaining[0]
+            by, value = action.element.selector
+            raise NoSuchElementException(
+                f'Unable to {action.kind} "{action.name}": '
+                'Unable to locate element: '
+                f'{{"method":"{by}","selector":"{value}"}}') from t_exc
+
+
+__all__ = ['ActionQueue']
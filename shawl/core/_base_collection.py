@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from typing import Iterator, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional
 
 from selenium.common.exceptions import (
     StaleElementReferenceException,
@@ -12,14 +12,14 @@ from selenium.webdriver.support.expected_conditions import (
     visibility_of_all_elements_located,
     visibility_of_any_elements_located
 )
-from selenium.webdriver.support.wait import WebDriverWait
 
-from ..config import SHAWL_CONFIG as CONFIG
 from ..exceptions import NoSuchElementsException
-from ..utils._waits import wait_until
+from ..utils._handles import forget_handles, retain_handles
+from ._base_element import BaseElement
+from ._lookup import LookupMixin
 
 
-class BaseCollection:
+class BaseCollection(LookupMixin):
     """
     This class is base for all PageElement collections.
 
@@ -41,24 +41,38 @@ class BaseCollection:
         first_element = base_collection[0]
 
         assert len(base_collection) == 50
+
+    If collection is located inside of iframe, set `frame` to a locator of
+    this iframe (or list of locators for nested iframes).
+
+    `alternatives`, `timeout`, `poll`, `lazy_timeout` and `root` are
+    the same as of BaseElement. Cached WebElements and instances without
+    `__dict__` are the same as of BaseElement too.
     """
 
+    _FIND_ALL = True
+    _presence = staticmethod(presence_of_all_elements_located)
+
+    __slots__ = ('_collection',)
+
     def __init__(self,
                  driver: WebDriver,
                  repr_name: Optional[str] = None,
+                 frame: Any = None,
+                 timeout: Optional[float] = None,
+                 poll: Optional[float] = None,
+                 lazy_timeout: Optional[float] = None,
+                 alternatives: Optional[List[Dict[str, str]]] = None,
+                 root: Optional[BaseElement] = None,
                  **locators):
-        self._driver: WebDriver = driver
-        self._selector: Tuple[str, str] = list(locators.items())[0]
+        # pylint: disable=too-many-arguments
+        super().__init__(driver, repr_name, frame, timeout, poll,
+                         lazy_timeout, alternatives, root, locators)
         self._collection: List[WebElement] = []
-        self._repr_name: str = repr_name or (f'{self.__class__.__name__}: '
-                                             f'{self._selector}')
 
     def __str__(self) -> str:
         return f'Selector: {self._selector}, Collection: {self._collection}'
 
-    def __repr__(self) -> str:
-        return self._repr_name
-
     def __len__(self) -> int:
         return len(self.collection)
 
@@ -73,101 +87,68 @@ class BaseCollection:
 
     def _load(self):
         try:
-            self._collection = WebDriverWait(
-                self._driver,
-                CONFIG.lazy_load_timeout
-                ).until(presence_of_all_elements_located(self._selector))
+            self._collection = self._wait_for_presence()
         except TimeoutException as t_exc:
             raise NoSuchElementsException(
                 'no such elements: '
                 'Unable to locate elements: '
                 '{"method":"%s","selector":"%s"}' % self._selector) from t_exc
 
-    def _return_locator(self, selector_type: str) -> str:
-        if self._selector[0] == selector_type:
-            return self._selector[1]
-        return ''
-
-    @property
-    def selector(self) -> Tuple[str, str]:
-        return self._selector
-
-    @property
-    def id(self) -> str:
-        # pylint: disable=invalid-name
-        return self._return_locator('id')
-
-    @property
-    def xpath(self) -> str:
-        return self._return_locator('xpath')
-
-    @property
-    def link_text(self) -> str:
-        return self._return_locator('link text')
-
-    @property
-    def partial_link_text(self) -> str:
-        return self._return_locator('partial link text')
-
-    @property
-    def name(self) -> str:
-        return self._return_locator('name')
-
-    @property
-    def tag_name(self) -> str:
-        return self._return_locator('tag name')
-
-    @property
-    def class_name(self) -> str:
-        return self._return_locator('class name')
-
-    @property
-    def css_selector(self) -> str:
-        return self._return_locator('css selector')
-
     @property
     def collection(self) -> List[WebElement]:
-        if not self._collection or not isinstance(self._collection, list):
+        if (not self._collection or not isinstance(self._collection, list)
+                or not self._switch_frames()):
             self._load()
         try:
             for e in self._collection:
                 isinstance(e.location, dict)
         except StaleElementReferenceException:
             self._load()
+        retain_handles(self._driver, self, len(self._collection))
         return self._collection
 
-    def any_is_visible(self, wait: int = CONFIG.wait_timeout) -> bool:
+    def release(self):
+        """
+        Drop cached WebElements, they are looked up again on next access.
+        """
+        self._collection = []
+        forget_handles(self._driver, self)
+
+    def any_is_visible(self, wait: Optional[float] = None) -> bool:
         """
         Check that at least one element from collection is visible
         on a web page during 'wait' seconds.
         Returns True if at least one element from collection is visible,
         False otherwise
         """
-        return wait_until(self._driver,
-                          wait,
-                          visibility_of_any_elements_located(self._selector))
+        return self._wait_until(
+            wait,
+            self._located(visibility_of_any_elements_located),
+            adaptive=True)
 
-    def all_are_visible(self, wait: int = CONFIG.wait_timeout) -> bool:
+    def all_are_visible(self, wait: Optional[float] = None) -> bool:
         """
         Check that all elements from collection are present on the DOM of
         a page and visible during 'wait' seconds.
         Returns True if all elements from collection are visible,
         False otherwise
         """
-        return wait_until(self._driver,
-                          wait,
-                          visibility_of_all_elements_located(self._selector))
+        return self._wait_until(
+            wait,
+            self._located(visibility_of_all_elements_located),
+            adaptive=True)
 
-    def any_is_present(self, wait: int = CONFIG.wait_timeout) -> bool:
+    def any_is_present(self, wait: Optional[float] = None) -> bool:
         """
         Check that at least one element from collection is present
         on a web page during 'wait' seconds.
         Returns True if at least one element from collection is present,
         False otherwise
         """
-        return wait_until(self._driver,
-                          wait,
-                          presence_of_all_elements_located(self._selector))
+        return self._wait_until(
+            wait,
+            self._located(presence_of_all_elements_located),
+            adaptive=True)
 
 
 __all__ = ['BaseCollection']
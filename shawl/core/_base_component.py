@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+from functools import partial
+from types import ModuleType
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from ..exceptions import InvalidComponentException
+from ._base_collection import BaseCollection
+from ._base_element import BaseElement
+from ._page_spec import (
+    COLLECTION_OPTIONS,
+    ELEMENT_OPTIONS,
+    ComponentSpec,
+    create_elements,
+    get_element_class,
+    get_element_modules,
+    load_component_spec,
+    pop_options
+)
+
+_ROOT_OPTIONS = ('alternatives', 'timeout', 'poll', 'lazy_timeout')
+
+
+class BaseComponent:
+    """
+    This class is base for all components of pages.
+
+    Component is a part of pages (header, footer, table row), elements
+    of which are looked up under its root element instead of the whole
+    document. Root WebElement is found once and is looked up again only
+    when it becomes stale.
+
+    Component is described in own ComponentName.yaml file with `root`
+    locator and elements, collections and nested components in the same
+    format as of pages. Locators of elements are relative to root element,
+    so XPath locators must start with `.`:
+
+    ::
+
+        component_repr: Site header
+        root:
+          css selector: header
+        logo:
+          img:
+            css selector: img.logo
+        menu:
+          a:
+            xpath: .//nav//a
+
+    Components are embedded to pages (and other components) by
+    `components` section with name of component yaml file and optional
+    `root` (to override root locator of component), `repr` and `frame`:
+
+    ::
+
+        components:
+          header:
+            component: Header
+          footer_menu:
+            component: Menu
+            root:
+              css selector: footer nav
+
+    Attribute of page with component is named as the key of `components`
+    section, e.g. `page.header.logo_img`. Class of component is looked up
+    by the name of component yaml file in the same modules as classes of
+    elements, `BaseComponent` is used if there is no such class.
+
+    Description of component is loaded once and is shared by all pages,
+    which embed it. Elements of a component are in the frame of the
+    component.
+    """
+
+    def __init__(self,
+                 driver: WebDriver,
+                 spec: ComponentSpec,
+                 root: Optional[Dict[str, Any]] = None,
+                 repr_name: Optional[str] = None,
+                 frame: Any = None,
+                 element_defaults: Optional[Dict[str, Any]] = None,
+                 parent: Optional[BaseElement] = None):
+        # pylint: disable=too-many-arguments,too-many-locals
+        self._driver: WebDriver = driver
+        self._spec: ComponentSpec = spec
+        self._repr_name: str = repr_name or spec.repr_name
+        self._element_defaults: Dict[str, Any] = dict(element_defaults
+                                                      or dict())
+        self._element_defaults.update(spec.element_defaults)
+
+        root_selectors: Dict[str, Any] = dict(root or spec.root)
+        if not root_selectors:
+            raise InvalidComponentException(
+                f'Component "{spec.name}" has no root locator')
+        self._root: BaseElement = BaseElement(
+            driver,
+            repr_name=f'{self._repr_name} root',
+            frame=frame,
+            root=parent,
+            **pop_options(root_selectors,
+                          _ROOT_OPTIONS,
+                          self._element_defaults),
+            **root_selectors)
+
+        base_module, init_module = get_element_modules(self.__class__)
+        for mask, default, options, part in (
+                ('{}Element', BaseElement, ELEMENT_OPTIONS, spec.elements),
+                ('{}Collection', BaseCollection, COLLECTION_OPTIONS,
+                 spec.collections)):
+            for name, element in create_elements(
+                    driver,
+                    part,
+                    partial(get_element_class,
+                            mask=mask,
+                            default=default,
+                            base_module=base_module,
+                            init_module=init_module),
+                    options,
+                    self._element_defaults,
+                    frame=frame,
+                    root=self._root):
+                setattr(self, name, element)
+        for name, component in create_components(driver,
+                                                 spec.components,
+                                                 base_module,
+                                                 init_module,
+                                                 self._element_defaults,
+                                                 frame=frame,
+                                                 parent=self._root):
+            setattr(self, name, component)
+
+    def __str__(self) -> str:
+        return (f'{self.__class__.__name__} elements: \n'
+                + '\n'.join((f'- {k}' for k, v
+                             in self.__dict__.items()
+                             if not k.startswith('_')
+                             and v is not None)))
+
+    def __repr__(self) -> str:
+        return self._repr_name
+
+    @property
+    def driver(self) -> WebDriver:
+        return self._driver
+
+    @property
+    def root(self) -> BaseElement:
+        return self._root
+
+    @property
+    def spec(self) -> ComponentSpec:
+        return self._spec
+
+    def is_present(self, wait: Optional[float] = None) -> bool:
+        """
+        Check that root element of component is present
+        during 'wait' seconds.
+        """
+        return self._root.is_present(wait=wait)
+
+    def is_visible(self, wait: Optional[float] = None) -> bool:
+        """
+        Check that root element of component is visible
+        during 'wait' seconds.
+        """
+        return self._root.is_visible(wait=wait)
+
+
+def create_components(driver: WebDriver,
+                      descriptions: Dict[str, Dict[str, Any]],
+                      base_module: ModuleType,
+                      init_module: Optional[ModuleType],
+                      element_defaults: Dict[str, Any],
+                      frame: Any = None,
+                      parent: Optional[BaseElement] = None
+                      ) -> Iterator[Tuple[str, BaseComponent]]:
+    """
+    Create components described by `components` section of yaml file
+    and yield them with names of attributes. Nested components are
+    created with `frame` and root element of `parent` component.
+    """
+    # pylint:disable=too-many-arguments
+    for name, description in descriptions.items():
+        options: Dict[str, Any] = dict(description)
+        if 'component' not in options:
+            raise InvalidComponentException(
+                f'Component "{name}" has no "component" key with '
+                'name of component yaml file')
+        spec: ComponentSpec = load_component_spec(options.pop('component'))
+        # Class of component is named as its yaml file
+        class_init: type = get_element_class('',
+                                             spec.name,
+                                             BaseComponent,
+                                             base_module,
+                                             init_module)
+        yield name, class_init(driver,
+                               spec,
+                               root=options.get('root'),
+                               repr_name=options.get('repr'),
+                               frame=frame or options.get('frame'),
+                               element_defaults=element_defaults,
+                               parent=parent)
+
+
+__all__ = ['BaseComponent', 'create_components']
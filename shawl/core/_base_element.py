@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
-# pylint: disable=too-many-public-methods
+# pylint: disable=too-many-public-methods,too-many-instance-attributes
 from time import sleep
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, List, Optional
 
-from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException
+)
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
@@ -18,14 +21,19 @@ from selenium.webdriver.support.expected_conditions import (
     text_to_be_present_in_element_value,
     visibility_of_element_located
 )
-from selenium.webdriver.support.wait import WebDriverWait
 
 from ..config import SHAWL_CONFIG as CONFIG
 from ..utils._allure_utils import callable_with_allure
-from ..utils._waits import wait_until
+from ..utils._browser_context import switch_context
+from ..utils._handles import forget_handles, retain_handles
+from ..utils._js_runtime import call_helper
+from ._lookup import LookupMixin
+
+
+_TYPE_CHUNK_SIZE = 256
 
 
-class BaseElement:
+class BaseElement(LookupMixin):
     """
     This class is base for all PageElement.
 
@@ -63,20 +71,59 @@ class BaseElement:
         text_element = TextElement(driver, **{'css selector': 'div'})
         text_element.element.click() # WebElement instance will be clicked
         text_element.click() # 'Nope' will be printed and driver destroyed
+
+    If element must be filled with real keystrokes instead of setting
+    its value by script (see `BasePage.fill`), set `keystrokes` to True.
+
+    If element is located inside of iframe, set `frame` to a locator of
+    this iframe (or list of locators for nested iframes), driver will be
+    switched to this frame before element lookup.
+
+    All `locators` and `alternatives` (list of locators) are selectors of
+    element, which are tried in order. The first one, which finds element,
+    is used by all waits of element.
+
+    `timeout` is default `wait` of element checks, `lazy_timeout` is how
+    long to wait for element on lazy load and `poll` is interval between
+    polls of both, global settings are used if they are not set.
+
+    If `root` element is set, element is looked up under root element
+    instead of the whole document (see `BaseComponent`).
+
+    If `SHAWL_MAX_CACHED_HANDLES` is set, cached WebElement is released
+    when element is not used for long or after navigation (see
+    `HandleRegistry`).
+
+    Instances have no `__dict__`: equal selectors of elements are shared
+    between instances of pages and default repr is built on demand.
+    Subclasses without `__slots__` have `__dict__` as usual.
     """
 
+    __slots__ = ('_element', '_keystrokes')
+
     def __init__(self,
                  driver: WebDriver,
                  repr_name: Optional[str] = None,
+                 keystrokes: bool = False,
+                 frame: Any = None,
+                 timeout: Optional[float] = None,
+                 poll: Optional[float] = None,
+                 lazy_timeout: Optional[float] = None,
+                 alternatives: Optional[List[Dict[str, str]]] = None,
+                 root: Optional['BaseElement'] = None,
                  **locators):
-        self._driver: WebDriver = driver
-        self._selector: Tuple[str, str] = list(locators.items())[0]
+        # pylint: disable=too-many-arguments
+        super().__init__(driver, repr_name, frame, timeout, poll,
+                         lazy_timeout, alternatives, root, locators)
         self._element: WebElement = None
-        self._repr_name: str = repr_name or (f'{self.__class__.__name__}: '
-                                             f'{self._selector}')
+        self._keystrokes: bool = keystrokes
 
     def __getattr__(self, item: str) -> Any:
         # This magic method will be invoked if current class has no item.
+        # Special attributes (e.g. `__dict__` of slotted instance or
+        # `__deepcopy__`) are not looked up in WebElement.
+        if item.startswith('__'):
+            raise AttributeError(item)
 
         # Try to get item from Selenium object
         attr = getattr(self.element, item)
@@ -84,34 +131,26 @@ class BaseElement:
         # wrap it into Allure annotated step function
         # and return it. Otherwise just return Selenium WebElement item
         if callable(attr) and CONFIG.use_allure:
-            return callable_with_allure(item, self._repr_name, attr)
+            return callable_with_allure(item, repr(self), attr)
 
         return attr
 
     def __str__(self) -> str:
         return f'Selector: {self._selector}, Element: {self._element}'
 
-    def __repr__(self) -> str:
-        return self._repr_name
-
     def _load(self):
-        self._element = WebDriverWait(
-            self._driver,
-            CONFIG.lazy_load_timeout
-            ).until(presence_of_element_located(self._selector))
-
-    def _return_locator(self, selector_type: str) -> str:
-        if self._selector[0] == selector_type:
-            return self._selector[1]
-        return ''
+        self._element = self._wait_for_presence()
 
     @property
-    def selector(self) -> Tuple[str, str]:
-        return self._selector
+    def keystrokes(self) -> bool:
+        return self._keystrokes
 
     @property
     def element(self) -> WebElement:
-        if self._element is None or not isinstance(self._element, WebElement):
+        # Lazy load switches to frames on each poll,
+        # so that frame, which is not rendered yet, is waited for
+        if (not isinstance(self._element, WebElement)
+                or not self._switch_frames()):
             self._load()
         try:
             # We have one bad place on UI, where StaleElementReferenceException
@@ -122,145 +161,158 @@ class BaseElement:
             isinstance(self._element.location, dict)
         except StaleElementReferenceException:
             self._load()
+        retain_handles(self._driver, self, 1)
         return self._element
 
-    @property
-    def id(self) -> str:
-        # pylint: disable=invalid-name
-        return self._return_locator('id')
-
-    @property
-    def xpath(self) -> str:
-        return self._return_locator('xpath')
-
-    @property
-    def link_text(self) -> str:
-        return self._return_locator('link text')
-
-    @property
-    def partial_link_text(self) -> str:
-        return self._return_locator('partial link text')
-
-    @property
-    def name(self) -> str:
-        return self._return_locator('name')
-
-    @property
-    def tag_name(self) -> str:
-        return self._return_locator('tag name')
-
-    @property
-    def class_name(self) -> str:
-        return self._return_locator('class name')
+    def cached_element(self, reload: bool = False) -> WebElement:
+        """
+        Return WebElement of the last lookup without staleness check.
+        Element is looked up without waiting, if it was not found yet
+        or `reload` is set.
+        """
+        if reload or not isinstance(self._element, WebElement):
+            switch_context(self._driver, self._frames)
+            context: Any = self._context()
+            if self._resolved:
+                self._element = context.find_element(*self._selector)
+            else:
+                self._element = self._find_first(context)
+            if not isinstance(self._element, WebElement):
+                raise NoSuchElementException(
+                    'Unable to locate element: '
+                    '{"method":"%s","selector":"%s"}' % self._selector)
+        retain_handles(self._driver, self, 1)
+        return self._element
 
-    @property
-    def css_selector(self) -> str:
-        return self._return_locator('css selector')
+    def release(self):
+        """
+        Drop cached WebElement, it is looked up again on next access.
+        """
+        self._element = None
+        forget_handles(self._driver, self)
 
-    def is_present(self, wait: int = CONFIG.wait_timeout) -> bool:
+    def is_present(self, wait: Optional[float] = None) -> bool:
         """
         Check that element is present during 'wait' seconds.
         Returns True if element is present, False otherwise
         """
-        return wait_until(self._driver,
-                          wait,
-                          presence_of_element_located(self._selector))
+        return self._wait_until(
+            wait,
+            self._located(presence_of_element_located),
+            adaptive=True)
 
-    def is_invisible(self, wait: int = CONFIG.wait_timeout) -> bool:
+    def is_invisible(self, wait: Optional[float] = None) -> bool:
         """
         Check that element is invisible during 'wait' seconds.
         Returns True if element is invisible, False otherwise
         """
-        return wait_until(self._driver,
-                          wait,
-                          invisibility_of_element_located(self._selector))
+        return self._wait_until(
+            wait,
+            self._located(invisibility_of_element_located, missing=True))
 
-    def is_visible(self, wait: int = CONFIG.wait_timeout) -> bool:
+    def is_visible(self, wait: Optional[float] = None) -> bool:
         """
         Check that element is visible during 'wait' seconds.
         Returns True if element is visible, False otherwise
         """
-        return wait_until(self._driver,
-                          wait,
-                          visibility_of_element_located(self._selector))
+        return self._wait_until(
+            wait,
+            self._located(visibility_of_element_located),
+            adaptive=True)
 
-    def is_clickable(self, wait: int = CONFIG.wait_timeout) -> bool:
+    def is_clickable(self, wait: Optional[float] = None) -> bool:
         """
         Check that element is clickable during 'wait' seconds.
         Returns True if element is clickable, False otherwise
         """
-        return wait_until(self._driver,
-                          wait,
-                          element_to_be_clickable(self._selector))
+        return self._wait_until(
+            wait,
+            self._located(element_to_be_clickable),
+            adaptive=True)
 
-    def is_stale(self, wait: int = CONFIG.wait_timeout) -> bool:
+    def is_stale(self, wait: Optional[float] = None) -> bool:
         """
         Check that element is no longer attached to the DOM
         during 'wait' seconds.
         Returns True if element is stale, False otherwise
         """
-        return wait_until(self._driver,
-                          wait,
-                          staleness_of(self.element))
+        return self._wait_until(
+            wait,
+            staleness_of(self.element))
 
-    def is_selected(self, wait: int = CONFIG.wait_timeout) -> bool:
+    def is_selected(self, wait: Optional[float] = None) -> bool:
         """
         Check that element is selected during 'wait' seconds.
         Returns True if element is selected, False otherwise
         """
-        return wait_until(self._driver,
-                          wait,
-                          element_located_to_be_selected(self._selector))
+        return self._wait_until(
+            wait,
+            self._located(element_located_to_be_selected))
 
     def is_in_selection_state(self,
                               state: bool,
-                              wait: int = CONFIG.wait_timeout) -> bool:
+                              wait: Optional[float] = None) -> bool:
         """
         Check that element state is selected or not during 'wait' seconds.
         Returns True if selected state is `is_selected`, False otherwise
         """
-        return wait_until(self._driver,
-                          wait,
-                          element_located_selection_state_to_be(self._selector,
-                                                                state))
+        return self._wait_until(
+            wait,
+            self._located(element_located_selection_state_to_be, state))
 
     def has_text_in_value(self,
                           text: str,
-                          wait: int = CONFIG.wait_timeout) -> bool:
+                          wait: Optional[float] = None) -> bool:
         """
         Check that given text is present in the element's 'value' attribute
         during 'wait' seconds.
         Returns True if text is present in value, false otherwise.
         """
-        return wait_until(self._driver,
-                          wait,
-                          text_to_be_present_in_element_value(self._selector,
-                                                              text))
+        return self._wait_until(
+            wait,
+            self._located(text_to_be_present_in_element_value, text))
 
-    def has_text(self, text: str, wait: int = CONFIG.wait_timeout) -> bool:
+    def has_text(self, text: str, wait: Optional[float] = None) -> bool:
         """
         Check that given text is present in the specified element
         during 'wait' seconds.
         Returns True if text is present, false otherwise.
         """
-        return wait_until(self._driver,
-                          wait,
-                          text_to_be_present_in_element(self._selector, text))
+        return self._wait_until(
+            wait,
+            self._located(text_to_be_present_in_element, text))
 
-    def blinked(self, wait: int = CONFIG.lazy_load_timeout) -> bool:
+    def blinked(self, wait: Optional[float] = None) -> bool:
         """
         Check that element fist was present and than disappeared
-        during 'wait' seconds.
+        during 'wait' seconds (`SHAWL_LAZY_LOAD_TIMEOUT` by default).
         Returns True if element blinked, false otherwise.
         """
+        if wait is None:
+            wait = self._lazy_timeout or CONFIG.lazy_load_timeout
         sleep(0.5)
         return self.is_present(wait=wait) and self.is_invisible(wait=wait)
 
     def scroll_to(self) -> WebElement:
-        location = self.element.location
-        self._driver.execute_script(f'window.scrollTo({location.get("x")},'
-                                    f'{location.get("y") - 150})')
-        return self.element
+        element: WebElement = self.element
+        call_helper(self._driver, 'scrollTo', element, 150)
+        return element
+
+    def type_text(self, text: str, chunk_size: int = _TYPE_CHUNK_SIZE):
+        """
+        Clear element and type `text` with real keystrokes.
+        Long text is sent by chunks of `chunk_size` symbols, so each chunk
+        costs one WebDriver command and one allure step.
+        """
+        element: WebElement = self.element
+        send_keys = element.send_keys
+        if CONFIG.use_allure:
+            send_keys = callable_with_allure('send_keys',
+                                             repr(self),
+                                             send_keys)
+        element.clear()
+        for start in range(0, len(text), chunk_size):
+            send_keys(text[start:start + chunk_size])
 
     def clear_via_backspace(self):
         self.element.send_keys(Keys.CONTROL, Keys.BACKSPACE)
@@ -1,13 +1,19 @@
 # -*- coding: utf-8 -*-
-import sys
+# pylint: disable=too-many-public-methods
 from collections import namedtuple
-from inspect import getfile
-from os.path import exists, isfile, join
 from time import sleep
 from types import ModuleType
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
 
-import yaml
 from selenium.webdriver.common.alert import Alert
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.expected_conditions import (
@@ -23,15 +29,39 @@ from selenium.webdriver.support.expected_conditions import (
     url_to_be
 )
 
-from ..config import SHAWL_CONFIG as CONFIG
 from ..decorators import check_server_error_after
-from ..exceptions import InitNotFoundException, NoneValuesInYamlException
+from ..exceptions import InvalidFieldException
+from ..utils._browser_context import (
+    Frames,
+    get_browser_context,
+    parse_frames,
+    switch_context
+)
+from ..utils._handles import register_page
+from ..utils._read_cache import read_step
 from ..utils._waits import wait_until
+from ._action_queue import ActionQueue
 from ._base_collection import BaseCollection
 from ._base_element import BaseElement
+from ._base_component import create_components
+from ._locators import call_scoped_helper
+from ._page_spec import (
+    COLLECTION_OPTIONS,
+    ELEMENT_OPTIONS,
+    PageSpec,
+    create_elements,
+    get_element_class,
+    get_element_modules,
+    load_page_spec
+)
+from ._templates import create_template
 
 _INVISIBLE = namedtuple('_INVISIBLE', ['all_invisible', 'not_invisible'])
 _PRESENT = namedtuple('_PRESENT', ['all_present', 'not_present'])
+_FIELD = namedtuple('_FIELD', ['request', 'converter', 'frames', 'scope'])
+
+_FIELD_READS = ('text', 'value', 'checked', 'selected', 'attribute', 'count')
+_RECORDS: Dict[Tuple[str, Tuple[str, ...]], type] = dict()
 
 ShawlElems = Union[BaseElement, BaseCollection]
 
@@ -42,57 +72,46 @@ def _get_list(item: Union[List[str], str]) -> List[str]:
     return [item] if isinstance(item, str) else list()
 
 
-def _load_page(file: str, path: str) -> Dict[str, str]:
-    """
-    Load yaml file as dict
-    """
-    # pylint: disable=consider-using-with
-    file_path: str = join(path, file)
-    if not exists(file_path) or not isfile(file_path):
-        return dict()
-    return yaml.full_load(open(file_path, encoding='utf-8')) or dict()
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ('true', '1', 'yes', 'on')
+    return bool(value)
 
 
-def _check_not_none_values(source: Dict[str, str], yaml_file: str):
-    if not all(source.values()):
-        raise NoneValuesInYamlException(
-            f'There is None value in {yaml_file} file. '
-            'Check that all keys have not None values')
-    for v in source.values():
-        if isinstance(v, dict):
-            _check_not_none_values(v, yaml_file)
+def _to_int(value: Any) -> int:
+    return int(str(value).strip())
 
 
-def _merge_page_dicts(source: Dict[str, Dict[str, Any]],
-                      new: Dict[str, Dict[str, Any]]):
-    """
-    Merge two yaml dicts, so that previously loaded element_name_html_element
-    will not be overwritten
-    """
-    for el_name, elements in new.items():
-        if el_name not in source:
-            source[el_name] = elements
-        else:
-            for html_elem, selectors in elements.items():
-                if html_elem not in source[el_name]:
-                    source[el_name][html_elem] = selectors
+def _to_float(value: Any) -> float:
+    return float(str(value).strip())
 
 
-def _get_package_init(cur_module: str) -> ModuleType:
+_FIELD_TYPES: Dict[str, Callable[[Any], Any]] = {
+    'str': str,
+    'int': _to_int,
+    'float': _to_float,
+    'bool': _to_bool
+    }
 
-    def is_init(module_: Optional[ModuleType]) -> bool:
-        return module_ is not None and getfile(module_).endswith('__init__.py')
 
-    module_ = sys.modules.get(cur_module, None)
+def _convert_value(value: Any, converter: Callable[[Any], Any]) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return [_convert_value(v, converter) for v in value]
+    return converter(value)
 
-    if not is_init(module_):
-        try:
-            return sys.modules['.'.join(cur_module.split('.')[:-1])]
-        except KeyError as kerr:
-            raise InitNotFoundException('Unable to find __init__.py '
-                                        f'for module {cur_module}') from kerr
 
-    return cast(ModuleType, module_)
+def _get_record_cls(page_name: str, names: Tuple[str, ...]) -> type:
+    """
+    Return NamedTuple class for extracted fields, created once per
+    page class and set of names.
+    """
+    key = (page_name, names)
+    if key not in _RECORDS:
+        _RECORDS[key] = namedtuple(  # type: ignore
+            f'{page_name}Fields', names)
+    return _RECORDS[key]
 
 
 class BasePage:
@@ -132,58 +151,159 @@ class BasePage:
     (if there is no module - in module with this class) module for a class
     with name `HtmltagElement`. If class with this name not found,
     `BaseElement` will be used instead.
+
+    Values of several elements can be read at once with `extract` method.
+    Section `fields` describes what to read and how to convert it:
+
+    ::
+
+        fields:
+          field_name:
+            element: element_first_path_name_htmltag
+            read: value
+            type: int
+
+
+    Possible `read` values: text (default), value, checked, selected,
+    attribute (name of attribute is set by `attribute` key) and count.
+    Possible `type` values: str (default), int, float, bool.
+
+    Elements, which must be filled by `fill` method with real keystrokes,
+    are marked with `keystrokes: true` option next to selector.
+
+    Elements and collections inside of iframes are marked with `frame`
+    option, which is a locator of iframe or list of locators for nested
+    iframes:
+
+    ::
+
+        card:
+          input:
+            css selector: input.card
+            frame:
+              css selector: iframe#pay
+
+    Element may have several selectors, they are tried in a browser at
+    once in declared order and the first one, which finds element, is
+    used. Selectors of the same strategy are listed in `alternatives`:
+
+    ::
+
+        search:
+          input:
+            id: search
+            name: q
+            alternatives:
+              - css selector: form input[type=search]
+              - css selector: header input
+
+    If `SHAWL_TIMING_STATS_PATH` is set, selectors, which found element
+    most often in previous runs, are tried first (see
+    `shawl.utils.TimingStats.fallbacks` for elements, which are found
+    not by the first declared selector).
+
+    Elements and collections may have own `timeout` of waits, `poll`
+    interval of waits and `lazy_timeout` of lazy load in seconds, instead
+    of `SHAWL_WAIT_TIMEOUT` and `SHAWL_LAZY_LOAD_TIMEOUT`. Defaults for
+    all elements of a page are set in `element_defaults` section:
+
+    ::
+
+        element_defaults:
+          timeout: 1
+          poll: 0.1
+
+        report:
+          table:
+            id: report
+            timeout: 30
+            lazy_timeout: 30
+
+    Elements with parametrized locators are described in `templates`
+    section, locators are formatted with arguments of the call as
+    `str.format` does (see `ElementTemplate`). Elements are created by
+    the call and are kept in LRU cache of `cache_size` (32 by default)
+    elements by arguments. Set `collection: true` for collections and
+    `tag` for lookup of element class by html tag:
+
+    ::
+
+        templates:
+          row:
+            xpath: //tr[@data-id='{id}']
+            tag: tr
+            cache_size: 100
+
+    ::
+
+        page.row(id=42).click()
+
+    Yaml files of all bases of page class are loaded in order of method
+    resolution, so mixins may have own yaml files. Yaml file may include
+    other yaml files (names without extension), own elements and options
+    of the file are not overwritten by included ones:
+
+    ::
+
+        include:
+          - SearchForm
+          - Footer
+
+    Each yaml file is loaded once per process and reused by all pages,
+    which use it, until it is modified.
+
+    Parts, which repeat across pages, are described once as components
+    and embedded to pages by `components` section, elements of component
+    are looked up under its root element (see `BaseComponent`):
+
+    ::
+
+        components:
+          header:
+            component: Header
     """
 
     def __init__(self, driver: WebDriver):
         self._driver: WebDriver = driver
-        self._page_strings: Dict[str, str] = dict()
-        self._repr_name: str = self.__class__.__name__
-        self._url_pattern: str = ''
-
-        base_module: ModuleType = sys.modules.get(
-            CONFIG.elements_classes_module,
-            sys.modules[__name__])
-        init_module: ModuleType = _get_package_init(self.__class__.__module__)
-        all_elements: Dict[str, Dict[str, Any]] = dict()
-        collections: Dict[str, Dict[str, Any]] = dict()
-        buf_cls: type = self.__class__
-
-        while buf_cls.__name__ != 'object':
-            yaml_name: str = f'{buf_cls.__name__}.yaml'
-            yaml_path: str = CONFIG.yaml_map.get(yaml_name,
-                                                 CONFIG.source_yaml_path)
-            cur_dict: Dict[str, Any] = _load_page(yaml_name, yaml_path)
-
-            if buf_cls.__name__ == self.__class__.__name__:
-                self._repr_name = cur_dict.pop('page_repr', self._repr_name)
-                self._url_pattern = cur_dict.pop('url_pattern', '')
-
-            _check_not_none_values(cur_dict, yaml_name)
-
-            self._page_strings.update(
-                cast(Dict[str, str], cur_dict.pop('page_strings', dict())))
-            _merge_page_dicts(
-                collections,
-                cast(Dict[str, Any], cur_dict.pop('collections', dict())))
-            _merge_page_dicts(
-                all_elements,
-                cur_dict)
-
-            buf_cls, = buf_cls.__bases__
-
-        for not_elem_key in ('page_repr', 'url_pattern', 'collections'):
-            all_elements.pop(not_elem_key, None)
-
-        self._init_elements(all_elements,
+        spec: PageSpec = load_page_spec(self.__class__)
+        # Description of page is shared by all instances, so each page
+        # has own copies of dicts, which may be changed
+        self._page_strings: Dict[str, str] = dict(spec.page_strings)
+        self._repr_name: str = spec.repr_name
+        self._url_pattern: str = spec.url_pattern
+        self._element_defaults: Dict[str, Any] = dict(spec.element_defaults)
+        self._fields: Dict[str, Dict[str, str]] = {
+            name: dict(field) for name, field in spec.fields.items()}
+
+        base_module, init_module = get_element_modules(self.__class__)
+        self._init_elements(spec.elements,
                             base_module,
                             init_module,
                             '{}Element',
-                            BaseElement)
-        self._init_elements(collections,
+                            BaseElement,
+                            ELEMENT_OPTIONS)
+        self._init_elements(spec.collections,
                             base_module,
                             init_module,
                             '{}Collection',
-                            BaseCollection)
+                            BaseCollection,
+                            COLLECTION_OPTIONS)
+        for name, component in create_components(self._driver,
+                                                 spec.components,
+                                                 base_module,
+                                                 init_module,
+                                                 self._element_defaults):
+            setattr(self, name, component)
+        for name, template in spec.templates.items():
+            setattr(self, name, create_template(
+                self._driver,
+                template,
+                ('{}Element', BaseElement),
+                ('{}Collection', BaseCollection),
+                base_module,
+                init_module,
+                self._element_defaults))
+        register_page(self._driver, self)
 
     def __str__(self) -> str:
         return (f'{self.__class__.__name__} elements: \n'
@@ -200,28 +320,48 @@ class BasePage:
                        base_module: ModuleType,
                        init_module: Optional[ModuleType],
                        mask: str,
-                       elem_init: type):
+                       elem_init: type,
+                       options: Tuple[str, ...] = ()):
         # pylint:disable=too-many-arguments
-
-        def get_class_for_init(html_elem: str) -> type:
-            cls_name = mask.format(html_elem.capitalize())
-            if (CONFIG.use_package_init_first
-                    and hasattr(init_module, cls_name)):
-                return cast(type, getattr(init_module, cls_name))
-            try:
-                return cast(type, getattr(base_module, cls_name))
-            except AttributeError:
-                return elem_init
-
-        for el_name, elements in yaml_part.items():
-
-            for html_elem, selectors in elements.items():
-                repr_name: str = selectors.pop('repr', None)
-                class_init: type = get_class_for_init(html_elem)
-                element_obj: ShawlElems = class_init(self._driver,
-                                                     repr_name=repr_name,
-                                                     **selectors)
-                setattr(self, f'{el_name}_{html_elem}', element_obj)
+        def get_class(html_elem: str) -> type:
+            return get_element_class(html_elem,
+                                     mask,
+                                     elem_init,
+                                     base_module,
+                                     init_module)
+
+        for name, element_obj in create_elements(self._driver,
+                                                 yaml_part,
+                                                 get_class,
+                                                 options,
+                                                 self._element_defaults):
+            setattr(self, name, element_obj)
+
+    def _get_field(self, name: str) -> _FIELD:
+        field: Dict[str, str] = self._fields.get(name, {'element': name})
+        element_name: str = field.get('element', name)
+        element: Any = self.__dict__.get(element_name)
+        if not isinstance(element, (BaseElement, BaseCollection)):
+            raise InvalidFieldException(
+                f'Unable to extract "{name}" from {self.__class__.__name__}. '
+                f'There is no element "{element_name}" on the page.')
+
+        read: str = field.get('read', 'text')
+        type_: str = field.get('type', 'int' if read == 'count' else 'str')
+        if read not in _FIELD_READS or type_ not in _FIELD_TYPES:
+            raise InvalidFieldException(
+                f'Unable to extract "{name}" from {self.__class__.__name__}. '
+                f'Check "read: {read}" and "type: {type_}" values, '
+                f'possible reads: {_FIELD_READS}, '
+                f'possible types: {tuple(_FIELD_TYPES)}.')
+
+        return _FIELD(
+            request=[[list(selector) for selector in element.selectors],
+                     isinstance(element, BaseCollection),
+                     read, field.get('attribute', '')],
+            converter=_FIELD_TYPES[type_],
+            frames=element.frames,
+            scope=element.scope)
 
     @property
     def url_pattern(self) -> str:
@@ -241,6 +381,80 @@ class BasePage:
     def page_strings(self) -> Dict[str, str]:
         return self._page_strings
 
+    @property
+    def fields(self) -> Dict[str, Dict[str, str]]:
+        return self._fields
+
+    def extract(self, names: Union[List[str], str]) -> Any:
+        """
+        Read values of several elements with one script call
+        (one call per frame, if elements are located in different frames).
+
+        `names` are keys of the `fields` section of page yaml file or
+        names of page elements, for the latter the text of element is read.
+        Values of collections are returned as lists.
+
+        Returned NamedTuple has attributes named as `names` with values
+        converted according to the `type` of each field.
+        """
+        names_: Tuple[str, ...] = tuple(_get_list(names))
+        fields: List[_FIELD] = [self._get_field(name) for name in names_]
+        by_frames: Dict[Frames, List[int]] = dict()
+        for index, field in enumerate(fields):
+            by_frames.setdefault(field.frames, []).append(index)
+
+        values: List[Any] = [None] * len(fields)
+        for frames, indexes in by_frames.items():
+            switch_context(self._driver, frames)
+            read: List[Any] = call_scoped_helper(
+                self._driver,
+                'readFields',
+                [(fields[index].scope, fields[index].request)
+                 for index in indexes])
+            for index, value in zip(indexes, read):
+                values[index] = value
+
+        record_cls: type = _get_record_cls(self.__class__.__name__, names_)
+        return record_cls(*(_convert_value(value, field.converter)
+                            for field, value in zip(fields, values)))
+
+    def actions(self) -> ActionQueue:
+        """
+        Create queue of fill and click actions with page elements,
+        which will be executed with as few script calls as possible.
+        """
+        return ActionQueue(self)
+
+    def fill(self, values: Dict[str, Any]):
+        """
+        Fill page elements with values, keys of `values` are names of
+        page elements. Values are set by one script call with dispatching
+        of `input` and `change` events, except elements with `keystrokes`
+        option, which are filled with real keystrokes. Missing elements
+        are waited for as on lazy load, None values are not allowed.
+        """
+        with self.actions() as queue:
+            for name, value in values.items():
+                queue.fill(name, value)
+
+    def in_context(self,
+                   frame: Any = None,
+                   window: Optional[str] = None) -> ContextManager[WebDriver]:
+        """
+        Switch to `frame` (locator dict or list of them for nested frames)
+        of `window` inside `with` block and switch back on exit.
+        Switch commands are sent only if driver is not there yet.
+
+        For example::
+
+
+            with page.in_context(frame={'css selector': 'iframe#pay'}):
+                page.card_input.send_keys('4111')
+        """
+        return get_browser_context(self._driver).scope(self._driver,
+                                                       parse_frames(frame),
+                                                       window)
+
     def switch_to_opened_tab(self,
                              old_handle: str,
                              elements_list: Optional[List[str]] = None,
@@ -251,17 +465,20 @@ class BasePage:
         After open new tab, current page will be validated
         with `validate_current_page` method.
         """
-        for handle in self._driver.window_handles:
+        with read_step(self._driver) as driver:
+            handles: List[str] = driver.window_handles
+        for handle in reversed(handles):
             if handle != old_handle:
-                self._driver.switch_to.window(handle)
+                get_browser_context(self._driver).switch(self._driver,
+                                                         window=handle)
+                break
         self.validate_current_page(elements_list=elements_list,
                                    page_name=page_name)
 
-    @check_server_error_after(log_level=CONFIG.log_level,
-                              bad_msg=CONFIG.log_message)
+    @check_server_error_after()
     def switch_to_frame(self,
                         locator: Any,
-                        wait: int = CONFIG.wait_timeout) -> bool:
+                        wait: Optional[float] = None) -> bool:
         """
         Checking whether the given frame is available to switch to.
         If the frame is available it switches the given driver
@@ -272,9 +489,8 @@ class BasePage:
                           wait,
                           frame_to_be_available_and_switch_to_it(locator))
 
-    @check_server_error_after(log_level=CONFIG.log_level,
-                              bad_msg=CONFIG.log_message)
-    def title_is(self, title: str, wait: int = CONFIG.wait_timeout) -> bool:
+    @check_server_error_after()
+    def title_is(self, title: str, wait: Optional[float] = None) -> bool:
         """
         Check that page title equals expected.
         Method try to find if page title is an exact match with expected title
@@ -285,11 +501,10 @@ class BasePage:
                           wait,
                           title_is(title))
 
-    @check_server_error_after(log_level=CONFIG.log_level,
-                              bad_msg=CONFIG.log_message)
+    @check_server_error_after()
     def title_contains(self,
                        title: str,
-                       wait: int = CONFIG.wait_timeout) -> bool:
+                       wait: Optional[float] = None) -> bool:
         """
         Check that page title contains expected.
         Method try to find if page title contains the expected title
@@ -300,11 +515,10 @@ class BasePage:
                           wait,
                           title_contains(title))
 
-    @check_server_error_after(log_level=CONFIG.log_level,
-                              bad_msg=CONFIG.log_message)
+    @check_server_error_after()
     def url_contains(self,
                      url: str,
-                     wait: int = CONFIG.wait_timeout) -> bool:
+                     wait: Optional[float] = None) -> bool:
         """
         Check that url contains a case-sensitive substring during 'wait'
         seconds.
@@ -314,11 +528,10 @@ class BasePage:
                           wait,
                           url_contains(url))
 
-    @check_server_error_after(log_level=CONFIG.log_level,
-                              bad_msg=CONFIG.log_message)
+    @check_server_error_after()
     def url_matches(self,
                     pattern: str,
-                    wait: int = CONFIG.wait_timeout) -> bool:
+                    wait: Optional[float] = None) -> bool:
         """
         Check that url is the exact match of the pattern during 'wait'
         seconds.
@@ -328,9 +541,8 @@ class BasePage:
                           wait,
                           url_matches(pattern))
 
-    @check_server_error_after(log_level=CONFIG.log_level,
-                              bad_msg=CONFIG.log_message)
-    def url_to_be(self, url: str, wait: int = CONFIG.wait_timeout) -> bool:
+    @check_server_error_after()
+    def url_to_be(self, url: str, wait: Optional[float] = None) -> bool:
         """
         Check that url is the exact match expected url during 'wait'
         seconds.
@@ -340,9 +552,8 @@ class BasePage:
                           wait,
                           url_to_be(url))
 
-    @check_server_error_after(log_level=CONFIG.log_level,
-                              bad_msg=CONFIG.log_message)
-    def url_changes(self, url: str, wait: int = CONFIG.wait_timeout) -> bool:
+    @check_server_error_after()
+    def url_changes(self, url: str, wait: Optional[float] = None) -> bool:
         """
         Check that url is not matched to expected during 'wait'
         seconds.
@@ -352,11 +563,10 @@ class BasePage:
                           wait,
                           url_changes(url))
 
-    @check_server_error_after(log_level=CONFIG.log_level,
-                              bad_msg=CONFIG.log_message)
+    @check_server_error_after()
     def number_or_windows_to_be(self,
                                 number: int,
-                                wait: int = CONFIG.wait_timeout) -> bool:
+                                wait: Optional[float] = None) -> bool:
         """
         Check that number of windows increased and new window is opened
         during 'wait' seconds.
@@ -366,11 +576,10 @@ class BasePage:
                           wait,
                           new_window_is_opened(number))
 
-    @check_server_error_after(log_level=CONFIG.log_level,
-                              bad_msg=CONFIG.log_message)
+    @check_server_error_after()
     def new_window_is_opened(self,
                              number: int,
-                             wait: int = CONFIG.wait_timeout) -> bool:
+                             wait: Optional[float] = None) -> bool:
         """
         Check that number of windows is equal to specified value during 'wait'
         seconds.
@@ -380,9 +589,8 @@ class BasePage:
                           wait,
                           number_of_windows_to_be(number))
 
-    @check_server_error_after(log_level=CONFIG.log_level,
-                              bad_msg=CONFIG.log_message)
-    def alert_is_present(self, wait: int = CONFIG.wait_timeout) -> bool:
+    @check_server_error_after()
+    def alert_is_present(self, wait: Optional[float] = None) -> bool:
         """
         Check that an alert is present.
         Returns True if alert is present, False otherwise
@@ -391,8 +599,7 @@ class BasePage:
                           wait,
                           alert_is_present())
 
-    @check_server_error_after(log_level=CONFIG.log_level,
-                              bad_msg=CONFIG.log_message)
+    @check_server_error_after()
     def validate_current_page(self,
                               elements_list: Optional[List[str]] = None,
                               page_name: Optional[str] = None,
@@ -427,21 +634,21 @@ class BasePage:
         for elem in to_check:
             assert elem.is_present(), f'{elem} is not present'
 
-        if page_name:
-            assert page_name in self._driver.title, (f'"{page_name}" '
-                                                     'is not in title '
-                                                     f'"{self._driver.title}"')
-        if url:
-            assert self._driver.current_url == url, (
-                'URL mismatch. \n'
-                f'Expected: {url}\n'
-                f'Actual: {self._driver.current_url}')
-
-    @check_server_error_after(log_level=CONFIG.log_level,
-                              bad_msg=CONFIG.log_message)
+        with read_step(self._driver) as driver:
+            if page_name:
+                assert page_name in driver.title, (f'"{page_name}" '
+                                                   'is not in title '
+                                                   f'"{driver.title}"')
+            if url:
+                assert driver.current_url == url, (
+                    'URL mismatch. \n'
+                    f'Expected: {url}\n'
+                    f'Actual: {driver.current_url}')
+
+    @check_server_error_after()
     def is_elements_invisible(self,
                               to_be_invisible: Union[List[str], str],
-                              wait: int = CONFIG.wait_timeout) -> _INVISIBLE:
+                              wait: Optional[float] = None) -> _INVISIBLE:
         """
         Returned NamedTuple has attributes `all_invisible: bool`
         and `not_invisible: List[str]`
@@ -452,11 +659,10 @@ class BasePage:
             ]
         return _INVISIBLE(all_invisible=not bool(result), not_invisible=result)
 
-    @check_server_error_after(log_level=CONFIG.log_level,
-                              bad_msg=CONFIG.log_message)
+    @check_server_error_after()
     def is_elements_present(self,
                             to_be_present: Union[List[str], str],
-                            wait: int = CONFIG.wait_timeout) -> _PRESENT:
+                            wait: Optional[float] = None) -> _PRESENT:
         """
         Returned NamedTuple has attributes `all_present: bool`
         and `not_present: List[str]`
@@ -467,13 +673,12 @@ class BasePage:
             ]
         return _PRESENT(all_present=not bool(result), not_present=result)
 
-    @check_server_error_after(log_level=CONFIG.log_level,
-                              bad_msg=CONFIG.log_message)
+    @check_server_error_after()
     def wait_to_page_load(self,
                           to_be_present: Union[List[str], str, None] = None,
                           to_be_invisible: Union[List[str], str, None] = None,
-                          wait_present: int = CONFIG.wait_timeout,
-                          wait_invisible: int = CONFIG.wait_timeout,
+                          wait_present: Optional[float] = None,
+                          wait_invisible: Optional[float] = None,
                           sleep_after: int = 0):
         # pylint:disable=too-many-arguments
         present: _PRESENT = self.is_elements_present(to_be_present,
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+from collections import namedtuple
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple
+)
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from ..utils._js_runtime import call_helper
+from ..utils._timing_stats import locator_key
+
+# Number of distinct locators of elements, which are shared
+LOCATORS_CACHE_SIZE = 4096
+
+Selectors = Tuple[Tuple[str, str], ...]
+ElementLocators = namedtuple('ElementLocators', ['declared', 'selectors'])
+
+
+def collect_selectors(
+        locators: Dict[str, str],
+        alternatives: Optional[Iterable[Dict[str, str]]] = None
+        ) -> List[Tuple[str, str]]:
+    """
+    Return all selectors of an element in declared order: selectors
+    of element description and then selectors of `alternatives` list.
+    """
+    selectors: List[Tuple[str, str]] = list(locators.items())
+    for alternative in alternatives or ():
+        selectors.extend(alternative.items())
+    return selectors
+
+
+@lru_cache(maxsize=LOCATORS_CACHE_SIZE)
+def _shared_locators(selectors: Selectors) -> ElementLocators:
+    return ElementLocators(declared=locator_key(selectors[0]),
+                           selectors=selectors)
+
+
+def element_locators(
+        locators: Dict[str, str],
+        alternatives: Optional[Iterable[Dict[str, str]]] = None
+        ) -> ElementLocators:
+    """
+    Return selectors of an element (see `collect_selectors`) with key of
+    the first declared selector. Equal selectors are returned as the same
+    immutable object, so elements of all instances of a page share them.
+    """
+    selectors: Selectors = tuple(collect_selectors(locators, alternatives))
+    try:
+        return _shared_locators(selectors)
+    except TypeError:
+        # Selector with unhashable value can't be shared
+        return ElementLocators(declared=locator_key(selectors[0]),
+                               selectors=selectors)
+
+
+class ScopedContext:
+    """
+    Search context of elements of a component: elements are found under
+    root element of the component. WebElement of the root is cached and
+    is looked up again only when it becomes stale.
+
+    Context can be used instead of driver by expected conditions,
+    which find elements with `find_element` and `find_elements`.
+    """
+
+    def __init__(self, driver: WebDriver, root: Any):
+        self._driver: WebDriver = driver
+        self._root: Any = root
+
+    def _under_root(self, method: Callable[[WebElement], Any]) -> Any:
+        try:
+            return method(self._root.cached_element())
+        except StaleElementReferenceException:
+            return method(self._root.cached_element(reload=True))
+
+    def root_element(self, reload: bool = False) -> WebElement:
+        """
+        Return cached WebElement of the root, it is looked up again
+        if `reload` is set.
+        """
+        element: WebElement = self._root.cached_element(reload=reload)
+        return element
+
+    def find_element(self, by: str, value: str) -> WebElement:
+        return self._under_root(
+            lambda root: root.find_element(by, value))
+
+    def find_elements(self, by: str, value: str) -> List[WebElement]:
+        found: List[WebElement] = self._under_root(
+            lambda root: root.find_elements(by, value))
+        return found
+
+    def find_first(self,
+                   selectors: Sequence[Tuple[str, str]],
+                   all_: bool) -> Tuple[int, Any]:
+        index, found = self._under_root(
+            lambda root: _find_first(self._driver, selectors, all_, root))
+        return index, found
+
+    def condition(self,
+                  method: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        """
+        Return condition for waits with driver, which calls `method`
+        with this context instead of driver.
+        """
+        return lambda driver: method(self)
+
+
+def _find_first(driver: WebDriver,
+                selectors: Sequence[Tuple[str, str]],
+                all_: bool,
+                root: Optional[WebElement] = None) -> Tuple[int, Any]:
+    args: List[Any] = [[list(selector) for selector in selectors], all_]
+    if root is not None:
+        args.append(root)
+    index, found = call_helper(driver, 'findFirst', *args)
+    return int(index), found
+
+
+def call_scoped_helper(driver: WebDriver,
+                       name: str,
+                       items: Sequence[Tuple[Optional[ScopedContext],
+                                             List[Any]]]) -> Any:
+    """
+    Call JavaScript helper `name` with list of arguments of `items`.
+    Root element of a component (or None) is appended to arguments
+    of each item, so that item is looked up under the root. Roots are
+    looked up again once, if any of them is stale.
+    """
+
+    def call(reload: bool) -> Any:
+        return call_helper(driver, name, [
+            [*args, None if scope is None else scope.root_element(reload)]
+            for scope, args in items])
+
+    try:
+        return call(False)
+    except StaleElementReferenceException:
+        return call(True)
+
+
+def find_first(context: Any,
+               selectors: Sequence[Tuple[str, str]],
+               all_: bool) -> Tuple[int, Any]:
+    """
+    Try `selectors` in order with one script call. Return index of the
+    first selector, which found anything, and found element (or list of
+    elements if `all_` is set), or -1 and None if nothing was found.
+
+    `context` is driver or `ScopedContext` of a component.
+    """
+    if isinstance(context, ScopedContext):
+        return context.find_first(selectors, all_)
+    return _find_first(context, selectors, all_)
+
+
+__all__ = [
+    'ElementLocators',
+    'LOCATORS_CACHE_SIZE',
+    'ScopedContext',
+    'Selectors',
+    'call_scoped_helper',
+    'collect_selectors',
+    'element_locators',
+    'find_first'
+    ]
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    NoSuchFrameException,
+    StaleElementReferenceException,
+    TimeoutException
+)
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.expected_conditions import (
+    presence_of_element_located
+)
+from selenium.webdriver.support.wait import POLL_FREQUENCY
+
+from ..config import SHAWL_CONFIG as CONFIG
+from ..utils._browser_context import Frames, parse_frames, switch_context
+from ..utils._timing_stats import (
+    adaptive_timeout,
+    locator_key,
+    order_locators,
+    record_locator,
+    record_wait
+)
+from ..utils._waits import wait_for, wait_until
+from ._locators import (
+    ElementLocators,
+    ScopedContext,
+    Selectors,
+    element_locators,
+    find_first
+)
+
+
+class LookupMixin:
+    """
+    Lookup of BaseElement and BaseCollection: selectors with alternatives,
+    frames, root of component, lazy load and waits of checks.
+
+    `_FIND_ALL` tells whether lookup finds all elements of a selector
+    or the first one, `_presence` is condition of presence of elements
+    located by a selector.
+    """
+
+    # pylint:disable=too-many-instance-attributes
+    __slots__ = ('_driver', '_declared', '_selectors', '_selector',
+                 '_resolved', '_frames', '_timeout', '_poll', '_lazy_timeout',
+                 '_scope', '_repr_name', '__weakref__')
+
+    _FIND_ALL: bool = False
+    _presence: Any = staticmethod(presence_of_element_located)
+
+    def __init__(self,
+                 driver: WebDriver,
+                 repr_name: Optional[str],
+                 frame: Any,
+                 timeout: Optional[float],
+                 poll: Optional[float],
+                 lazy_timeout: Optional[float],
+                 alternatives: Optional[List[Dict[str, str]]],
+                 root: Any,
+                 locators: Dict[str, str]):
+        # pylint: disable=too-many-arguments
+        self._driver: WebDriver = driver
+        shared: ElementLocators = element_locators(locators, alternatives)
+        self._declared: str = shared.declared
+        self._selectors: Selectors = order_locators(shared.selectors)
+        self._selector: Tuple[str, str] = self._selectors[0]
+        # Element with one selector needs no lookup of working selector
+        self._resolved: bool = len(self._selectors) == 1
+        self._frames: Frames = parse_frames(frame)
+        self._timeout: Optional[float] = timeout
+        self._poll: float = poll or POLL_FREQUENCY
+        self._lazy_timeout: Optional[float] = lazy_timeout
+        self._scope: Optional[ScopedContext] = (
+            None if root is None else ScopedContext(driver, root))
+        self._repr_name: Optional[str] = repr_name
+
+    def __repr__(self) -> str:
+        return (self._repr_name
+                or f'{self.__class__.__name__}: {self._selector}')
+
+    def _wait_for_presence(self) -> Any:
+        """
+        Wait for `lazy_timeout` seconds (`SHAWL_LAZY_LOAD_TIMEOUT` by
+        default) until element is present and return what was found.
+        Raises TimeoutException if nothing was found.
+        """
+        key: str = locator_key(self._selector)
+        method: Callable[..., Any] = (
+            self._find_first if not self._resolved
+            else self._presence(self._selector))
+        if self._scope is not None:
+            method = self._scope.condition(method)
+
+        def poll(driver: WebDriver) -> Any:
+            if not self._switch_frames():
+                return False
+            return method(driver)
+
+        start: float = perf_counter()
+        try:
+            # Lazy load is a wait too, so budgets and profilers see it
+            found: Any = wait_for(self._driver, self.lazy_timeout, poll,
+                                  self._poll)
+        except TimeoutException:
+            # Missing element is a failure of lazy load, so it is kept
+            # as a sample, which raises learned timeout back
+            record_wait(key, perf_counter() - start, False, censored=True)
+            raise
+        record_wait(key, perf_counter() - start, True)
+        return found
+
+    def _find_first(self, context: Any) -> Any:
+        index, found = find_first(context, self._selectors, self._FIND_ALL)
+        if index < 0:
+            return False
+        self._use_selector(index)
+        return found
+
+    def _use_selector(self, index: int):
+        self._selector = self._selectors[index]
+        self._resolved = True
+        record_locator(self._declared, locator_key(self._selector))
+
+    def _switch_frames(self) -> bool:
+        """
+        Switch driver to frames of element. Returns False if a frame is
+        not in the DOM (yet), waits treat it as missing element.
+        """
+        try:
+            switch_context(self._driver, self._frames)
+        except (NoSuchElementException,
+                NoSuchFrameException,
+                StaleElementReferenceException):
+            return False
+        return True
+
+    def _located(self,
+                 condition: Callable[..., Callable[[Any], Any]],
+                 *args: Any,
+                 missing: bool = False) -> Callable[[Any], Any]:
+        """
+        Return wait condition `condition(selector, *args)` of element.
+        Each poll switches to frames of element first. Until element with
+        alternative selectors is found, all of them are tried on each poll
+        by one script call. Poll returns `missing` if a frame or element
+        was not found.
+        """
+
+        def poll(context: Any) -> Any:
+            if not self._switch_frames():
+                return missing
+            if not self._resolved and not self._find_first(context):
+                return missing
+            return condition(self._selector, *args)(context)
+
+        return poll
+
+    def _context(self) -> Any:
+        """
+        Return search context of element: driver or `ScopedContext`
+        of component, which element belongs to.
+        """
+        return self._driver if self._scope is None else self._scope
+
+    def _wait_until(self,
+                    wait: Optional[float],
+                    method: Callable[..., Any],
+                    adaptive: bool = False) -> bool:
+        """
+        Wait for `method` during `wait` seconds (`timeout` of element or
+        collection by default) polling every `poll` seconds. If `adaptive`
+        is set, `method` waits for elements to appear, so its duration is
+        recorded and default timeout may be learned from previous runs.
+        Timed out check is a valid answer, so only timeout is counted.
+        """
+        key: str = locator_key(self._selector)
+        if wait is None:
+            wait = self._timeout
+        if wait is None:
+            wait = (adaptive_timeout(key, CONFIG.wait_timeout) if adaptive
+                    else CONFIG.wait_timeout)
+        if self._scope is not None:
+            method = self._scope.condition(method)
+        if not adaptive:
+            return wait_until(self._driver, wait, method, self._poll)
+        start: float = perf_counter()
+        result: bool = wait_until(self._driver, wait, method, self._poll)
+        record_wait(key, perf_counter() - start, result)
+        return result
+
+    def _return_locator(self, selector_type: str) -> str:
+        if self._selector[0] == selector_type:
+            return self._selector[1]
+        return ''
+
+    @property
+    def selector(self) -> Tuple[str, str]:
+        return self._selector
+
+    @property
+    def selectors(self) -> Selectors:
+        """
+        Selectors, which are tried to find element: the one, which found
+        it, or all of them in order, if element was not found yet.
+        """
+        return (self._selector,) if self._resolved else self._selectors
+
+    @property
+    def scope(self) -> Optional[ScopedContext]:
+        """
+        Search context of component, which element belongs to,
+        None for elements of a page.
+        """
+        return self._scope
+
+    @property
+    def frames(self) -> Frames:
+        return self._frames
+
+    @property
+    def lazy_timeout(self) -> float:
+        """
+        Seconds to wait for element to be present on lazy load:
+        `lazy_timeout` option or `SHAWL_LAZY_LOAD_TIMEOUT` by default.
+        """
+        return (self._lazy_timeout
+                or adaptive_timeout(locator_key(self._selector),
+                                    CONFIG.lazy_load_timeout))
+
+    @property
+    def id(self) -> str:
+        # pylint: disable=invalid-name
+        return self._return_locator('id')
+
+    @property
+    def xpath(self) -> str:
+        return self._return_locator('xpath')
+
+    @property
+    def link_text(self) -> str:
+        return self._return_locator('link text')
+
+    @property
+    def partial_link_text(self) -> str:
+        return self._return_locator('partial link text')
+
+    @property
+    def name(self) -> str:
+        return self._return_locator('name')
+
+    @property
+    def tag_name(self) -> str:
+        return self._return_locator('tag name')
+
+    @property
+    def class_name(self) -> str:
+        return self._return_locator('class name')
+
+    @property
+    def css_selector(self) -> str:
+        return self._return_locator('css selector')
+
+
+__all__ = ['LookupMixin']
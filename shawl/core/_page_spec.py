@@ -0,0 +1,441 @@
+# -*- coding: utf-8 -*-
+import sys
+from collections import namedtuple
+from contextlib import contextmanager
+from copy import deepcopy
+from inspect import getfile
+from os import stat
+from os.path import exists, isfile, join
+from types import ModuleType
+from weakref import WeakKeyDictionary
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    cast
+)
+
+import yaml
+
+from ..config import SHAWL_CONFIG as CONFIG
+from ..exceptions import (
+    InitNotFoundException,
+    InvalidComponentException,
+    InvalidIncludeException,
+    NoneValuesInYamlException
+)
+
+PageSpec = namedtuple('PageSpec', ['repr_name',
+                                   'url_pattern',
+                                   'page_strings',
+                                   'fields',
+                                   'elements',
+                                   'collections',
+                                   'components',
+                                   'templates',
+                                   'element_defaults'])
+ComponentSpec = namedtuple('ComponentSpec', ['name',
+                                             'repr_name',
+                                             'root',
+                                             'elements',
+                                             'collections',
+                                             'components',
+                                             'element_defaults'])
+
+# Options of elements and collections, which can be set for all elements
+# of a page in `element_defaults` section
+TIMING_OPTIONS = ('timeout', 'poll', 'lazy_timeout')
+# Options of elements and collections, which are not selectors
+ELEMENT_OPTIONS = ('keystrokes', 'frame', 'alternatives', *TIMING_OPTIONS)
+COLLECTION_OPTIONS = ('frame', 'alternatives', *TIMING_OPTIONS)
+
+# Sections of yaml files, which are not elements
+_NOT_ELEMENTS = ('page_repr', 'url_pattern', 'collections', 'fields',
+                 'element_defaults', 'components', 'templates',
+                 'component_repr', 'root')
+# Sections of pages, which are not checked for None values
+_OPTIONAL_SECTIONS = ('page_repr', 'url_pattern')
+# Resolved yaml files by path with times of modification of the file
+# and all files it includes
+_FRAGMENTS: Dict[str, Tuple[Tuple[Tuple[str, int], ...],
+                            Dict[str, Any]]] = dict()
+# Sets of paths of loaded yaml files collected by `tracking_yaml_files`
+_TRACKERS: List[Set[str]] = []
+# Loaded pages by class with paths of yaml files and resolved descriptions
+# of classes of its MRO
+_Fragments = Tuple[Dict[str, Any], ...]
+_PAGE_SPECS: ('WeakKeyDictionary[type, '
+              'Tuple[Tuple[str, ...], _Fragments, PageSpec]]') = (
+    WeakKeyDictionary())
+# Loaded components by path of yaml file with its resolved description
+_COMPONENT_SPECS: Dict[str, Tuple[Dict[str, Any], ComponentSpec]] = dict()
+
+
+def pop_options(selectors: Dict[str, Any],
+                options: Tuple[str, ...],
+                defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Pop element options from yaml element description, so that
+    only selectors will be left. Options, which are not set for element,
+    are taken from `defaults`.
+    """
+    result: Dict[str, Any] = {option: value for option, value
+                              in (defaults or dict()).items()
+                              if option in options}
+    result.update({option: selectors.pop(option) for option in options
+                   if option in selectors})
+    return result
+
+
+def _load_page(file: str, path: str) -> Dict[str, str]:
+    """
+    Load yaml file as dict
+    """
+    # pylint: disable=consider-using-with
+    file_path: str = join(path, file)
+    if not exists(file_path) or not isfile(file_path):
+        return dict()
+    return yaml.full_load(open(file_path, encoding='utf-8')) or dict()
+
+
+def _check_not_none_values(source: Dict[str, str], yaml_file: str):
+    if not all(source.values()):
+        raise NoneValuesInYamlException(
+            f'There is None value in {yaml_file} file. '
+            'Check that all keys have not None values')
+    for v in source.values():
+        if isinstance(v, dict):
+            _check_not_none_values(v, yaml_file)
+
+
+def _merge_page_dicts(source: Dict[str, Dict[str, Any]],
+                      new: Dict[str, Dict[str, Any]]):
+    """
+    Merge two yaml dicts, so that previously loaded element_name_html_element
+    will not be overwritten
+    """
+    for el_name, elements in new.items():
+        if el_name not in source:
+            source[el_name] = dict(elements)
+        else:
+            for html_elem, selectors in elements.items():
+                if html_elem not in source[el_name]:
+                    source[el_name][html_elem] = selectors
+
+
+def _yaml_file(name: str) -> Tuple[str, str]:
+    """
+    Return name of yaml file of page or component `name` and path of
+    directory with it.
+    """
+    yaml_name: str = f'{name}.yaml'
+    return yaml_name, CONFIG.yaml_map.get(yaml_name, CONFIG.source_yaml_path)
+
+
+def _yaml_file_path(name: str) -> str:
+    yaml_name, yaml_path = _yaml_file(name)
+    return join(yaml_path, yaml_name)
+
+
+def _modified(file_path: str) -> int:
+    try:
+        return stat(file_path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _include(fragment: Dict[str, Any], included: Dict[str, Any]):
+    """
+    Merge `included` description into `fragment`, so that elements,
+    sections and options of `fragment` will not be overwritten
+    """
+    for key, value in deepcopy(included).items():
+        if key not in fragment:
+            fragment[key] = value
+        elif key == 'collections':
+            _merge_page_dicts(fragment[key], value)
+        elif isinstance(fragment[key], dict) and isinstance(value, dict):
+            for name, item in value.items():
+                fragment[key].setdefault(name, item)
+
+
+@contextmanager
+def tracking_yaml_files() -> Iterator[Set[str]]:
+    """
+    Collect paths of yaml files, which descriptions are used inside `with`
+    block (including included and already loaded files).
+    """
+    files: Set[str] = set()
+    _TRACKERS.append(files)
+    try:
+        yield files
+    finally:
+        _TRACKERS.remove(files)
+
+
+def _track(depends: Iterable[Tuple[str, int]]):
+    for path, _ in depends:
+        for files in _TRACKERS:
+            files.add(path)
+
+
+def load_fragment(name: str,
+                  including: Tuple[str, ...] = ()) -> Dict[str, Any]:
+    """
+    Load `name`.yaml file with files listed in its `include` section
+    (names of yaml files without extension). Included descriptions are
+    merged into description of the file without overwriting of its own
+    elements and options, the first included file wins over next ones.
+
+    Resolved description is loaded once per process and is shared,
+    so it must not be modified by callers. If `SHAWL_RELOAD_YAML` is set,
+    it is loaded again when the file or one of included files is modified.
+    """
+    yaml_name, yaml_path = _yaml_file(name)
+    file_path: str = join(yaml_path, yaml_name)
+    cached = _FRAGMENTS.get(file_path)
+    if cached is not None and (not CONFIG.reload_yaml
+                               or all(_modified(path) == modified
+                                      for path, modified in cached[0])):
+        if _TRACKERS:
+            _track(cached[0])
+        return cached[1]
+    if name in including:
+        raise InvalidIncludeException(
+            f'{yaml_name} includes itself: '
+            f'{" -> ".join((*including, name))}')
+
+    fragment: Dict[str, Any] = _load_page(yaml_name, yaml_path)
+    _check_not_none_values({key: value for key, value in fragment.items()
+                            if key not in _OPTIONAL_SECTIONS},
+                           yaml_name)
+    depends: List[Tuple[str, int]] = [(file_path, _modified(file_path))]
+    includes: Any = fragment.pop('include', [])
+    for included in includes if isinstance(includes, list) else [includes]:
+        included_name, included_path = _yaml_file(included)
+        if not isfile(join(included_path, included_name)):
+            raise InvalidIncludeException(
+                f'Unable to find {included_name} file '
+                f'included by {yaml_name}')
+        _include(fragment, load_fragment(included, (*including, name)))
+        depends.extend(
+            _FRAGMENTS[join(included_path, included_name)][0])
+    _FRAGMENTS[file_path] = (tuple(depends), fragment)
+    if _TRACKERS:
+        _track(depends)
+    return fragment
+
+
+def _get_package_init(cur_module: str) -> ModuleType:
+
+    def is_init(module_: Optional[ModuleType]) -> bool:
+        return module_ is not None and getfile(module_).endswith('__init__.py')
+
+    module_ = sys.modules.get(cur_module, None)
+
+    if not is_init(module_):
+        try:
+            return sys.modules['.'.join(cur_module.split('.')[:-1])]
+        except KeyError as kerr:
+            raise InitNotFoundException('Unable to find __init__.py '
+                                        f'for module {cur_module}') from kerr
+
+    return cast(ModuleType, module_)
+
+
+def load_page_spec(page_cls: type) -> PageSpec:
+    """
+    Load description of page from yaml files of `page_cls`
+    and all its bases in order of method resolution, so that mixins
+    of pages may have own yaml files.
+
+    Description is loaded once per page class and is shared, so it must
+    not be modified by callers. Files are not looked up again until paths
+    of yaml files change or, if `SHAWL_RELOAD_YAML` is set, one of them
+    is modified.
+    """
+    # pylint: disable=too-many-locals
+    names: List[str] = [buf_cls.__name__ for buf_cls in page_cls.__mro__
+                        if buf_cls is not object]
+    paths: Tuple[str, ...] = tuple(_yaml_file_path(name) for name in names)
+    cached = _PAGE_SPECS.get(page_cls)
+    if (cached is not None and cached[0] == paths
+            and not CONFIG.reload_yaml):
+        if _TRACKERS:
+            for path in paths:
+                _track(_FRAGMENTS[path][0])
+        return cached[2]
+    fragments: _Fragments = tuple(load_fragment(name) for name in names)
+    if cached is not None and cached[0] == paths and all(
+            loaded is fragment
+            for loaded, fragment in zip(cached[1], fragments)):
+        return cached[2]
+
+    repr_name: str = page_cls.__name__
+    url_pattern: str = ''
+    page_strings: Dict[str, str] = dict()
+    fields: Dict[str, Dict[str, str]] = dict()
+    all_elements: Dict[str, Dict[str, Any]] = dict()
+    collections: Dict[str, Dict[str, Any]] = dict()
+    components: Dict[str, Dict[str, Any]] = dict()
+    templates: Dict[str, Dict[str, Any]] = dict()
+    element_defaults: Dict[str, Any] = dict()
+
+    for buf_cls, fragment in zip(page_cls.__mro__, fragments):
+        cur_dict: Dict[str, Any] = dict(fragment)
+
+        if buf_cls is page_cls:
+            repr_name = cur_dict.pop('page_repr', repr_name)
+            url_pattern = cur_dict.pop('url_pattern', '')
+        for section in _OPTIONAL_SECTIONS:
+            cur_dict.pop(section, None)
+
+        page_strings.update(
+            cast(Dict[str, str], cur_dict.pop('page_strings', dict())))
+        for field_name, field in cur_dict.pop('fields', dict()).items():
+            fields.setdefault(field_name, field)
+        for option, value in cur_dict.pop('element_defaults',
+                                          dict()).items():
+            element_defaults.setdefault(option, value)
+        for component_name, component in cur_dict.pop('components',
+                                                      dict()).items():
+            components.setdefault(component_name, component)
+        for template_name, template in cur_dict.pop('templates',
+                                                    dict()).items():
+            templates.setdefault(template_name, template)
+        _merge_page_dicts(
+            collections,
+            cast(Dict[str, Any], cur_dict.pop('collections', dict())))
+        _merge_page_dicts(
+            all_elements,
+            cur_dict)
+
+    for not_elem_key in _NOT_ELEMENTS:
+        all_elements.pop(not_elem_key, None)
+
+    spec: PageSpec = PageSpec(repr_name=repr_name,
+                              url_pattern=url_pattern,
+                              page_strings=page_strings,
+                              fields=fields,
+                              elements=all_elements,
+                              collections=collections,
+                              components=components,
+                              templates=templates,
+                              element_defaults=element_defaults)
+    _PAGE_SPECS[page_cls] = (paths, fragments, spec)
+    return spec
+
+
+def load_component_spec(name: str) -> ComponentSpec:
+    """
+    Load description of component from `name`.yaml file. Description is
+    loaded once and is shared by all pages, which embed the component
+    (until the file is modified, if `SHAWL_RELOAD_YAML` is set).
+    """
+    yaml_name, yaml_path = _yaml_file(name)
+    file_path: str = join(yaml_path, yaml_name)
+    cached = _COMPONENT_SPECS.get(file_path)
+    if (cached is None or CONFIG.reload_yaml) and not isfile(file_path):
+        raise InvalidComponentException(
+            f'Unable to find {yaml_name} file of component "{name}"')
+    fragment: Dict[str, Any] = load_fragment(name)
+    if cached is not None and cached[0] is fragment:
+        return cached[1]
+
+    cur_dict: Dict[str, Any] = dict(fragment)
+    spec = ComponentSpec(
+        name=name,
+        repr_name=cur_dict.pop('component_repr', name),
+        root=cur_dict.pop('root', dict()),
+        elements=dict(),
+        collections=cur_dict.pop('collections', dict()),
+        components=cur_dict.pop('components', dict()),
+        element_defaults=cur_dict.pop('element_defaults', dict()))
+    for not_elem_key in _NOT_ELEMENTS:
+        cur_dict.pop(not_elem_key, None)
+    spec.elements.update(cur_dict)
+    _COMPONENT_SPECS[file_path] = (fragment, spec)
+    return spec
+
+
+def get_element_modules(page_cls: type) -> Tuple[ModuleType, ModuleType]:
+    """
+    Return modules where to look for classes of page elements:
+    `SHAWL_ELEMENTS_CLS_MODULE` and package init of `page_cls` module.
+    """
+    base_module: ModuleType = sys.modules.get(
+        CONFIG.elements_classes_module,
+        sys.modules[__name__])
+    init_module: ModuleType = _get_package_init(page_cls.__module__)
+    return base_module, init_module
+
+
+def get_element_class(html_elem: str,
+                      mask: str,
+                      default: type,
+                      base_module: ModuleType,
+                      init_module: Optional[ModuleType]) -> type:
+    """
+    Return class with name `mask` formatted with capitalized `html_elem`
+    from `init_module` (if `SHAWL_USE_PACKAGE_INIT_FIRST` is set) or
+    from `base_module`. If there is no such class, `default` is returned.
+    """
+    cls_name = mask.format(html_elem.capitalize())
+    if (CONFIG.use_package_init_first
+            and hasattr(init_module, cls_name)):
+        return cast(type, getattr(init_module, cls_name))
+    try:
+        return cast(type, getattr(base_module, cls_name))
+    except AttributeError:
+        return default
+
+
+def create_elements(driver: Any,
+                    yaml_part: Dict[str, Dict[str, Any]],
+                    get_class: Callable[[str], type],
+                    options: Tuple[str, ...],
+                    defaults: Dict[str, Any],
+                    **kwargs) -> Iterator[Tuple[str, Any]]:
+    """
+    Create elements or collections described by `yaml_part` and yield
+    them with names of attributes. Class of each element is returned
+    by `get_class` for its html tag, `kwargs` are passed to all elements.
+    Descriptions are not modified, so they can be shared.
+    """
+    # pylint:disable=too-many-arguments
+    for el_name, elements in yaml_part.items():
+        for html_elem, description in elements.items():
+            selectors: Dict[str, Any] = dict(description)
+            repr_name: Optional[str] = selectors.pop('repr', None)
+            element_kwargs: Dict[str, Any] = pop_options(selectors,
+                                                         options,
+                                                         defaults)
+            element_kwargs.update(kwargs)
+            yield (f'{el_name}_{html_elem}',
+                   get_class(html_elem)(driver,
+                                        repr_name=repr_name,
+                                        **element_kwargs,
+                                        **selectors))
+
+
+__all__ = [
+    'COLLECTION_OPTIONS',
+    'ComponentSpec',
+    'ELEMENT_OPTIONS',
+    'PageSpec',
+    'TIMING_OPTIONS',
+    'create_elements',
+    'get_element_class',
+    'get_element_modules',
+    'load_component_spec',
+    'load_fragment',
+    'load_page_spec',
+    'pop_options',
+    'tracking_yaml_files'
+    ]
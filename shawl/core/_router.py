@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+import re
+from string import Formatter
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Set, Tuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from ..exceptions import RouteConflictException
+from ..utils._read_cache import read_step
+from ._page_spec import load_page_spec
+
+_SCHEME = re.compile(r'^[a-zA-Z][\w+.-]*://')
+_FORMATTER = Formatter()
+
+
+def _segments(url: str) -> List[str]:
+    """
+    Split `url` without scheme, query and fragment by `/`.
+    """
+    url = url.split('#', 1)[0].split('?', 1)[0]
+    return _SCHEME.sub('', url).rstrip('/').split('/')
+
+
+def _segment_pattern(segment: str) -> Tuple[str, Optional[Pattern[str]]]:
+    """
+    Return literal text of `segment` of url pattern and None, or
+    regular expression of the segment, if it has `{}` placeholders.
+    """
+    parts = list(_FORMATTER.parse(segment))
+    literal: str = ''.join(text for text, _, _, _ in parts)
+    if all(field is None for _, field, _, _ in parts):
+        return literal, None
+    return segment, re.compile(''.join(
+        re.escape(text) + ('' if field is None else '[^/]+')
+        for text, field, _, _ in parts))
+
+
+class _Node:
+    # pylint: disable=too-few-public-methods
+    __slots__ = ('literals', 'patterns', 'page')
+
+    def __init__(self):
+        self.literals: Dict[str, _Node] = dict()
+        self.patterns: Dict[str, Tuple[Pattern[str], _Node]] = dict()
+        self.page: Optional[type] = None
+
+
+class PageRouter:
+    """
+    Registry of page classes by `url_pattern` of their yaml files, which
+    finds class of current page by url.
+
+    Patterns are split by `/` into a trie: literal segments are looked
+    up in dicts and only segments with `{}` placeholders (any text except
+    `/`) are matched with regular expressions, so lookup does not depend
+    on number of registered pages. Scheme, query and fragment of urls are
+    ignored, literal segments win over placeholders.
+
+    For example::
+
+
+        router = PageRouter.from_subclasses(BasePage)
+        page = router.current_page(driver)
+        assert isinstance(page, LoginPage)
+
+    Pages are created with description loaded once per class, see
+    `load_page_spec`.
+    """
+
+    def __init__(self, pages: Iterable[type] = ()):
+        self._root: _Node = _Node()
+        self._routes: Dict[type, str] = dict()
+        self.register(*pages)
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+    def __contains__(self, page_cls: type) -> bool:
+        return page_cls in self._routes
+
+    @classmethod
+    def from_subclasses(cls, base: type) -> 'PageRouter':
+        """
+        Create router with all imported subclasses of `base`,
+        which have `url_pattern`.
+        """
+        found: List[type] = []
+        seen: Set[type] = set()
+        stack: List[type] = [base]
+        while stack:
+            subclasses: List[type] = stack.pop().__subclasses__()
+            for subclass in subclasses:
+                if subclass not in seen:
+                    seen.add(subclass)
+                    found.append(subclass)
+                    stack.append(subclass)
+        return cls(found)
+
+    def register(self, *pages: type) -> 'PageRouter':
+        """
+        Add `pages` by `url_pattern` of their yaml files, pages without
+        pattern are skipped. If a page and its subclass have the same
+        pattern, the subclass is used.
+        """
+        for page_cls in pages:
+            url_pattern: str = load_page_spec(page_cls).url_pattern
+            if not url_pattern:
+                continue
+            node: _Node = self._root
+            for segment in _segments(url_pattern):
+                key, pattern = _segment_pattern(segment)
+                if pattern is None:
+                    node = node.literals.setdefault(key, _Node())
+                else:
+                    node = node.patterns.setdefault(key,
+                                                    (pattern, _Node()))[1]
+            if node.page is not None and node.page is not page_cls:
+                if issubclass(node.page, page_cls):
+                    continue
+                if not issubclass(page_cls, node.page):
+                    raise RouteConflictException(
+                        f'{page_cls.__name__} and {node.page.__name__} '
+                        f'have the same url pattern "{url_pattern}"')
+                del self._routes[node.page]
+            node.page = page_cls
+            self._routes[page_cls] = url_pattern
+        return self
+
+    def resolve(self, url: str) -> Optional[type]:
+        """
+        Return page class, `url_pattern` of which matches `url`,
+        or None if there is no such page.
+        """
+        return self._match(self._root, _segments(url), 0)
+
+    def _match(self,
+               node: _Node,
+               segments: List[str],
+               index: int) -> Optional[type]:
+        if index == len(segments):
+            return node.page
+        found: Optional[type] = None
+        literal: Optional[_Node] = node.literals.get(segments[index])
+        if literal is not None:
+            found = self._match(literal, segments, index + 1)
+        for pattern, child in node.patterns.values():
+            if found is not None:
+                break
+            if pattern.fullmatch(segments[index]):
+                found = self._match(child, segments, index + 1)
+        return found
+
+    def current_page(self, driver: WebDriver) -> Any:
+        """
+        Create page for current url of `driver` or return None
+        if there is no page for it.
+        """
+        with read_step(driver) as reader:
+            url: str = reader.current_url
+        page_cls: Optional[type] = self.resolve(url)
+        return None if page_cls is None else page_cls(driver)
+
+
+__all__ = ['PageRouter']
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict, namedtuple
+from threading import Lock
+from types import ModuleType
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from ._page_spec import (
+    COLLECTION_OPTIONS,
+    ELEMENT_OPTIONS,
+    get_element_class,
+    pop_options
+)
+
+# Number of elements, which are kept by template by default
+TEMPLATE_CACHE_SIZE = 32
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+def _format(value: Any, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+    if isinstance(value, str):
+        return value.format(*args, **kwargs)
+    if isinstance(value, dict):
+        return {key: _format(item, args, kwargs)
+                for key, item in value.items()}
+    if isinstance(value, list):
+        return [_format(item, args, kwargs) for item in value]
+    return value
+
+
+class ElementTemplate:
+    """
+    Factory of elements with parametrized locators. Locators, `repr` and
+    `alternatives` of template are formatted with arguments of the call
+    as `str.format` does:
+
+    ::
+
+        templates:
+          row:
+            xpath: //tr[@data-id='{id}']
+            repr: Row {id}
+
+    ::
+
+        page.row(id=42).click()
+
+    Created elements are kept in LRU cache of `cache_size` elements
+    by arguments, so repeated calls with the same arguments return
+    the same element with its found WebElement.
+    """
+
+    # pylint:disable=too-many-instance-attributes
+    def __init__(self,
+                 driver: Any,
+                 element_cls: type,
+                 description: Dict[str, Any],
+                 options: Tuple[str, ...],
+                 defaults: Dict[str, Any],
+                 cache_size: int = TEMPLATE_CACHE_SIZE):
+        # pylint: disable=too-many-arguments
+        self._driver: Any = driver
+        self._element_cls: type = element_cls
+        self._selectors: Dict[str, Any] = dict(description)
+        self._options: Dict[str, Any] = pop_options(self._selectors,
+                                                    options,
+                                                    defaults)
+        self._repr_name: Any = self._selectors.pop('repr', None)
+        self._cache_size: int = cache_size
+        self._cache: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock: Lock = Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        key: Hashable = (args, tuple(sorted(kwargs.items())))
+        with self._lock:
+            if key in self._cache:
+                self._hits += 1
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            self._misses += 1
+        element: Any = self._element_cls(
+            self._driver,
+            repr_name=_format(self._repr_name, args, kwargs),
+            **_format(self._options, args, kwargs),
+            **_format(self._selectors, args, kwargs))
+        with self._lock:
+            element = self._cache.setdefault(key, element)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return element
+
+    def __repr__(self) -> str:
+        return (f'{self.__class__.__name__}: '
+                f'{self._element_cls.__name__} {self._selectors}')
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(hits=self._hits,
+                             misses=self._misses,
+                             maxsize=self._cache_size,
+                             currsize=len(self._cache))
+
+    def cache_clear(self):
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = 0
+
+
+def create_template(driver: Any,
+                    description: Dict[str, Any],
+                    element: Tuple[str, type],
+                    collection: Tuple[str, type],
+                    base_module: ModuleType,
+                    init_module: Optional[ModuleType],
+                    defaults: Dict[str, Any]) -> ElementTemplate:
+    """
+    Create template described in `templates` section of yaml file.
+    `element` and `collection` are masks of class names and default
+    classes of elements and collections created by template.
+    """
+    # pylint:disable=too-many-arguments
+    template: Dict[str, Any] = dict(description)
+    tag: str = template.pop('tag', '')
+    cache_size: int = template.pop('cache_size', TEMPLATE_CACHE_SIZE)
+    (mask, default), options = (
+        (collection, COLLECTION_OPTIONS)
+        if template.pop('collection', False)
+        else (element, ELEMENT_OPTIONS))
+    return ElementTemplate(
+        driver,
+        (get_element_class(tag, mask, default, base_module, init_module)
+         if tag else default),
+        template,
+        options,
+        defaults,
+        cache_size)
+
+
+__all__ = ['ElementTemplate', 'TEMPLATE_CACHE_SIZE', 'create_template']
@@ -1,27 +1,41 @@
 # -*- coding: utf-8 -*-
 from contextlib import suppress
-from typing import Any, Callable, Optional, TypeVar, cast
+from typing import Any, Callable, Iterator, Optional, TypeVar, cast
 
 import wrapt
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from ..config import SHAWL_CONFIG as CONFIG
+
+
+def _attribute_values(instance: Any) -> Iterator[Any]:
+    yield from getattr(instance, '__dict__', dict()).values()
+    # Slotted classes, e.g. elements, keep attributes in slots
+    for class_ in type(instance).__mro__:
+        for slot in class_.__dict__.get('__slots__', ()):
+            with suppress(AttributeError):
+                yield object.__getattribute__(instance, slot)
+
 
 def _extract_driver(instance: Any) -> Optional[WebDriver]:
-    for value in instance.__dict__.values():
+    for value in _attribute_values(instance):
         if isinstance(value, WebDriver):
             return value
     return None
 
 
-def check_server_error_after(log_level: str = 'SEVERE',
-                             bad_msg: str = '500 (Internal Server Error)',
+def check_server_error_after(log_level: Optional[str] = None,
+                             bad_msg: Optional[str] = None,
                              driver: WebDriver = None):
     """
     This decorator will check WebDriver logs after execution of
     BasePage class method.
 
     If there is a record - AssertionError will be raised
+
+    `log_level` and `bad_msg` are `SHAWL_LOG_LEVEL_TO_FAIL_ON` and
+    `SHAWL_LOG_MESSAGE_TO_FAIL_ON` at the time of the call by default.
     """
 
     @wrapt.decorator
@@ -42,10 +56,12 @@ def check_server_error_after(log_level: str = 'SEVERE',
                                  'properly. It must be instance of '
                                  '"WebDriver".')
         result = wrapped(*args, **kwargs)
+        level: str = CONFIG.log_level if log_level is None else log_level
+        bad: str = CONFIG.log_message if bad_msg is None else bad_msg
         for log in driver_.get_log('browser'):
-            if log.get('level') == log_level:
+            if log.get('level') == level:
                 message = log.get('message', '')
-                if bad_msg in message:
+                if bad in message:
                     raise AssertionError(message)
         return result
 
@@ -16,3 +16,35 @@ class NoneValuesInYamlException(Exception):
 
 class InitNotFoundException(Exception):
     pass
+
+
+class InvalidFieldException(Exception):
+    pass
+
+
+class PoolTimeoutException(Exception):
+    pass
+
+
+class PoolClosedException(Exception):
+    pass
+
+
+class BudgetExceededException(Exception):
+    pass
+
+
+class ReplayMismatchException(Exception):
+    pass
+
+
+class InvalidComponentException(Exception):
+    pass
+
+
+class InvalidIncludeException(Exception):
+    pass
+
+
+class RouteConflictException(Exception):
+    pass
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+from ._session_pool import SessionPool, is_session_alive, reset_session
+
+__all__ = ['SessionPool', 'is_session_alive', 'reset_session']
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=too-many-instance-attributes
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from threading import Condition
+from time import monotonic
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from ..exceptions import PoolClosedException, PoolTimeoutException
+
+_IDLE = namedtuple('_IDLE', ['driver', 'page'])
+
+_CLEAR_STORAGE = ('window.localStorage.clear();'
+                  'window.sessionStorage.clear();')
+
+
+def is_session_alive(driver: WebDriver) -> bool:
+    """
+    Default health check: session is alive if it answers
+    with at least one window handle.
+    """
+    try:
+        return bool(driver.window_handles)
+    except WebDriverException:
+        return False
+
+
+def reset_session(driver: WebDriver):
+    """
+    Default reset between leases: delete cookies and clear local
+    and session storage of current document. Current document is not
+    changed, so JavaScript helpers installed into it stay in place.
+    """
+    driver.delete_all_cookies()
+    with suppress(WebDriverException):
+        driver.execute_script(_CLEAR_STORAGE)
+
+
+def _page_name(page_cls: Optional[type]) -> Optional[str]:
+    if page_cls is None:
+        return None
+    return f'{page_cls.__module__}.{page_cls.__qualname__}'
+
+
+class SessionPool:
+    """
+    Bounded pool of WebDriver sessions, which are created by `factory`.
+
+    Sessions are checked with `health_check` before they are handed out
+    (dead ones are quit and replaced) and reset with `reset` when they
+    are returned. Checkout is thread-safe, if all `size` sessions are
+    leased, caller waits for `timeout` seconds for one of them.
+
+    Session, which hosted the same page class last time, is preferred,
+    so that JavaScript helpers and element caches of the page stay warm.
+
+    For example::
+
+
+        pool = SessionPool(lambda: webdriver.Chrome(), size=4)
+        pool.warm()
+
+        with pool.page(CustomPage) as page:
+            page.search_input.send_keys('shawl')
+
+        pool.close()
+    """
+
+    def __init__(self,
+                 factory: Callable[[], WebDriver],
+                 size: int,
+                 timeout: Optional[float] = None,
+                 health_check: Callable[[WebDriver], bool] = is_session_alive,
+                 reset: Callable[[WebDriver], None] = reset_session):
+        # pylint: disable=too-many-arguments
+        if size < 1:
+            raise ValueError(f'Pool size must be positive, got {size}')
+        self._factory: Callable[[], WebDriver] = factory
+        self._size: int = size
+        self._timeout: Optional[float] = timeout
+        self._health_check: Callable[[WebDriver], bool] = health_check
+        self._reset: Callable[[WebDriver], None] = reset
+        self._condition: Condition = Condition()
+        self._idle: List[_IDLE] = []
+        self._leased: Dict[int, _IDLE] = dict()
+        self._total: int = 0
+        self._closed: bool = False
+
+    def __enter__(self) -> 'SessionPool':
+        return self
+
+    def __exit__(self, *args: Any):
+        self.close()
+
+    def __repr__(self) -> str:
+        return (f'{self.__class__.__name__}(size={self._size}, '
+                f'idle={self.idle}, leased={self.leased})')
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    @property
+    def leased(self) -> int:
+        return len(self._leased)
+
+    def _pop_idle(self, page: Optional[str]) -> Optional[_IDLE]:
+        if not self._idle:
+            return None
+        # Last returned sessions are at the end of the list
+        for index in range(len(self._idle) - 1, -1, -1):
+            if self._idle[index].page == page:
+                return self._idle.pop(index)
+        return self._idle.pop()
+
+    def _reserve(self,
+                 page: Optional[str],
+                 timeout: Optional[float]) -> Optional[_IDLE]:
+        """
+        Take idle session or reserve a place for a new one (None is
+        returned in this case).
+        """
+        deadline: Optional[float] = (None if timeout is None
+                                     else monotonic() + timeout)
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise PoolClosedException('Session pool is closed')
+                idle: Optional[_IDLE] = self._pop_idle(page)
+                if idle is not None:
+                    return idle
+                if self._total < self._size:
+                    self._total += 1
+                    return None
+                remaining: Optional[float] = (None if deadline is None
+                                              else deadline - monotonic())
+                if remaining is not None and remaining <= 0:
+                    raise PoolTimeoutException(
+                        f'All {self._size} sessions are leased, none was '
+                        f'returned during {timeout} seconds')
+                self._condition.wait(remaining)
+
+    def _create(self) -> WebDriver:
+        try:
+            return self._factory()
+        except Exception:
+            with self._condition:
+                self._total -= 1
+                self._condition.notify()
+            raise
+
+    def _is_healthy(self, driver: WebDriver) -> bool:
+        # Session which failed health check is not healthy too
+        try:
+            return bool(self._health_check(driver))
+        except Exception:  # pylint: disable=broad-except
+            return False
+
+    def _discard(self, driver: WebDriver):
+        with suppress(Exception):
+            driver.quit()
+        with self._condition:
+            self._total -= 1
+            self._condition.notify()
+
+    def warm(self, count: Optional[int] = None):
+        """
+        Create `count` sessions (up to pool size by default) in parallel
+        and put them into the pool. If `factory` failed, created sessions
+        are kept in the pool and the first error is raised.
+        """
+        with self._condition:
+            count = min(self._size - self._total,
+                        self._size if count is None else count)
+            self._total += max(count, 0)
+        if count <= 0:
+            return
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            futures = [executor.submit(self._create) for _ in range(count)]
+        drivers: List[WebDriver] = [future.result() for future in futures
+                                    if future.exception() is None]
+        with self._condition:
+            self._idle.extend(_IDLE(driver=driver, page=None)
+                              for driver in drivers)
+            self._condition.notify(len(drivers))
+        for future in futures:
+            error: Optional[BaseException] = future.exception()
+            if error is not None:
+                raise error
+
+    def acquire(self,
+                page_cls: Optional[Type[Any]] = None,
+                timeout: Optional[float] = None) -> WebDriver:
+        """
+        Take healthy session from the pool, session which hosted
+        `page_cls` last time is preferred. If pool is exhausted, wait for
+        `timeout` seconds (pool `timeout` is used by default) and raise
+        PoolTimeoutException.
+        """
+        page: Optional[str] = _page_name(page_cls)
+        timeout = self._timeout if timeout is None else timeout
+        while True:
+            idle: Optional[_IDLE] = self._reserve(page, timeout)
+            if idle is None:
+                driver: WebDriver = self._create()
+            elif self._is_healthy(idle.driver):
+                driver = idle.driver
+            else:
+                # Place of discarded session is free for a new one
+                self._discard(idle.driver)
+                continue
+            with self._condition:
+                self._leased[id(driver)] = _IDLE(driver=driver, page=page)
+            return driver
+
+    def release(self, driver: WebDriver, discard: bool = False):
+        """
+        Return session to the pool. Session is reset before it can be
+        leased again, session which can't be reset or is `discard`-ed
+        is quit.
+        """
+        with self._condition:
+            leased: Optional[_IDLE] = self._leased.pop(id(driver), None)
+        if leased is None:
+            raise ValueError(f'{driver} was not leased from this pool')
+        if not discard and not self._closed:
+            try:
+                self._reset(driver)
+            except Exception:  # pylint: disable=broad-except
+                discard = True
+        if discard or self._closed:
+            self._discard(driver)
+            return
+        with self._condition:
+            self._idle.append(leased)
+            self._condition.notify()
+
+    @contextmanager
+    def lease(self,
+              page_cls: Optional[Type[Any]] = None,
+              timeout: Optional[float] = None) -> Iterator[WebDriver]:
+        """
+        Take session inside `with` block and return it on exit.
+        Session is quit if block raised WebDriverException.
+        """
+        driver: WebDriver = self.acquire(page_cls, timeout)
+        discard: bool = False
+        try:
+            yield driver
+        except WebDriverException:
+            discard = True
+            raise
+        finally:
+            self.release(driver, discard=discard)
+
+    @contextmanager
+    def page(self,
+             page_cls: Type[Any],
+             timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        Take session inside `with` block and create `page_cls` instance
+        with it.
+        """
+        with self.lease(page_cls, timeout) as driver:
+            yield page_cls(driver)
+
+    def close(self):
+        """
+        Quit all idle sessions. Leased sessions are quit when returned.
+        """
+        with self._condition:
+            self._closed = True
+            idle: List[_IDLE] = self._idle
+            self._idle = []
+            self._condition.notify_all()
+        for item in idle:
+            self._discard(item.driver)
+
+
+__all__ = ['SessionPool', 'is_session_alive', 'reset_session']
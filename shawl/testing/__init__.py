@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+from ._dom import Document
+from ._remote_end import FakeRemoteEnd
+from ._replay import ReplayConnection, replay
+
+__all__ = ['Document', 'FakeRemoteEnd', 'ReplayConnection', 'replay']
@@ -0,0 +1,443 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=too-many-instance-attributes,too-many-return-statements
+"""
+Minimal in-memory DOM for the fake WebDriver remote end.
+
+It supports the subset of HTML, CSS selectors and XPath, which is enough
+for page objects of tests and benchmarks: tags, ids, classes, attribute
+selectors with descendant and child combinators, and XPath location paths
+with attribute, text and positional predicates.
+"""
+import re
+from html.parser import HTMLParser
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+_VOID_TAGS = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img',
+                        'input', 'link', 'meta', 'param', 'source', 'track',
+                        'wbr'))
+_NOT_RENDERED_TAGS = frozenset(('head', 'script', 'style', 'title', 'meta',
+                                'link', 'template'))
+
+_CSS_COMPOUND = re.compile(
+    r'(?P<tag>[a-zA-Z*][\w-]*)'
+    r'|#(?P<id>[\w-]+)'
+    r'|\.(?P<cls>[\w-]+)'
+    r'|\[\s*(?P<attr>[\w-]+)\s*'
+    r'(?:(?P<op>[*^$~|]?=)\s*'
+    r'(?P<value>"[^"]*"|\'[^\']*\'|[^\]\s]+)\s*)?\]')
+_XPATH_PREDICATE = re.compile(
+    r'^(?:@(?P<attr>[\w-]+)(?:\s*=\s*(?P<attr_value>"[^"]*"|\'[^\']*\'))?'
+    r'|contains\(\s*(?P<contains_of>@[\w-]+|text\(\)|\.)\s*,\s*'
+    r'(?P<contains_value>"[^"]*"|\'[^\']*\')\s*\)'
+    r'|(?P<text_of>text\(\)|\.|normalize-space\(\))\s*=\s*'
+    r'(?P<text_value>"[^"]*"|\'[^\']*\')'
+    r'|(?P<index>\d+))$')
+
+
+class InvalidSelectorError(ValueError):
+    pass
+
+
+class Node:
+    """
+    Element of a document, text is kept as `str` children.
+    """
+
+    def __init__(self,
+                 tag: str,
+                 attrs: Optional[Dict[str, str]] = None,
+                 parent: Optional['Node'] = None):
+        self.tag: str = tag
+        self.attrs: Dict[str, str] = attrs or dict()
+        self.parent: Optional['Node'] = parent
+        self.children: List[Any] = []
+        self.value: Optional[str] = self.attrs.get('value')
+        self.checked: bool = 'checked' in self.attrs
+        self.selected: bool = 'selected' in self.attrs
+        # Document of iframe, it is created on first switch to frame
+        self.content: Optional['Document'] = None
+
+    def __repr__(self) -> str:
+        return f'<{self.tag} {self.attrs}>'
+
+    @property
+    def elements(self) -> List['Node']:
+        return [child for child in self.children if isinstance(child, Node)]
+
+    def descendants(self) -> Iterator['Node']:
+        for child in self.elements:
+            yield child
+            yield from child.descendants()
+
+    def ancestors(self) -> Iterator['Node']:
+        node: Optional[Node] = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+    @property
+    def root(self) -> 'Node':
+        node: Node = self
+        while node.parent is not None:
+            node = node.parent
+        return node
+
+    @property
+    def classes(self) -> List[str]:
+        return self.attrs.get('class', '').split()
+
+    def raw_text(self) -> str:
+        parts: List[str] = []
+        for child in self.children:
+            parts.append(child.raw_text() if isinstance(child, Node)
+                         else child)
+        return ''.join(parts)
+
+    @property
+    def is_displayed(self) -> bool:
+        for node in (self, *self.ancestors()):
+            if node.tag in _NOT_RENDERED_TAGS or 'hidden' in node.attrs:
+                return False
+            style: str = node.attrs.get('style', '').replace(' ', '')
+            if 'display:none' in style or 'visibility:hidden' in style:
+                return False
+        return not (self.tag == 'input'
+                    and self.attrs.get('type') == 'hidden')
+
+    @property
+    def text(self) -> str:
+        """
+        Rendered text of element with collapsed whitespaces.
+        """
+        if not self.is_displayed:
+            return ''
+        parts: List[str] = []
+        for child in self.children:
+            if isinstance(child, Node):
+                if child.is_displayed:
+                    parts.append(child.text)
+            else:
+                parts.append(child)
+        return ' '.join(' '.join(parts).split())
+
+    @property
+    def is_enabled(self) -> bool:
+        return 'disabled' not in self.attrs
+
+    @property
+    def is_checkable(self) -> bool:
+        return (self.tag == 'input'
+                and self.attrs.get('type') in ('checkbox', 'radio'))
+
+    def get_property(self, name: str) -> Any:
+        if name == 'value':
+            if self.tag == 'textarea' and self.value is None:
+                return self.raw_text()
+            return self.value if self.value is not None else ''
+        if name == 'checked':
+            return self.checked
+        if name == 'selected':
+            return self.selected
+        if name in ('tagName', 'nodeName'):
+            return self.tag.upper()
+        if name in ('innerText', 'textContent'):
+            return self.text
+        if name == 'className':
+            return self.attrs.get('class', '')
+        return self.attrs.get(name)
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        if name == 'value' and self.value is not None:
+            return self.value
+        if name in ('checked', 'selected', 'disabled', 'hidden'):
+            return 'true' if self.get_property(name) or name in self.attrs \
+                else None
+        return self.attrs.get(name)
+
+    def click(self):
+        if self.is_checkable:
+            if self.attrs.get('type') == 'radio':
+                self.checked = True
+            else:
+                self.checked = not self.checked
+        elif self.tag == 'option':
+            self.selected = True
+
+
+class Document(Node):
+    """
+    Root of a page parsed from HTML.
+    """
+
+    def __init__(self, html: str = '', url: str = ''):
+        super().__init__('#document')
+        self.url: str = url
+        self.detached: bool = False
+        # Values stored by scripts in `window` of this document
+        self.window: Dict[str, Any] = dict()
+        _TreeBuilder(self).feed(html)
+
+    @property
+    def title(self) -> str:
+        for node in self.descendants():
+            if node.tag == 'title':
+                return ' '.join(node.raw_text().split())
+        return ''
+
+    @property
+    def body(self) -> Node:
+        for node in self.descendants():
+            if node.tag == 'body':
+                return node
+        return self
+
+    def detach(self):
+        self.detached = True
+        for node in self.descendants():
+            if node.content is not None:
+                node.content.detach()
+
+    def frame_content(self, frame: Node) -> 'Document':
+        if frame.content is None:
+            frame.content = Document(frame.attrs.get('srcdoc', ''),
+                                     self.url)
+        return frame.content
+
+
+class _TreeBuilder(HTMLParser):
+
+    def __init__(self, document: Document):
+        super().__init__(convert_charrefs=True)
+        self._current: Node = document
+
+    def error(self, message: str):
+        raise ValueError(message)
+
+    def handle_starttag(self,
+                        tag: str,
+                        attrs: List[Tuple[str, Optional[str]]]):
+        node = Node(tag, {name: value or '' for name, value in attrs},
+                    self._current)
+        self._current.children.append(node)
+        if tag not in _VOID_TAGS:
+            self._current = node
+
+    def handle_startendtag(self,
+                           tag: str,
+                           attrs: List[Tuple[str, Optional[str]]]):
+        self._current.children.append(
+            Node(tag, {name: value or '' for name, value in attrs},
+                 self._current))
+
+    def handle_endtag(self, tag: str):
+        for node in (self._current, *self._current.ancestors()):
+            if node.tag == tag:
+                self._current = node.parent or node
+                return
+
+    def handle_data(self, data: str):
+        self._current.children.append(data)
+
+
+def _unquote(value: str) -> str:
+    if len(value) > 1 and value[0] == value[-1] and value[0] in '\'"':
+        return value[1:-1]
+    return value
+
+
+def _parse_compound(compound: str) -> List[Callable[[Node], bool]]:
+    checks: List[Callable[[Node], bool]] = []
+    position: int = 0
+    while position < len(compound):
+        match = _CSS_COMPOUND.match(compound, position)
+        if match is None:
+            raise InvalidSelectorError(f'Unsupported selector "{compound}"')
+        position = match.end()
+        checks.append(_compound_check(match.groupdict()))
+    return checks
+
+
+def _compound_check(groups: Dict[str, Optional[str]]
+                    ) -> Callable[[Node], bool]:
+    # pylint: disable=too-many-return-statements
+    if groups['tag'] is not None:
+        tag: str = groups['tag'].lower()
+        return lambda node: tag in ('*', node.tag)
+    if groups['id'] is not None:
+        id_: str = groups['id']
+        return lambda node: node.attrs.get('id') == id_
+    if groups['cls'] is not None:
+        cls: str = groups['cls']
+        return lambda node: cls in node.classes
+    attr: str = groups['attr'] or ''
+    if groups['op'] is None:
+        return lambda node: attr in node.attrs
+    op: str = groups['op']
+    value: str = _unquote(groups['value'] or '')
+    compare: Dict[str, Callable[[str], bool]] = {
+        '=': lambda actual: actual == value,
+        '*=': lambda actual: value in actual,
+        '^=': lambda actual: actual.startswith(value),
+        '$=': lambda actual: actual.endswith(value),
+        '~=': lambda actual: value in actual.split(),
+        '|=': lambda actual: actual == value or actual.startswith(
+            value + '-')
+        }
+    return lambda node: (attr in node.attrs
+                         and compare[op](node.attrs[attr]))
+
+
+def _parse_css(selector: str) -> List[List[Tuple[str, List[Any]]]]:
+    groups: List[List[Tuple[str, List[Any]]]] = []
+    for group in selector.split(','):
+        tokens: List[str] = re.sub(r'\s*>\s*', ' > ', group.strip()).split()
+        if not tokens:
+            raise InvalidSelectorError(f'Empty selector in "{selector}"')
+        parts: List[Tuple[str, List[Any]]] = []
+        combinator: str = ' '
+        for token in tokens:
+            if token == '>':
+                combinator = '>'
+                continue
+            parts.append((combinator, _parse_compound(token)))
+            combinator = ' '
+        groups.append(parts)
+    return groups
+
+
+def _matches(node: Node, parts: List[Tuple[str, List[Any]]]) -> bool:
+    combinator, checks = parts[-1]
+    if not all(check(node) for check in checks):
+        return False
+    if len(parts) == 1:
+        return True
+    if combinator == '>':
+        return (node.parent is not None
+                and _matches(node.parent, parts[:-1]))
+    return any(_matches(ancestor, parts[:-1])
+               for ancestor in node.ancestors())
+
+
+def select_css(root: Node, selector: str) -> List[Node]:
+    groups = _parse_css(selector)
+    return [node for node in root.descendants()
+            if any(_matches(node, parts) for parts in groups)]
+
+
+def _split_xpath(path: str) -> List[Tuple[bool, str]]:
+    """
+    Split location path to steps, each step is a pair of flag
+    "is descendant axis" and step text.
+    """
+    steps: List[Tuple[bool, str]] = []
+    depth: int = 0
+    current: str = ''
+    descendant: bool = False
+    index: int = 0
+    while index < len(path):
+        char: str = path[index]
+        if char == '/' and depth == 0:
+            if current:
+                steps.append((descendant, current))
+                current = ''
+            descendant = path[index + 1:index + 2] == '/'
+            index += 2 if descendant else 1
+            continue
+        depth += {'[': 1, ']': -1}.get(char, 0)
+        current += char
+        index += 1
+    if current:
+        steps.append((descendant, current))
+    return steps
+
+
+def _xpath_check(predicate: str) -> Callable[[Node, int], bool]:
+    match = _XPATH_PREDICATE.match(predicate.strip())
+    if match is None:
+        raise InvalidSelectorError(f'Unsupported predicate [{predicate}]')
+    groups: Dict[str, Optional[str]] = match.groupdict()
+    if groups['index'] is not None:
+        index: int = int(groups['index'])
+        return lambda node, position: position == index
+    if groups['attr'] is not None:
+        attr: str = groups['attr']
+        if groups['attr_value'] is None:
+            return lambda node, _: attr in node.attrs
+        attr_value: str = _unquote(groups['attr_value'])
+        return lambda node, _: node.attrs.get(attr) == attr_value
+    if groups['contains_of'] is not None:
+        of: str = groups['contains_of']
+        value: str = _unquote(groups['contains_value'] or '')
+        if of.startswith('@'):
+            return lambda node, _: value in node.attrs.get(of[1:], '')
+        return lambda node, _: value in node.raw_text()
+    text_value: str = _unquote(groups['text_value'] or '')
+    if groups['text_of'] == 'text()':
+        return lambda node, _: any(child == text_value
+                                   for child in node.children
+                                   if isinstance(child, str))
+    return lambda node, _: ' '.join(node.raw_text().split()) == text_value
+
+
+def _parse_step(step: str) -> Tuple[str, List[Callable[[Node, int], bool]]]:
+    name, *predicates = re.split(r'\[', step)
+    if not re.match(r'^([a-zA-Z][\w-]*|\*|\.)$', name):
+        raise InvalidSelectorError(f'Unsupported step "{step}"')
+    return name.lower(), [_xpath_check(predicate.rstrip(']'))
+                          for predicate in predicates]
+
+
+def select_xpath(root: Node, path: str) -> List[Node]:
+    path = path.strip()
+    if path.startswith('.'):
+        path = path[1:]
+    elif path.startswith('/'):
+        root = root.root
+    else:
+        path = '/' + path
+    context: List[Node] = [root]
+    for descendant, step in _split_xpath(path):
+        name, checks = _parse_step(step)
+        found: Dict[int, Node] = dict()
+        for node in context:
+            if name == '.':
+                found.setdefault(id(node), node)
+                continue
+            parents: List[Node] = ([node, *node.descendants()] if descendant
+                                   else [node])
+            for parent in parents:
+                candidates: List[Node] = [child for child in parent.elements
+                                          if name in ('*', child.tag)]
+                for position, candidate in enumerate(candidates, start=1):
+                    if all(check(candidate, position) for check in checks):
+                        found.setdefault(id(candidate), candidate)
+        context = [node for node in root.root.descendants()
+                   if id(node) in found]
+    return context
+
+
+def find(root: Node, by: str, value: str) -> List[Node]:
+    """
+    Find elements under `root` with W3C locator strategy.
+    """
+    if by == 'css selector':
+        return select_css(root, value)
+    if by == 'xpath':
+        return select_xpath(root, value)
+    if by == 'tag name':
+        return [node for node in root.descendants() if node.tag == value]
+    if by in ('link text', 'partial link text'):
+        return [node for node in root.descendants()
+                if node.tag == 'a'
+                and (node.text == value if by == 'link text'
+                     else value in node.text)]
+    if by == 'id':
+        return select_css(root, f'[id="{value}"]')
+    if by == 'name':
+        return select_css(root, f'[name="{value}"]')
+    if by == 'class name':
+        return select_css(root, f'.{value}')
+    raise InvalidSelectorError(f'Unsupported locator strategy "{by}"')
+
+
+__all__ = ['Document', 'InvalidSelectorError', 'Node', 'find']
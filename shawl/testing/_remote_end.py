@@ -0,0 +1,720 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=too-many-instance-attributes,too-few-public-methods
+import json
+import pkgutil
+import re
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from time import perf_counter, sleep
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+from uuid import uuid4
+
+from ..utils._js_runtime import _CALL, _LIBRARY, _MISSING
+from ..utils._locator_profiler import _PROFILE
+from ._dom import Document, InvalidSelectorError, Node, find
+
+_ELEMENT_KEY = 'element-6066-11e4-a52e-4f735466cecf'
+_HANDLE = 'main'
+
+# Scripts of Selenium atoms, which are used by W3C WebElement
+_ATOM_SCRIPT = 'return (%s).apply(null, arguments);'
+
+
+def _load_atoms() -> Dict[str, str]:
+    atoms: Dict[str, str] = dict()
+    for name in ('isDisplayed', 'getAttribute'):
+        source: Optional[bytes] = pkgutil.get_data(
+            'selenium', f'webdriver/remote/{name}.js')
+        if source is not None:
+            atoms[_ATOM_SCRIPT % source.decode('utf8')] = name
+    return atoms
+
+
+_ATOMS: Dict[str, str] = _load_atoms()
+
+
+class WebDriverError(Exception):
+    """
+    Error of W3C protocol, which is sent to a client.
+    """
+
+    def __init__(self, status: int, error: str, message: str = ''):
+        super().__init__(message)
+        self.status: int = status
+        self.error: str = error
+
+
+def _no_such_element(by: str, value: str) -> WebDriverError:
+    return WebDriverError(404, 'no such element',
+                          f'Unable to locate element: {by}={value}')
+
+
+class _Session:
+    """
+    State of one browser session: current document, frame and elements
+    known to a client.
+    """
+
+    def __init__(self, remote_end: 'FakeRemoteEnd'):
+        self.remote_end: 'FakeRemoteEnd' = remote_end
+        self.id: str = uuid4().hex  # pylint: disable=invalid-name
+        self.top: Document = Document(url='about:blank')
+        self.context: Document = self.top
+        self.history: List[str] = ['about:blank']
+        self.position: int = 0
+        self.cookies: Dict[str, Dict[str, Any]] = dict()
+        self._elements: Dict[str, Node] = dict()
+        self._ids: Dict[int, str] = dict()
+
+    def navigate(self, url: str, remember: bool = True):
+        self.top.detach()
+        self.top = Document(self.remote_end.pages.get(url, ''), url)
+        self.context = self.top
+        if remember:
+            del self.history[self.position + 1:]
+            self.history.append(url)
+            self.position = len(self.history) - 1
+
+    def reference(self, node: Node) -> Dict[str, str]:
+        element_id: Optional[str] = self._ids.get(id(node))
+        if element_id is None:
+            element_id = uuid4().hex
+            self._ids[id(node)] = element_id
+            self._elements[element_id] = node
+        return {_ELEMENT_KEY: element_id}
+
+    def node(self, reference: Any) -> Node:
+        element_id: Any = reference
+        if isinstance(reference, dict):
+            element_id = reference.get(_ELEMENT_KEY, reference.get('ELEMENT'))
+        node: Optional[Node] = self._elements.get(element_id)
+        if node is None:
+            raise WebDriverError(404, 'no such element',
+                                 f'Unknown element {element_id}')
+        root: Any = node.root
+        if not isinstance(root, Document) or root.detached:
+            raise WebDriverError(404, 'stale element reference',
+                                 'Element is not attached to the page')
+        return node
+
+    def unwrap(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            if _ELEMENT_KEY in value or 'ELEMENT' in value:
+                return self.node(value)
+            return {k: self.unwrap(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.unwrap(v) for v in value]
+        return value
+
+    def wrap(self, value: Any) -> Any:
+        if isinstance(value, Node):
+            return self.reference(value)
+        if isinstance(value, dict):
+            return {k: self.wrap(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.wrap(v) for v in value]
+        return value
+
+    def find(self, root: Node, by: str, value: str) -> List[Node]:
+        try:
+            return find(root, by, value)
+        except InvalidSelectorError as error:
+            raise WebDriverError(400, 'invalid selector',
+                                 str(error)) from error
+
+
+class _Scripts:
+    """
+    Emulation of scripts, which are sent by Selenium and shawl:
+    Selenium atoms and helpers of shawl JavaScript library.
+    Other scripts return null.
+    """
+
+    def __init__(self, session: _Session):
+        self._session: _Session = session
+
+    def execute(self, script: str, args: List[Any]) -> Any:
+        atom: Optional[str] = _ATOMS.get(script)
+        if atom == 'isDisplayed':
+            return args[0].is_displayed
+        if atom == 'getAttribute':
+            return args[0].get_attribute(args[1])
+        if script == _PROFILE:
+            return [self._profile(by, value, args[1], args[2])
+                    for by, value in args[0]]
+        window: Dict[str, Any] = self._session.context.window
+        if script == _LIBRARY + _CALL:
+            window['__shawl'] = args[0]
+        elif script != _CALL:
+            return None
+        if window.get('__shawl') != args[0]:
+            return _MISSING
+        helper: Callable[..., Any] = getattr(self, f'_helper_{args[1]}')
+        return helper(*args[2])
+
+    def _find(self,
+              by: str,
+              value: str,
+              all_: bool = True,
+              root: Optional[Node] = None) -> List[Node]:
+        found: List[Node] = self._session.find(
+            self._session.context if root is None else root, by, value)
+        return found if all_ else found[:1]
+
+    def _first(self,
+               locators: List[List[str]],
+               all_: bool,
+               root: Optional[Node] = None) -> Tuple[int, List[Node]]:
+        # Nodes of the first locator, which found anything
+        for index, (by, value) in enumerate(locators):
+            try:
+                found: List[Node] = self._find(by, value, all_, root)
+            except WebDriverError:
+                continue
+            if found:
+                return index, found
+        return -1, []
+
+    def _profile(self,
+                 by: str,
+                 value: str,
+                 repeat: int,
+                 scope: Optional[List[str]] = None) -> List[Any]:
+        times: List[float] = []
+        count: int = 0
+        root: Optional[Node] = None
+        if scope:
+            try:
+                roots: List[Node] = self._find(scope[0], scope[1], False)
+            except WebDriverError as error:
+                return [0, 0, 0, str(error)]
+            if not roots:
+                return [0, 0, 0, 'root element is not found']
+            root = roots[0]
+        for _ in range(repeat):
+            start: float = perf_counter()
+            try:
+                count = len(self._find(by, value, root=root))
+            except WebDriverError as error:
+                return [0, 0, 0, str(error)]
+            times.append((perf_counter() - start) * 1000)
+        times.sort()
+        return [times[len(times) // 2], times[-1], count, '']
+
+    @staticmethod
+    def _read(node: Node, kind: str, attribute: str) -> Any:
+        if kind in ('value', 'checked', 'selected'):
+            return node.get_property(kind)
+        if kind == 'attribute':
+            return node.get_attribute(attribute)
+        return node.text
+
+    def _helper_find(self,
+                     by: str,
+                     value: str,
+                     all_: bool,
+                     root: Optional[Node] = None) -> List[Node]:
+        return self._find(by, value, all_, root)
+
+    def _helper_findFirst(self,
+                          locators: List[List[str]],
+                          all_: bool,
+                          root: Optional[Node] = None) -> List[Any]:
+        # pylint: disable=invalid-name
+        index, found = self._first(locators, all_, root)
+        if index < 0:
+            return [-1, None]
+        return [index, found if all_ else found[0]]
+
+    def _helper_readFields(self,
+                           requests: List[List[Any]]) -> List[Any]:
+        # pylint: disable=invalid-name
+        result: List[Any] = []
+        for locators, all_, kind, attribute, root in requests:
+            found: List[Node] = self._first(locators, all_, root)[1]
+            if kind == 'count':
+                result.append(len(found))
+                continue
+            values: List[Any] = [self._read(node, kind, attribute)
+                                 for node in found]
+            result.append(values if all_ else (values[0] if values
+                                               else None))
+        return result
+
+    def _helper_runActions(self, actions: List[List[Any]]) -> int:
+        # pylint: disable=invalid-name
+        for index, (kind, locators, fill_value, root) in enumerate(actions):
+            found: List[Node] = self._first(locators, False, root)[1]
+            if not found:
+                return index
+            node: Node = found[0]
+            if kind != 'fill':
+                self._session.remote_end.click(self._session, node)
+            elif node.is_checkable:
+                node.checked = bool(fill_value)
+            else:
+                node.value = str(fill_value)
+        return -1
+
+    @staticmethod
+    def _helper_scrollTo(element: Node, offset: int):
+        # pylint: disable=invalid-name,unused-argument
+        return None
+
+
+class FakeRemoteEnd:
+    """
+    Local stand-in for a browser: HTTP server, which implements W3C
+    WebDriver endpoints used by shawl over an in-memory DOM.
+
+    Pages are HTML strings registered by url, navigation to unknown url
+    opens an empty page. Each request is delayed by `latency` seconds
+    to emulate network round trip of a remote browser.
+
+    For example::
+
+
+        with FakeRemoteEnd({'http://app/': '<title>App</title>'}) as remote:
+            driver = webdriver.Remote(remote.url, {'browserName': 'fake'})
+            driver.get('http://app/')
+            assert driver.title == 'App'
+    """
+
+    def __init__(self,
+                 pages: Optional[Dict[str, str]] = None,
+                 latency: float = 0.0,
+                 host: str = '127.0.0.1',
+                 port: int = 0):
+        self.pages: Dict[str, str] = dict(pages or dict())
+        self.latency: float = latency
+        self.requests: int = 0
+        self._address: Tuple[str, int] = (host, port)
+        self._sessions: Dict[str, _Session] = dict()
+        self._lock: Lock = Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._routes: List[Tuple[str, Any, Callable[..., Any]]] = [
+            (method, re.compile(f'^{pattern}$'), handler)
+            for method, pattern, handler in self._route_table()]
+
+    def __enter__(self) -> 'FakeRemoteEnd':
+        return self.start()
+
+    def __exit__(self, *args: Any):
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError('Remote end is not started')
+        return f'http://{self._address[0]}:{self._server.server_port}'
+
+    def add_page(self, url: str, html: str):
+        self.pages[url] = html
+
+    def add_page_from_file(self, url: str, path: str):
+        with open(path, encoding='utf-8') as file:
+            self.add_page(url, file.read())
+
+    def start(self) -> 'FakeRemoteEnd':
+        remote_end: FakeRemoteEnd = self
+
+        class Handler(_Handler):
+            owner = remote_end
+
+        self._server = ThreadingHTTPServer(self._address, Handler)
+        self._server.daemon_threads = True
+        Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def handle(self, method: str, path: str, body: Any) -> Tuple[int, Any]:
+        """
+        Handle W3C command and return HTTP status and `value` of response.
+        """
+        if self.latency:
+            sleep(self.latency)
+        with self._lock:
+            self.requests += 1
+            try:
+                for route_method, pattern, handler in self._routes:
+                    match = pattern.match(path)
+                    if route_method == method and match:
+                        return 200, handler(body or dict(),
+                                            *match.groups())
+                raise WebDriverError(404, 'unknown command',
+                                     f'{method} {path}')
+            except WebDriverError as error:
+                return error.status, {'error': error.error,
+                                      'message': str(error),
+                                      'stacktrace': ''}
+
+    def click(self, session: _Session, node: Node):
+        node.click()
+        href: Optional[str] = node.attrs.get('href')
+        if node.tag == 'a' and href and not href.startswith('#'):
+            session.navigate(urljoin(session.top.url, href))
+
+    def _session(self, session_id: str) -> _Session:
+        session: Optional[_Session] = self._sessions.get(session_id)
+        if session is None:
+            raise WebDriverError(404, 'invalid session id',
+                                 f'Unknown session {session_id}')
+        return session
+
+    def _route_table(self) -> List[Tuple[str, str, Callable[..., Any]]]:
+        session: str = '/session/([^/]+)'
+        element: str = f'{session}/element/([^/]+)'
+        return [
+            ('GET', '/status', self._status),
+            ('POST', '/session', self._new_session),
+            ('DELETE', session, self._delete_session),
+            ('POST', f'{session}/timeouts', self._none),
+            ('POST', f'{session}/url', self._get),
+            ('GET', f'{session}/url', self._current_url),
+            ('GET', f'{session}/title', self._title),
+            ('POST', f'{session}/refresh', self._refresh),
+            ('POST', f'{session}/back', self._back),
+            ('POST', f'{session}/forward', self._forward),
+            ('GET', f'{session}/window', self._window),
+            ('GET', f'{session}/window/handles', self._window_handles),
+            ('POST', f'{session}/window', self._none),
+            ('DELETE', f'{session}/window', self._close_window),
+            ('GET', f'{session}/window/rect', self._window_rect),
+            ('POST', f'{session}/window/rect', self._window_rect),
+            ('POST', f'{session}/window/maximize', self._window_rect),
+            ('POST', f'{session}/frame', self._switch_to_frame),
+            ('POST', f'{session}/frame/parent', self._switch_to_parent),
+            ('GET', f'{session}/cookie', self._cookies),
+            ('POST', f'{session}/cookie', self._add_cookie),
+            ('DELETE', f'{session}/cookie', self._delete_cookies),
+            ('DELETE', f'{session}/cookie/([^/]+)', self._delete_cookie),
+            ('POST', f'{session}/execute/sync', self._execute_script),
+            ('GET', f'{session}/screenshot', self._screenshot),
+            ('POST', f'{session}/log', self._logs),
+            ('GET', f'{session}/element/active', self._active_element),
+            ('POST', f'{session}/element', self._find_element),
+            ('POST', f'{session}/elements', self._find_elements),
+            ('POST', f'{element}/element', self._find_child_element),
+            ('POST', f'{element}/elements', self._find_child_elements),
+            ('POST', f'{element}/click', self._click),
+            ('POST', f'{element}/clear', self._clear),
+            ('POST', f'{element}/value', self._send_keys),
+            ('GET', f'{element}/text', self._text),
+            ('GET', f'{element}/name', self._tag_name),
+            ('GET', f'{element}/attribute/([^/]+)', self._attribute),
+            ('GET', f'{element}/property/([^/]+)', self._property),
+            ('GET', f'{element}/css/([^/]+)', self._css_value),
+            ('GET', f'{element}/rect', self._rect),
+            ('GET', f'{element}/enabled', self._enabled),
+            ('GET', f'{element}/selected', self._selected),
+            ('GET', f'{element}/displayed', self._displayed),
+            ('GET', f'{element}/screenshot', self._screenshot),
+            ]
+
+    # pylint: disable=unused-argument
+
+    @staticmethod
+    def _none(body: Dict[str, Any], *args: str) -> None:
+        return None
+
+    @staticmethod
+    def _logs(body: Dict[str, Any], *args: str) -> List[Any]:
+        return []
+
+    @staticmethod
+    def _status(body: Dict[str, Any]) -> Dict[str, Any]:
+        return {'ready': True, 'message': 'shawl fake remote end'}
+
+    def _new_session(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        session = _Session(self)
+        self._sessions[session.id] = session
+        return {'sessionId': session.id,
+                'capabilities': {'browserName': 'fake',
+                                 'browserVersion': '1',
+                                 'platformName': 'any'}}
+
+    def _delete_session(self, body: Dict[str, Any], session_id: str):
+        self._sessions.pop(session_id, None)
+
+    def _get(self, body: Dict[str, Any], session_id: str):
+        self._session(session_id).navigate(body['url'])
+
+    def _current_url(self, body: Dict[str, Any], session_id: str) -> str:
+        return self._session(session_id).top.url
+
+    def _title(self, body: Dict[str, Any], session_id: str) -> str:
+        return self._session(session_id).top.title
+
+    def _refresh(self, body: Dict[str, Any], session_id: str):
+        session: _Session = self._session(session_id)
+        session.navigate(session.top.url, remember=False)
+
+    def _back(self, body: Dict[str, Any], session_id: str):
+        session: _Session = self._session(session_id)
+        session.position = max(0, session.position - 1)
+        session.navigate(session.history[session.position], remember=False)
+
+    def _forward(self, body: Dict[str, Any], session_id: str):
+        session: _Session = self._session(session_id)
+        session.position = min(len(session.history) - 1,
+                               session.position + 1)
+        session.navigate(session.history[session.position], remember=False)
+
+    def _window(self, body: Dict[str, Any], session_id: str) -> str:
+        self._session(session_id)
+        return _HANDLE
+
+    def _window_handles(self,
+                        body: Dict[str, Any],
+                        session_id: str) -> List[str]:
+        self._session(session_id)
+        return [_HANDLE]
+
+    def _close_window(self,
+                      body: Dict[str, Any],
+                      session_id: str) -> List[str]:
+        self._sessions.pop(session_id, None)
+        return []
+
+    @staticmethod
+    def _window_rect(body: Dict[str, Any],
+                     session_id: str) -> Dict[str, int]:
+        return {'x': 0, 'y': 0, 'width': 1280, 'height': 1024}
+
+    def _switch_to_frame(self, body: Dict[str, Any], session_id: str):
+        session: _Session = self._session(session_id)
+        frame: Any = body.get('id')
+        if frame is None:
+            session.context = session.top
+            return
+        if isinstance(frame, int):
+            frames: List[Node] = session.find(session.context,
+                                              'css selector',
+                                              'iframe, frame')
+            if frame >= len(frames):
+                raise WebDriverError(404, 'no such frame',
+                                     f'No frame with index {frame}')
+            node: Node = frames[frame]
+        else:
+            node = session.node(frame)
+        session.context = session.context.frame_content(node)
+
+    def _switch_to_parent(self, body: Dict[str, Any], session_id: str):
+        session: _Session = self._session(session_id)
+        for document in self._frame_path(session):
+            if any(node.content is session.context
+                   for node in document.descendants()):
+                session.context = document
+                return
+        session.context = session.top
+
+    @staticmethod
+    def _frame_path(session: _Session) -> List[Document]:
+        documents: List[Document] = [session.top]
+        index: int = 0
+        while index < len(documents):
+            documents.extend(node.content for node
+                             in documents[index].descendants()
+                             if node.content is not None)
+            index += 1
+        return documents
+
+    def _cookies(self,
+                 body: Dict[str, Any],
+                 session_id: str) -> List[Dict[str, Any]]:
+        return list(self._session(session_id).cookies.values())
+
+    def _add_cookie(self, body: Dict[str, Any], session_id: str):
+        cookie: Dict[str, Any] = body['cookie']
+        self._session(session_id).cookies[cookie['name']] = cookie
+
+    def _delete_cookies(self, body: Dict[str, Any], session_id: str):
+        self._session(session_id).cookies.clear()
+
+    def _delete_cookie(self,
+                       body: Dict[str, Any],
+                       session_id: str,
+                       name: str):
+        self._session(session_id).cookies.pop(name, None)
+
+    def _execute_script(self, body: Dict[str, Any], session_id: str) -> Any:
+        session: _Session = self._session(session_id)
+        args: List[Any] = session.unwrap(body.get('args', []))
+        return session.wrap(_Scripts(session).execute(body['script'], args))
+
+    @staticmethod
+    def _screenshot(body: Dict[str, Any], *args: str) -> str:
+        return ''
+
+    def _active_element(self,
+                        body: Dict[str, Any],
+                        session_id: str) -> Dict[str, str]:
+        session: _Session = self._session(session_id)
+        return session.reference(session.context.body)
+
+    def _find_in(self, session: _Session, root: Node,
+                 body: Dict[str, Any]) -> List[Node]:
+        return session.find(root, body['using'], body['value'])
+
+    def _find_element(self,
+                      body: Dict[str, Any],
+                      session_id: str) -> Dict[str, str]:
+        session: _Session = self._session(session_id)
+        found: List[Node] = self._find_in(session, session.context, body)
+        if not found:
+            raise _no_such_element(body['using'], body['value'])
+        return session.reference(found[0])
+
+    def _find_elements(self,
+                       body: Dict[str, Any],
+                       session_id: str) -> List[Dict[str, str]]:
+        session: _Session = self._session(session_id)
+        return [session.reference(node)
+                for node in self._find_in(session, session.context, body)]
+
+    def _find_child_element(self,
+                            body: Dict[str, Any],
+                            session_id: str,
+                            element_id: str) -> Dict[str, str]:
+        session: _Session = self._session(session_id)
+        found: List[Node] = self._find_in(session,
+                                          session.node(element_id),
+                                          body)
+        if not found:
+            raise _no_such_element(body['using'], body['value'])
+        return session.reference(found[0])
+
+    def _find_child_elements(self,
+                             body: Dict[str, Any],
+                             session_id: str,
+                             element_id: str) -> List[Dict[str, str]]:
+        session: _Session = self._session(session_id)
+        return [session.reference(node) for node
+                in self._find_in(session, session.node(element_id), body)]
+
+    def _element(self, session_id: str, element_id: str) -> Node:
+        return self._session(session_id).node(element_id)
+
+    def _click(self, body: Dict[str, Any], session_id: str, element_id: str):
+        session: _Session = self._session(session_id)
+        node: Node = session.node(element_id)
+        if not node.is_displayed:
+            raise WebDriverError(400, 'element not interactable',
+                                 'Element is not visible')
+        self.click(session, node)
+
+    def _clear(self, body: Dict[str, Any], session_id: str, element_id: str):
+        self._element(session_id, element_id).value = ''
+
+    def _send_keys(self,
+                   body: Dict[str, Any],
+                   session_id: str,
+                   element_id: str):
+        node: Node = self._element(session_id, element_id)
+        node.value = str(node.get_property('value')) + body.get('text', '')
+
+    def _text(self,
+              body: Dict[str, Any],
+              session_id: str,
+              element_id: str) -> str:
+        return self._element(session_id, element_id).text
+
+    def _tag_name(self,
+                  body: Dict[str, Any],
+                  session_id: str,
+                  element_id: str) -> str:
+        return self._element(session_id, element_id).tag
+
+    def _attribute(self,
+                   body: Dict[str, Any],
+                   session_id: str,
+                   element_id: str,
+                   name: str) -> Optional[str]:
+        return self._element(session_id, element_id).get_attribute(name)
+
+    def _property(self,
+                  body: Dict[str, Any],
+                  session_id: str,
+                  element_id: str,
+                  name: str) -> Any:
+        return self._element(session_id, element_id).get_property(name)
+
+    def _css_value(self,
+                   body: Dict[str, Any],
+                   session_id: str,
+                   element_id: str,
+                   name: str) -> str:
+        self._element(session_id, element_id)
+        return ''
+
+    def _rect(self,
+              body: Dict[str, Any],
+              session_id: str,
+              element_id: str) -> Dict[str, int]:
+        node: Node = self._element(session_id, element_id)
+        index: int = 0
+        for index, other in enumerate(node.root.descendants()):
+            if other is node:
+                break
+        return {'x': 0, 'y': index * 20, 'width': 100, 'height': 20}
+
+    def _enabled(self,
+                 body: Dict[str, Any],
+                 session_id: str,
+                 element_id: str) -> bool:
+        return self._element(session_id, element_id).is_enabled
+
+    def _selected(self,
+                  body: Dict[str, Any],
+                  session_id: str,
+                  element_id: str) -> bool:
+        node: Node = self._element(session_id, element_id)
+        return node.checked or node.selected
+
+    def _displayed(self,
+                   body: Dict[str, Any],
+                   session_id: str,
+                   element_id: str) -> bool:
+        return self._element(session_id, element_id).is_displayed
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Response is written at once, so that client does not wait
+    # for delayed ACK of headers
+    wbufsize = -1
+    disable_nagle_algorithm = True
+    owner: FakeRemoteEnd
+
+    def _handle(self):
+        length: int = int(self.headers.get('Content-Length') or 0)
+        raw: bytes = self.rfile.read(length) if length else b''
+        try:
+            body: Any = json.loads(raw) if raw.strip() else dict()
+        except ValueError:
+            body = dict()
+        path: str = self.path.split('?')[0].rstrip('/')
+        if path.startswith('/wd/hub'):
+            path = path[len('/wd/hub'):]
+        status, value = self.owner.handle(self.command, path, body)
+        data: bytes = json.dumps({'value': value}).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_DELETE = _handle
+
+    def log_message(self, *args: Any):
+        # pylint: disable=arguments-differ
+        pass
+
+
+__all__ = ['FakeRemoteEnd', 'WebDriverError']
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=too-many-instance-attributes,too-few-public-methods
+import json
+from copy import deepcopy
+from threading import Lock
+from time import sleep
+from typing import Any, Counter, Dict, List, Optional, Union
+
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from ..exceptions import ReplayMismatchException
+from ..utils._recorder import RecordedCommand, Recording, strip_session
+
+REPLAY_SESSION_ID = 'replay'
+
+
+def _key(command: str, params: Dict[str, Any]) -> str:
+    return command + json.dumps(params, sort_keys=True, default=str)
+
+
+class ReplayConnection:
+    """
+    Command executor, which answers commands with responses of
+    a recording instead of a remote end. Each answer is delayed by
+    recorded duration multiplied by `time_scale`, 0 disables delays.
+
+    Commands are matched in order of a recording: the next command with
+    the same parameters is used. If `strict` is not set, the next command
+    with the same name is used when there is no such command, so changed
+    parameters (e.g. typed text) don't fail replay. Skipped commands of
+    a recording are counted in `skipped`, commands, which were sent,
+    in `requested`.
+    """
+
+    def __init__(self,
+                 recording: Recording,
+                 time_scale: float = 1.0,
+                 strict: bool = True):
+        self.recording: Recording = recording
+        self.time_scale: float = time_scale
+        self.strict: bool = strict
+        self.w3c: bool = recording.w3c
+        self.position: int = 0
+        self.skipped: int = 0
+        self.requested: Counter[str] = Counter()
+        self._keys: List[str] = [_key(record.command, record.params)
+                                 for record in recording.commands]
+        self._lock: Lock = Lock()
+
+    def execute(self,
+                command: str,
+                params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        sent: Dict[str, Any] = strip_session(params)
+        with self._lock:
+            self.requested[command] += 1
+            record: Optional[RecordedCommand] = self._next(command, sent)
+        if record is None:
+            if command == Command.NEW_SESSION:
+                return self._new_session()
+            if command == Command.QUIT:
+                return {'value': None}
+            raise ReplayMismatchException(
+                f'Command "{command}" with parameters {sent} '
+                f'is not found in recording after position {self.position}')
+        if self.time_scale:
+            sleep(record.elapsed * self.time_scale)
+        # Driver changes response, so that it can't be used twice
+        return dict(deepcopy(record.response))
+
+    def _next(self,
+              command: str,
+              params: Dict[str, Any]) -> Optional[RecordedCommand]:
+        key: str = _key(command, params)
+        commands: List[RecordedCommand] = self.recording.commands
+        found: Optional[int] = next(
+            (index for index in range(self.position, len(commands))
+             if self._keys[index] == key), None)
+        if found is None and not self.strict:
+            found = next(
+                (index for index in range(self.position, len(commands))
+                 if commands[index].command == command), None)
+        if found is None:
+            return None
+        self.skipped += found - self.position
+        self.position = found + 1
+        return commands[found]
+
+    def _new_session(self) -> Dict[str, Any]:
+        if self.w3c:
+            return {'value': {'sessionId': REPLAY_SESSION_ID,
+                              'capabilities': self.recording.capabilities}}
+        return {'status': 0,
+                'sessionId': REPLAY_SESSION_ID,
+                'value': self.recording.capabilities}
+
+
+def replay(recording: Union[str, Recording],
+           time_scale: float = 1.0,
+           strict: bool = True) -> WebDriver:
+    """
+    Create WebDriver, which replays `recording` (or a file with it)
+    with original timing multiplied by `time_scale`. Commands must have
+    recorded parameters, unless `strict` is False (see `ReplayConnection`).
+
+    For example::
+
+
+        driver = replay('search.jsonl.gz', time_scale=0)
+        page = SearchPage(driver)
+        with Profiler() as profiler:
+            page.click_on_search_btn()
+    """
+    if isinstance(recording, str):
+        recording = Recording.load(recording)
+    return WebDriver(command_executor=ReplayConnection(recording,
+                                                       time_scale,
+                                                       strict),
+                     desired_capabilities=dict(recording.capabilities))
+
+
+__all__ = ['REPLAY_SESSION_ID', 'ReplayConnection', 'replay']
@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+from ._pooled_connection import (
+    LatencyHook,
+    PooledConnection,
+    clear_pools,
+    connect
+)
+
+__all__ = ['LatencyHook', 'PooledConnection', 'clear_pools', 'connect']
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+import json
+import string
+from collections import namedtuple
+from importlib import import_module
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib import parse
+
+import urllib3
+from selenium.webdriver.remote.errorhandler import ErrorCode
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# Called with command name, HTTP status and request duration in seconds
+LatencyHook = Callable[[str, int, float], None]
+
+_CODEC = namedtuple('_CODEC', ['name', 'dumps', 'loads'])
+_FAST_JSON_MODULES = ('orjson', 'ujson')
+
+_POOLS: Dict[Tuple[Any, ...], urllib3.PoolManager] = dict()
+_POOLS_LOCK = Lock()
+
+
+def get_json_codec(fast: bool = False) -> _CODEC:
+    """
+    Return JSON functions for commands encoding. If `fast` is set,
+    the first installed of `orjson` and `ujson` is used,
+    otherwise (or if none of them is installed) standard `json`.
+    """
+    if fast:
+        for name in _FAST_JSON_MODULES:
+            try:
+                module: Any = import_module(name)
+            except ImportError:
+                continue
+            return _CODEC(name=name,
+                          dumps=module.dumps,
+                          loads=module.loads)
+    return _CODEC(name='json',
+                  dumps=json.dumps,
+                  loads=json.loads)
+
+
+def get_pool_manager(url: str,
+                     pool_size: int,
+                     connect_timeout: Optional[float],
+                     read_timeout: Optional[float]) -> urllib3.PoolManager:
+    """
+    Return keep-alive pool of connections, which is shared by
+    all sessions with the same endpoint and settings.
+    """
+    parsed = parse.urlparse(url)
+    key: Tuple[Any, ...] = (parsed.scheme, parsed.netloc, pool_size,
+                            connect_timeout, read_timeout)
+    with _POOLS_LOCK:
+        if key not in _POOLS:
+            _POOLS[key] = urllib3.PoolManager(
+                maxsize=pool_size,
+                block=False,
+                retries=False,
+                timeout=urllib3.Timeout(connect=connect_timeout,
+                                        read=read_timeout))
+        return _POOLS[key]
+
+
+def clear_pools():
+    """
+    Close all shared connections.
+    """
+    with _POOLS_LOCK:
+        for manager in _POOLS.values():
+            manager.clear()
+        _POOLS.clear()
+
+
+class PooledConnection(RemoteConnection):
+    """
+    Command executor, which sends commands through keep-alive pool of
+    connections shared with other sessions to the same endpoint.
+
+    It can be used anywhere instead of `RemoteConnection`, pages and
+    elements work with such drivers without any changes.
+
+    For example::
+
+
+        executor = PooledConnection('http://hub:4444/wd/hub',
+                                    pool_size=32,
+                                    fast_json=True)
+        executor.add_latency_hook(
+            lambda command, status, elapsed: print(command, elapsed))
+        driver = webdriver.Remote(
+            command_executor=executor,
+            desired_capabilities={'browserName': 'chrome'})
+        page = CustomPage(driver)
+    """
+
+    def __init__(self,
+                 remote_server_addr: str,
+                 pool_size: int = 10,
+                 connect_timeout: Optional[float] = 10,
+                 read_timeout: Optional[float] = None,
+                 fast_json: bool = False,
+                 resolve_ip: bool = False):
+        # pylint: disable=too-many-arguments
+        super().__init__(remote_server_addr,
+                         keep_alive=False,
+                         resolve_ip=resolve_ip)
+        self.keep_alive = True
+        self._conn: urllib3.PoolManager = get_pool_manager(
+            self._url,
+            pool_size,
+            connect_timeout,
+            read_timeout)
+        self._json: _CODEC = get_json_codec(fast_json)
+        self._latency_hooks: List[LatencyHook] = []
+
+    @property
+    def json_module(self) -> str:
+        return str(self._json.name)
+
+    def add_latency_hook(self, hook: LatencyHook):
+        self._latency_hooks.append(hook)
+
+    def remove_latency_hook(self, hook: LatencyHook):
+        if hook in self._latency_hooks:
+            self._latency_hooks.remove(hook)
+
+    def execute(self,
+                command: str,
+                params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        command_info: Optional[Tuple[str, str]] = self._commands.get(command)
+        assert command_info is not None, f'Unrecognised command {command}'
+        path: str = string.Template(command_info[1]).substitute(
+            params or dict())
+        if (getattr(self, 'w3c', False) and isinstance(params, dict)
+                and 'sessionId' in params):
+            del params['sessionId']
+        body: Any = self._json.dumps(params)
+        return self._request(command_info[0],
+                             f'{self._url}{path}',
+                             body=body,
+                             command=command)
+
+    def _request(self,
+                 method: str,
+                 url: str,
+                 body: Any = None,
+                 command: str = '') -> Dict[str, Any]:
+        headers: Dict[str, str] = self.get_remote_connection_headers(
+            parse.urlparse(url), True)
+        if method not in ('POST', 'PUT'):
+            body = None
+
+        start: float = perf_counter()
+        resp: Any = self._conn.request(method, url, body=body,
+                                       headers=headers)
+        try:
+            elapsed: float = perf_counter() - start
+            for hook in self._latency_hooks:
+                hook(command, resp.status, elapsed)
+            return self._parse_response(resp, command)
+        finally:
+            resp.release_conn()
+
+    def _parse_response(self, resp: Any, command: str) -> Dict[str, Any]:
+        status: int = resp.status
+        if 300 <= status < 304:
+            return self._request('GET',
+                                 resp.headers.get('location'),
+                                 command=command)
+        data: str = resp.data.decode('UTF-8')
+        if 399 < status <= 500:
+            return {'status': status, 'value': data}
+        content_type: str = resp.headers.get('Content-Type') or ''
+        if content_type.startswith('image/png'):
+            return {'status': 0, 'value': data}
+        try:
+            response: Any = self._json.loads(data.strip())
+        except ValueError:
+            return {'status': (ErrorCode.SUCCESS if 199 < status < 300
+                               else ErrorCode.UNKNOWN_ERROR),
+                    'value': data.strip()}
+        # Some of the drivers return a response without 'value'
+        # when they should return null
+        if 'value' not in response:
+            response['value'] = None
+        return dict(response)
+
+
+def connect(remote_server_addr: str,
+            desired_capabilities: Dict[str, Any],
+            **options: Any) -> WebDriver:
+    """
+    Create remote WebDriver session, which uses PooledConnection
+    with `options`.
+    """
+    return WebDriver(
+        command_executor=PooledConnection(remote_server_addr, **options),
+        desired_capabilities=desired_capabilities)
+
+
+__all__ = [
+    'LatencyHook',
+    'PooledConnection',
+    'clear_pools',
+    'connect',
+    'get_json_codec',
+    'get_pool_manager'
+    ]
@@ -1,8 +1,70 @@
 # -*- coding: utf-8 -*-
-from ._stubber import create_stubs
-from ._waits import wait_until
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._budget import Budget, budget
+    from ._commands import CommandHook, add_command_hook, remove_command_hook
+    from ._handles import HandleRegistry, registered_pages, release_handles
+    from ._locator_profiler import profile_locators
+    from ._profiler import Profiler
+    from ._read_cache import CachingDriver
+    from ._recorder import Recorder, Recording
+    from ._stubber import create_stubs
+    from ._timing_stats import TimingStats, save_timing_stats
+    from ._waits import wait_until
+
+# Modules of exported names, which are imported on first access
+# of a name as modules of `shawl` exports
+_EXPORTS: Dict[str, str] = {
+    'Budget': '._budget',
+    'budget': '._budget',
+    'CommandHook': '._commands',
+    'add_command_hook': '._commands',
+    'remove_command_hook': '._commands',
+    'HandleRegistry': '._handles',
+    'registered_pages': '._handles',
+    'release_handles': '._handles',
+    'profile_locators': '._locator_profiler',
+    'Profiler': '._profiler',
+    'CachingDriver': '._read_cache',
+    'Recorder': '._recorder',
+    'Recording': '._recorder',
+    'create_stubs': '._stubber',
+    'TimingStats': '._timing_stats',
+    'save_timing_stats': '._timing_stats',
+    'wait_until': '._waits'
+    }
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value: Any = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
+    'Budget',
+    'CachingDriver',
+    'CommandHook',
+    'HandleRegistry',
+    'Profiler',
+    'Recorder',
+    'Recording',
+    'TimingStats',
+    'add_command_hook',
+    'budget',
     'create_stubs',
+    'profile_locators',
+    'registered_pages',
+    'release_handles',
+    'remove_command_hook',
+    'save_timing_stats',
     'wait_until'
     ]
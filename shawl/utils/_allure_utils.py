@@ -1,15 +1,17 @@
 # -*- coding: utf-8 -*-
 from typing import Any, Callable
 
-from allure_commons._allure import StepContext
-from allure_commons.utils import func_parameters
-
 from ..config import SHAWL_CONFIG as CONFIG
 
 
 def callable_with_allure(item_name: str,
                          repr_name: str,
                          callable_: Callable[..., Any]) -> Callable[..., Any]:
+    # allure is imported only when steps are enabled
+    # pylint:disable=import-outside-toplevel
+    from allure_commons._allure import StepContext
+    from allure_commons.utils import func_parameters
+
     default_title: str = CONFIG.step_description['default_title']
     title_pattern: str = CONFIG.step_description.get(item_name, default_title)
 
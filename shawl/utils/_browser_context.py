@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from ._commands import CommandHook, add_command_hook, get_command_hooks
+
+Frames = Tuple[Tuple[str, str], ...]
+
+_NAVIGATION_COMMANDS = frozenset((
+    Command.GET,
+    Command.REFRESH,
+    Command.GO_BACK,
+    Command.GO_FORWARD
+    ))
+
+
+def parse_frames(frame: Any) -> Frames:
+    """
+    Convert `frame` element option to a path of frame locators starting
+    from the top level document. Option can be one locator dict,
+    e.g. `{'css selector': 'iframe#pay'}`, or a list of them for
+    nested frames.
+    """
+    if not frame:
+        return ()
+    if isinstance(frame, dict):
+        frame = [frame]
+    return tuple(list(locator.items())[0] for locator in frame)
+
+
+class BrowserContext(CommandHook):
+    """
+    Command hook which tracks current window and frame of a driver.
+
+    Switch commands are sent only if target window or frame differs
+    from the current one. Switches made directly with `driver.switch_to`
+    and navigation are tracked too.
+    """
+
+    def __init__(self):
+        # None means that current window or frame is unknown
+        self.window: Optional[str] = None
+        self.frames: Optional[Frames] = None
+        self.switches: int = 0
+        self._switching: bool = False
+
+    def after(self,
+              driver: WebDriver,
+              command: str,
+              params: Optional[Dict[str, Any]],
+              response: Optional[Dict[str, Any]],
+              elapsed: float):
+        if response is None:
+            return
+        params = params or dict()
+        if command == Command.SWITCH_TO_WINDOW:
+            self.window = params.get('handle', params.get('name'))
+            self.frames = ()
+        elif command == Command.CLOSE:
+            self.window = None
+            self.frames = None
+        elif command in _NAVIGATION_COMMANDS:
+            self.frames = ()
+        elif self._switching:
+            return
+        elif command == Command.SWITCH_TO_FRAME:
+            self.frames = () if params.get('id') is None else None
+        elif command == Command.SWITCH_TO_PARENT_FRAME and self.frames:
+            self.frames = self.frames[:-1]
+
+    def switch(self,
+               driver: WebDriver,
+               frames: Frames = (),
+               window: Optional[str] = None):
+        """
+        Switch `driver` to `frames` of `window`, if it is not there yet.
+        If `window` is None, current window is used.
+        """
+        if window is not None and window != self.window:
+            driver.switch_to.window(window)
+            self.switches += 1
+        current: Optional[Frames] = self.frames
+        if current == frames:
+            return
+        self._switching = True
+        try:
+            self._switch_frames(driver, current, frames)
+            self.frames = frames
+        except Exception:
+            self.frames = None
+            raise
+        finally:
+            self._switching = False
+
+    def _switch_frames(self,
+                       driver: WebDriver,
+                       current: Optional[Frames],
+                       frames: Frames):
+        if current is not None and frames and frames == current[:len(frames)]:
+            # Target is a parent of current frame,
+            # go up if it is cheaper than entering frames from the top
+            steps_up: int = len(current) - len(frames)
+            if steps_up <= 1 + 2 * len(frames):
+                for _ in range(steps_up):
+                    driver.switch_to.parent_frame()
+                    self.switches += 1
+                return
+        if current is None or current != frames[:len(current)]:
+            driver.switch_to.default_content()
+            self.switches += 1
+            current = ()
+        for locator in frames[len(current):]:
+            driver.switch_to.frame(driver.find_element(*locator))
+            self.switches += 1
+
+    @contextmanager
+    def scope(self,
+              driver: WebDriver,
+              frames: Frames = (),
+              window: Optional[str] = None) -> Iterator[WebDriver]:
+        """
+        Switch to `frames` of `window` inside `with` block and switch
+        back to previous window and frame on exit.
+        """
+        previous_window: Optional[str] = self.window
+        previous_frames: Optional[Frames] = self.frames
+        self.switch(driver, frames, window)
+        try:
+            yield driver
+        finally:
+            if previous_frames is not None:
+                self.switch(driver, previous_frames, previous_window)
+            elif previous_window is not None:
+                self.switch(driver, (), previous_window)
+
+
+def find_browser_context(driver: Any) -> Optional[BrowserContext]:
+    hooks: List[CommandHook] = get_command_hooks(driver)
+    for hook in hooks:
+        if isinstance(hook, BrowserContext):
+            return hook
+    return None
+
+
+def get_browser_context(driver: Any) -> BrowserContext:
+    """
+    Return context tracker of `driver`, it will be created on first call.
+    """
+    context: Optional[BrowserContext] = find_browser_context(driver)
+    if context is None:
+        context = BrowserContext()
+        add_command_hook(driver, context)
+    return context
+
+
+def switch_context(driver: Any, frames: Frames):
+    """
+    Switch `driver` to `frames` of current window before element lookup.
+    Elements without frames switch to the top level document only if
+    driver is known to be in frames entered for other elements. If frame
+    is unknown (e.g. it was switched to directly), it is kept as is.
+    """
+    if frames:
+        get_browser_context(driver).switch(driver, frames)
+    else:
+        context: Optional[BrowserContext] = find_browser_context(driver)
+        if context is not None and context.frames:
+            context.switch(driver)
+
+
+__all__ = [
+    'BrowserContext',
+    'Frames',
+    'find_browser_context',
+    'get_browser_context',
+    'parse_frames',
+    'switch_context'
+    ]
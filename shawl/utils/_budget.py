@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+from contextlib import ContextDecorator
+from contextvars import ContextVar, Token
+from threading import Lock
+from typing import Any, Counter, Dict, List, Optional, Tuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from ..exceptions import BudgetExceededException
+from ._commands import (
+    CommandHook,
+    add_global_command_hook,
+    remove_global_command_hook
+)
+from ._waits import add_wait_listener, remove_wait_listener
+
+_ACTIVE: ContextVar[Tuple['Budget', ...]] = ContextVar('shawl_budgets',
+                                                       default=())
+
+
+class _BudgetHook(CommandHook):
+    """
+    Global hook, which counts commands for budgets active
+    in current context. It is installed while any budget is active.
+    """
+
+    def __init__(self):
+        self._lock: Lock = Lock()
+        self._users: int = 0
+
+    def acquire(self):
+        with self._lock:
+            if not self._users:
+                add_global_command_hook(self)
+                add_wait_listener(self.on_wait)
+            self._users += 1
+
+    def release(self):
+        with self._lock:
+            self._users -= 1
+            if not self._users:
+                remove_global_command_hook(self)
+                remove_wait_listener(self.on_wait)
+
+    def after(self,
+              driver: WebDriver,
+              command: str,
+              params: Optional[Dict[str, Any]],
+              response: Optional[Dict[str, Any]],
+              elapsed: float):
+        for active in _ACTIVE.get():
+            active.commands[command] += 1
+
+    @staticmethod
+    def on_wait(driver: WebDriver,
+                timeout: float,
+                polls: int,
+                elapsed: float,
+                sleep: float,
+                result: bool):
+        # pylint: disable=too-many-arguments,unused-argument
+        for active in _ACTIVE.get():
+            active.wait_seconds += elapsed
+
+
+_HOOK = _BudgetHook()
+
+
+class Budget(ContextDecorator):
+    """
+    Limit of WebDriver commands and time of waits inside a block.
+    BudgetExceededException is raised on exit from the block, if it sent
+    more than `max_commands` commands or waited more than
+    `max_wait_seconds` seconds. Commands answered without a round trip
+    (e.g. memoized by CachingDriver) are not counted.
+
+    Only commands sent from current thread (or asyncio task) are counted,
+    nested budgets count commands of inner blocks too. Decorated function
+    gets a fresh budget with the same limits on each call, so that
+    concurrent calls don't share counters.
+    """
+
+    def __init__(self,
+                 max_commands: Optional[int] = None,
+                 max_wait_seconds: Optional[float] = None):
+        self.max_commands: Optional[int] = max_commands
+        self.max_wait_seconds: Optional[float] = max_wait_seconds
+        self.commands: Counter[str] = Counter()
+        self.wait_seconds: float = 0.0
+        self._tokens: List['Token[Tuple[Budget, ...]]'] = []
+
+    def _recreate_cm(self) -> 'Budget':
+        return self.__class__(self.max_commands, self.max_wait_seconds)
+
+    def __enter__(self) -> 'Budget':
+        if not self._tokens:
+            self.commands = Counter()
+            self.wait_seconds = 0.0
+        _HOOK.acquire()
+        self._tokens.append(_ACTIVE.set(_ACTIVE.get() + (self,)))
+        return self
+
+    def __exit__(self, exc_type: Any, *args: Any):
+        _ACTIVE.reset(self._tokens.pop())
+        _HOOK.release()
+        if exc_type is None:
+            self.check()
+
+    @property
+    def total_commands(self) -> int:
+        return sum(self.commands.values())
+
+    def check(self):
+        """
+        Raise BudgetExceededException if budget is exceeded.
+        """
+        errors: List[str] = []
+        if (self.max_commands is not None
+                and self.total_commands > self.max_commands):
+            sent: str = ', '.join(f'{command}: {count}' for command, count
+                                  in self.commands.most_common())
+            errors.append(f'{self.total_commands} commands were sent, '
+                          f'budget is {self.max_commands} ({sent})')
+        if (self.max_wait_seconds is not None
+                and self.wait_seconds > self.max_wait_seconds):
+            errors.append(f'waits took {self.wait_seconds:.3f} s, '
+                          f'budget is {self.max_wait_seconds} s')
+        if errors:
+            raise BudgetExceededException('Budget exceeded: '
+                                          + '; '.join(errors))
+
+
+def budget(max_commands: Optional[int] = None,
+           max_wait_seconds: Optional[float] = None) -> Budget:
+    """
+    Create Budget, which can be used as context manager or decorator.
+
+    For example::
+
+
+        @budget(max_commands=6)
+        def test_search(page):
+            page.click_on_search_btn()
+
+
+        with budget(max_commands=2, max_wait_seconds=1):
+            page.search_input.send_keys('shawl')
+    """
+    return Budget(max_commands, max_wait_seconds)
+
+
+__all__ = ['Budget', 'budget']
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+from time import perf_counter
+from types import MethodType
+from typing import Any, Dict, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+_HOOKS_ATTR = '_shawl_command_hooks'
+_ORIGINAL_EXECUTE = WebDriver.execute
+_GLOBAL_HOOKS: List['CommandHook'] = []
+
+
+class CommandHook:
+    """
+    Base class for hooks of WebDriver commands.
+
+    Hook is called for every command which is sent by a driver,
+    including commands of WebElement instances found by this driver.
+    """
+
+    def before(self,
+               driver: WebDriver,
+               command: str,
+               params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Called before command is sent.
+        If response is returned, command won't be sent and
+        this response will be used instead.
+        """
+        # pylint: disable=unused-argument
+        return None
+
+    def after(self,
+              driver: WebDriver,
+              command: str,
+              params: Optional[Dict[str, Any]],
+              response: Optional[Dict[str, Any]],
+              elapsed: float):
+        """
+        Called after command is executed. `response` is None if command
+        raised an exception, `elapsed` is command duration in seconds.
+        """
+
+
+def unwrap_driver(driver: Any) -> WebDriver:
+    """
+    Return WebDriver instance from proxies over it.
+    """
+    while hasattr(driver, '__wrapped__'):
+        driver = driver.__wrapped__
+    return driver
+
+
+def get_command_hooks(driver: Any) -> List[CommandHook]:
+    driver = unwrap_driver(driver)
+    return list(getattr(driver, '__dict__', {}).get(_HOOKS_ATTR, ()))
+
+
+def _execute(driver: WebDriver,
+             command: str,
+             params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    # Hooks of a driver go first, so that commands answered by them
+    # are not seen by global hooks
+    hooks: List[CommandHook] = (driver.__dict__.get(_HOOKS_ATTR, [])
+                                + _GLOBAL_HOOKS)
+    for hook in hooks:
+        cached: Optional[Dict[str, Any]] = hook.before(driver,
+                                                       command,
+                                                       params)
+        if cached is not None:
+            return cached
+    response: Optional[Dict[str, Any]] = None
+    start: float = perf_counter()
+    try:
+        result: Dict[str, Any] = _ORIGINAL_EXECUTE(driver, command, params)
+        response = result
+        return result
+    finally:
+        elapsed: float = perf_counter() - start
+        for hook in hooks:
+            hook.after(driver, command, params, response, elapsed)
+
+
+def add_command_hook(driver: Any, hook: CommandHook):
+    """
+    Add `hook` for all commands sent by `driver`.
+    """
+    driver = unwrap_driver(driver)
+    hooks: List[CommandHook] = driver.__dict__.setdefault(_HOOKS_ATTR, [])
+    if not hooks:
+        driver.execute = MethodType(_execute, driver)
+    hooks.append(hook)
+
+
+def remove_command_hook(driver: Any, hook: CommandHook):
+    """
+    Remove `hook` from `driver`. Commands of driver without hooks
+    are sent without any overhead.
+    """
+    driver = unwrap_driver(driver)
+    hooks: List[CommandHook] = driver.__dict__.get(_HOOKS_ATTR, [])
+    if hook in hooks:
+        hooks.remove(hook)
+    if not hooks:
+        driver.__dict__.pop(_HOOKS_ATTR, None)
+        driver.__dict__.pop('execute', None)
+
+
+def add_global_command_hook(hook: CommandHook):
+    """
+    Add `hook` for all commands sent by all drivers.
+    """
+    if not _GLOBAL_HOOKS:
+        WebDriver.execute = _execute  # type: ignore
+    _GLOBAL_HOOKS.append(hook)
+
+
+def remove_global_command_hook(hook: CommandHook):
+    """
+    Remove global `hook`. If there are no global hooks left,
+    commands of drivers without own hooks are sent without any overhead.
+    """
+    if hook in _GLOBAL_HOOKS:
+        _GLOBAL_HOOKS.remove(hook)
+    if not _GLOBAL_HOOKS:
+        WebDriver.execute = _ORIGINAL_EXECUTE  # type: ignore
+
+
+__all__ = [
+    'CommandHook',
+    'add_command_hook',
+    'add_global_command_hook',
+    'get_command_hooks',
+    'remove_command_hook',
+    'remove_global_command_hook',
+    'unwrap_driver'
+    ]
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+from functools import partial
+from threading import RLock
+from typing import Any, Dict, List, Optional, Tuple
+from weakref import WeakSet, ref
+
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from ..config import SHAWL_CONFIG as CONFIG
+from ._commands import CommandHook, add_command_hook, unwrap_driver
+
+_REGISTRY_ATTR = '_shawl_handle_registry'
+
+# Commands which load a new document or end a session,
+# so all found elements become stale
+_NAVIGATION_COMMANDS = frozenset((
+    Command.GET,
+    Command.GO_BACK,
+    Command.GO_FORWARD,
+    Command.REFRESH,
+    Command.QUIT
+    ))
+
+
+class HandleRegistry(CommandHook):
+    """
+    Accounting of WebElement handles cached by elements and collections
+    of one driver.
+
+    Owners of handles are kept by weak references in least recently used
+    order. When owners cache more than `limit` handles, handles of least
+    recently used owners are released, they are looked up again on next
+    access. All handles are released after navigation commands.
+
+    Pages created with the driver are kept by weak references too,
+    so the registry never keeps a page object alive.
+    """
+
+    def __init__(self, limit: int):
+        self.limit: int = limit
+        self.released: int = 0
+        self._owners: 'OrderedDict[int, Tuple[Any, int]]' = OrderedDict()
+        self._handles: int = 0
+        self._pages: 'WeakSet[Any]' = WeakSet()
+        self._lock: Any = RLock()
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    @property
+    def handles(self) -> int:
+        """
+        Number of cached handles.
+        """
+        return self._handles
+
+    @property
+    def pages(self) -> List[Any]:
+        """
+        Pages of the driver, which are still alive.
+        """
+        return list(self._pages)
+
+    def add_page(self, page: Any):
+        self._pages.add(page)
+
+    def retain(self, owner: Any, count: int):
+        """
+        Account `count` handles cached by `owner` and mark it as the most
+        recently used one. Handles of least recently used owners are
+        released, while there are more than `limit` of them.
+        """
+        key: int = id(owner)
+        evicted: List[Any] = []
+        with self._lock:
+            entry: Optional[Tuple[Any, int]] = self._owners.get(key)
+            if entry is None:
+                owner_ref: Any = ref(owner, partial(self._collected, key))
+            else:
+                owner_ref = entry[0]
+                self._handles -= entry[1]
+                self._owners.move_to_end(key)
+            self._owners[key] = (owner_ref, count)
+            self._handles += count
+            while self._handles > self.limit and len(self._owners) > 1:
+                _, (evicted_ref, number) = self._owners.popitem(last=False)
+                self._handles -= number
+                evicted.append(evicted_ref)
+        self._release(evicted)
+
+    def forget(self, owner: Any):
+        """
+        Stop accounting handles of `owner`, which released them.
+        """
+        with self._lock:
+            entry: Optional[Tuple[Any, int]] = self._owners.pop(id(owner),
+                                                                None)
+            if entry is not None:
+                self._handles -= entry[1]
+
+    def release_all(self):
+        """
+        Release handles of all owners.
+        """
+        with self._lock:
+            evicted: List[Any] = [entry[0] for entry
+                                  in self._owners.values()]
+            self._owners.clear()
+            self._handles = 0
+        self._release(evicted)
+
+    def _release(self, owner_refs: List[Any]):
+        for owner_ref in owner_refs:
+            owner: Any = owner_ref()
+            if owner is not None:
+                owner.release()
+                self.released += 1
+
+    def _collected(self, key: int, owner_ref: Any):
+        # Owner was garbage collected, its handles are gone with it
+        with self._lock:
+            entry: Optional[Tuple[Any, int]] = self._owners.get(key)
+            if entry is not None and entry[0] is owner_ref:
+                del self._owners[key]
+                self._handles -= entry[1]
+
+    def after(self,
+              driver: WebDriver,
+              command: str,
+              params: Optional[Dict[str, Any]],
+              response: Optional[Dict[str, Any]],
+              elapsed: float):
+        if command in _NAVIGATION_COMMANDS:
+            self.release_all()
+
+
+def handle_registry(driver: Any) -> Optional[HandleRegistry]:
+    """
+    Return handle registry of `driver`, which is added on the first call.
+    None is returned if handles are not counted (`SHAWL_MAX_CACHED_HANDLES`
+    is 0) or `driver` is not a WebDriver.
+    """
+    if not CONFIG.max_cached_handles:
+        return None
+    driver = unwrap_driver(driver)
+    if not isinstance(driver, WebDriver):
+        return None
+    registry: Optional[HandleRegistry] = driver.__dict__.get(_REGISTRY_ATTR)
+    if registry is None:
+        registry = HandleRegistry(CONFIG.max_cached_handles)
+        driver.__dict__[_REGISTRY_ATTR] = registry
+        add_command_hook(driver, registry)
+    registry.limit = CONFIG.max_cached_handles
+    return registry
+
+
+def retain_handles(driver: Any, owner: Any, count: int):
+    """
+    Account `count` handles cached by `owner` element or collection
+    of `driver`, if handles are counted.
+    """
+    registry: Optional[HandleRegistry] = handle_registry(driver)
+    if registry is not None:
+        registry.retain(owner, count)
+
+
+def forget_handles(driver: Any, owner: Any):
+    registry: Optional[HandleRegistry] = handle_registry(driver)
+    if registry is not None:
+        registry.forget(owner)
+
+
+def register_page(driver: Any, page: Any):
+    registry: Optional[HandleRegistry] = handle_registry(driver)
+    if registry is not None:
+        registry.add_page(page)
+
+
+def registered_pages(driver: Any) -> List[Any]:
+    """
+    Return pages of `driver`, which are still alive,
+    if handles are counted.
+    """
+    registry: Optional[HandleRegistry] = handle_registry(driver)
+    return [] if registry is None else registry.pages
+
+
+def release_handles(driver: Any):
+    """
+    Release all WebElement handles cached by elements and collections
+    of `driver`, if handles are counted.
+    """
+    registry: Optional[HandleRegistry] = handle_registry(driver)
+    if registry is not None:
+        registry.release_all()
+
+
+__all__ = [
+    'HandleRegistry',
+    'forget_handles',
+    'handle_registry',
+    'register_page',
+    'registered_pages',
+    'release_handles',
+    'retain_handles'
+    ]
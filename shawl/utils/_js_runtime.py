@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+JavaScript helpers library, which is installed once per document.
+
+Helpers are called by name with small arguments, so full library source
+is sent to a browser only when current document has no library
+of current version (e.g. after navigation).
+"""
+from typing import Any
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+RUNTIME_VERSION = '5'
+
+_MISSING = '__shawl_runtime_missing__'
+
+_CALL = '''
+var runtime = window.__shawl;
+if (!runtime || runtime.version !== arguments[0]) {
+    return '%s';
+}
+return runtime.helpers[arguments[1]].apply(null, arguments[2]);
+''' % _MISSING
+
+_LIBRARY = '''
+window.__shawl = (function (version) {
+    var find = function (by, value, all, root) {
+        var doc = document, context = root || document, found = [], i;
+        if (by === 'xpath') {
+            var snapshot = doc.evaluate(value, context, null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (i = 0; i < snapshot.snapshotLength; i++) {
+                found.push(snapshot.snapshotItem(i));
+            }
+        } else if (by === 'link text' || by === 'partial link text') {
+            var links = context.getElementsByTagName('a');
+            for (i = 0; i < links.length; i++) {
+                var text = (links[i].innerText || '').trim();
+                if (by === 'link text' ? text === value
+                        : text.indexOf(value) !== -1) {
+                    found.push(links[i]);
+                }
+            }
+        } else {
+            var css = value;
+            if (by === 'id') {
+                css = '#' + CSS.escape(value);
+            } else if (by === 'class name') {
+                css = '.' + CSS.escape(value);
+            } else if (by === 'name') {
+                css = '[name="' + value.replace(/"/g, '\\\\"') + '"]';
+            }
+            found = Array.prototype.slice.call(
+                context.querySelectorAll(css));
+        }
+        return all ? found : found.slice(0, 1);
+    };
+
+    var first = function (locators, all, root) {
+        for (var i = 0; i < locators.length; i++) {
+            var found = [];
+            try {
+                found = find(locators[i][0], locators[i][1], all, root);
+            } catch (e) {
+                continue;
+            }
+            if (found.length) {
+                return [i, found];
+            }
+        }
+        return [-1, []];
+    };
+
+    var read = function (element, kind, attribute) {
+        switch (kind) {
+            case 'value': return element.value;
+            case 'checked': return element.checked;
+            case 'selected': return element.selected;
+            case 'attribute': return element.getAttribute(attribute);
+            default: return element.innerText;
+        }
+    };
+
+    var setValue = function (element, value) {
+        if (element.type === 'checkbox' || element.type === 'radio') {
+            if (element.checked !== Boolean(value)) {
+                element.click();
+            }
+            return;
+        }
+        var proto = null;
+        if (element instanceof HTMLInputElement) {
+            proto = HTMLInputElement.prototype;
+        } else if (element instanceof HTMLTextAreaElement) {
+            proto = HTMLTextAreaElement.prototype;
+        } else if (element instanceof HTMLSelectElement) {
+            proto = HTMLSelectElement.prototype;
+        }
+        element.focus();
+        if (proto) {
+            Object.getOwnPropertyDescriptor(proto, 'value').set.call(
+                element, value);
+        } else {
+            element.value = value;
+        }
+        element.dispatchEvent(new Event('input', {bubbles: true}));
+        element.dispatchEvent(new Event('change', {bubbles: true}));
+    };
+
+    var helpers = {
+        find: find,
+        findFirst: function (locators, all, root) {
+            var found = first(locators, all, root);
+            if (found[0] < 0) {
+                return [-1, null];
+            }
+            return [found[0], all ? found[1] : found[1][0]];
+        },
+        readFields: function (requests) {
+            return requests.map(function (request) {
+                var found = first(request[0], request[1], request[4])[1];
+                if (request[2] === 'count') {
+                    return found.length;
+                }
+                var values = found.map(function (element) {
+                    return read(element, request[2], request[3]);
+                });
+                return request[1] ? values
+                    : (values.length ? values[0] : null);
+            });
+        },
+        runActions: function (actions) {
+            for (var i = 0; i < actions.length; i++) {
+                var element = first(actions[i][1], false, actions[i][3])[1][0];
+                if (!element) {
+                    return i;
+                }
+                if (actions[i][0] === 'fill') {
+                    setValue(element, actions[i][2]);
+                } else {
+                    element.click();
+                }
+            }
+            return -1;
+        },
+        scrollTo: function (element, offset) {
+            var rect = element.getBoundingClientRect();
+            window.scrollTo(rect.left + window.pageXOffset,
+                            rect.top + window.pageYOffset - offset);
+        }
+    };
+    return {version: version, helpers: helpers};
+})(arguments[0]);
+'''
+
+
+def call_helper(driver: WebDriver, name: str, *args) -> Any:
+    """
+    Call helper `name` from JavaScript library with `args`.
+    Library will be installed into current document if it is absent.
+    """
+    result: Any = driver.execute_script(_CALL, RUNTIME_VERSION, name,
+                                        list(args))
+    if result == _MISSING:
+        result = driver.execute_script(_LIBRARY + _CALL, RUNTIME_VERSION,
+                                       name, list(args))
+    return result
+
+
+__all__ = ['RUNTIME_VERSION', 'call_helper']
@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+"""
+Profiler of locators of page yaml files: each locator is evaluated in
+a browser several times, its cost is measured with `performance.now()`.
+"""
+import re
+from collections import namedtuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from ..config import SHAWL_CONFIG as CONFIG
+from ..core._locators import collect_selectors
+from ..core._page_spec import (
+    TIMING_OPTIONS,
+    load_component_spec,
+    load_fragment,
+    load_page_spec,
+    pop_options
+)
+from ._browser_context import parse_frames, switch_context
+from ._js_runtime import call_helper
+
+LocatorCost = namedtuple('LocatorCost', ['page',
+                                         'element',
+                                         'by',
+                                         'value',
+                                         'median',
+                                         'max',
+                                         'matches',
+                                         'error',
+                                         'warnings',
+                                         'css'])
+
+_NOT_SELECTORS = ('repr', 'keystrokes', 'frame', 'alternatives',
+                  *TIMING_OPTIONS)
+
+# Locator of element, its frame option and locator of root element
+# of component, which element is looked up under
+PageLocator = Tuple[str, Any, str, str, Optional[Tuple[str, str]]]
+
+_PROFILE = '''
+var find = window.__shawl.helpers.find, repeat = arguments[1],
+    scope = arguments[2];
+return arguments[0].map(function (locator) {
+    var times = [], count = 0, root = null, i, start;
+    if (scope) {
+        try {
+            root = find(scope[0], scope[1], false)[0];
+        } catch (e) {
+            return [0, 0, 0, String(e)];
+        }
+        if (!root) {
+            return [0, 0, 0, 'root element is not found'];
+        }
+    }
+    for (i = 0; i < repeat; i++) {
+        start = performance.now();
+        try {
+            count = find(locator[0], locator[1], true, root).length;
+        } catch (e) {
+            return [0, 0, 0, String(e)];
+        }
+        times.push(performance.now() - start);
+    }
+    times.sort(function (a, b) { return a - b; });
+    return [times[Math.floor(times.length / 2)], times[times.length - 1],
+            count, ''];
+});
+'''
+
+# Patterns of slow locators and explanations
+_SLOW_XPATH = (
+    (re.compile(r'^\(*//'), 'leading // scans the whole document'),
+    (re.compile(r'//\*|/\*\['), 'wildcard element scan'),
+    (re.compile(r'contains\(\s*@class'),
+     'class substring scan, CSS class selector is faster'),
+    (re.compile(r'text\(\)|contains\(\s*\.'),
+     'text scan reads text of every candidate'),
+    (re.compile(r'(following|preceding|ancestor)(-sibling)?::'),
+     'reverse or sibling axis'),
+    )
+_SLOW_CSS = (
+    (re.compile(r'^\s*\*|\s\*(\s|$|\[)'), 'universal selector scan'),
+    (re.compile(r'\[[\w-]+[*^$|~]='), 'wildcard attribute scan'),
+    (re.compile(r':(not|has|nth-child|nth-of-type)\('),
+     'complex pseudo-class'),
+    )
+_DEEP_DESCENDANTS = 3
+# Parts of CSS selector, which may contain spaces, and spaces
+# around child and sibling combinators
+_CSS_NESTED = re.compile(r'\[[^\]]*\]|\([^)]*\)|"[^"]*"|\'[^\']*\'')
+_CSS_COMBINATOR = re.compile(r'\s*([>+~])\s*')
+
+_XPATH_STEP = re.compile(r'(//|/)([a-zA-Z][\w-]*|\*)((?:\[[^\]]+\])*)')
+_XPATH_PREDICATE = re.compile(r'\[([^\]]+)\]')
+_CSS_IDENT = re.compile(r'^-?[_a-zA-Z][\w-]*$')
+_XPATH_ATTR = re.compile(
+    r'''^\s*(?:'''
+    r'''@(?P<attr>[\w-]+)\s*=\s*(?P<q>['"])(?P<value>.*?)(?P=q)'''
+    r'''|(?P<func>contains|starts-with)\(\s*@(?P<fattr>[\w-]+)\s*,\s*'''
+    r'''(?P<fq>['"])(?P<fvalue>.*?)(?P=fq)\s*\)'''
+    r'''|@(?P<has>[\w-]+)'''
+    r''')\s*$''')
+
+
+def locator_warnings(by: str, value: str) -> List[str]:
+    """
+    Return reasons why locator may be slow for a browser to evaluate.
+    """
+    result: List[str] = []
+    if by == 'xpath':
+        result.extend(reason for pattern, reason in _SLOW_XPATH
+                      if pattern.search(value))
+        if value.count('//') >= _DEEP_DESCENDANTS:
+            result.append('deep descendant path')
+    elif by == 'css selector':
+        result.extend(reason for pattern, reason in _SLOW_CSS
+                      if pattern.search(value))
+        if _css_descendants(value) >= _DEEP_DESCENDANTS:
+            result.append('deep descendant path')
+    elif by == 'partial link text':
+        result.append('text scan of all links')
+    return result
+
+
+def _css_descendants(selector: str) -> int:
+    """
+    Return the largest number of descendant combinators (whitespace)
+    in groups of CSS `selector`, child and sibling combinators
+    are not counted.
+    """
+    compact: str = _CSS_COMBINATOR.sub(r'\1', _CSS_NESTED.sub('x', selector))
+    return max(len(group.split()) - 1 for group in compact.split(','))
+
+
+def _css_string(value: str) -> str:
+    escaped: str = value.replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _predicate_to_css(predicate: str) -> Optional[str]:
+    match = _XPATH_ATTR.match(predicate)
+    if match is None:
+        return None
+    if match.group('attr'):
+        attr, value = match.group('attr'), match.group('value')
+        if attr == 'id' and _CSS_IDENT.match(value):
+            return f'#{value}'
+        return f'[{attr}={_css_string(value)}]'
+    if match.group('func'):
+        operator: str = '*=' if match.group('func') == 'contains' else '^='
+        return (f'[{match.group("fattr")}{operator}'
+                f'{_css_string(match.group("fvalue"))}]')
+    return f'[{match.group("has")}]'
+
+
+def xpath_to_css(xpath: str) -> Optional[str]:
+    """
+    Return CSS selector equivalent to simple `xpath` of tags, attribute
+    predicates and child or descendant steps. None is returned if
+    `xpath` can't be expressed as CSS selector.
+    """
+    position: int = 0
+    parts: List[str] = []
+    for step in _XPATH_STEP.finditer(xpath.strip()):
+        if step.start() != position:
+            return None
+        position = step.end()
+        css: str = '' if step.group(2) == '*' else step.group(2)
+        for predicate in _XPATH_PREDICATE.findall(step.group(3)):
+            converted: Optional[str] = _predicate_to_css(predicate)
+            if converted is None:
+                return None
+            css += converted
+        if parts:
+            parts.append(' ' if step.group(1) == '//' else ' > ')
+        parts.append(css or '*')
+    if not parts or position != len(xpath.strip()):
+        return None
+    return ''.join(parts)
+
+
+def page_locators(page_name: str) -> List[PageLocator]:
+    """
+    Return element name, frame option, selectors and root locator
+    of all elements and collections of page yaml file `page_name`
+    (without extension). If the file describes a component, its elements
+    are profiled under the first selector of its root element, which is
+    profiled as `root` element of the whole document.
+    """
+    result: List[PageLocator] = []
+    root: Optional[Tuple[str, str]] = None
+    fragment: Dict[str, Any] = load_fragment(page_name)
+    if 'root' in fragment or 'component_repr' in fragment:
+        component = load_component_spec(page_name)
+        parts = (component.elements, component.collections)
+        root_selectors: Dict[str, Any] = dict(component.root)
+        root_options: Dict[str, Any] = pop_options(root_selectors,
+                                                   _NOT_SELECTORS)
+        for by, value in collect_selectors(
+                root_selectors, root_options.get('alternatives')):
+            result.append(('root', None, by, str(value), None))
+        root = (result[0][2], result[0][3]) if result else None
+    else:
+        spec = load_page_spec(type(page_name, (), dict()))
+        parts = (spec.elements, spec.collections)
+    for part in parts:
+        for el_name, elements in part.items():
+            for html_elem, description in elements.items():
+                selectors: Dict[str, Any] = dict(description)
+                options: Dict[str, Any] = pop_options(selectors,
+                                                      _NOT_SELECTORS)
+                for by, value in collect_selectors(
+                        selectors, options.get('alternatives')):
+                    result.append((f'{el_name}_{html_elem}',
+                                   options.get('frame'), by, str(value),
+                                   root))
+    return result
+
+
+def profile_locators(driver: WebDriver,
+                     pages: Optional[Iterable[str]] = None,
+                     repeat: int = 5) -> List[LocatorCost]:
+    """
+    Evaluate locators of `pages` (names of yaml files without extension,
+    all yaml files by default) in current document of `driver` `repeat`
+    times. Returned costs are sorted from the most expensive, median and
+    max durations are in milliseconds.
+    """
+    names: List[str] = sorted(pages or (name.rsplit('.', 1)[0] for name
+                                        in CONFIG.yaml_map
+                                        if name.endswith('.yaml')))
+    costs: List[LocatorCost] = []
+    for page in names:
+        for element, frame, by, value, root in page_locators(page):
+            switch_context(driver, parse_frames(frame))
+            # Install helpers library into the document
+            call_helper(driver, 'find', 'tag name', 'html', False)
+            median, slowest, matches, error = driver.execute_script(
+                _PROFILE, [[by, value]], repeat, root)[0]
+            costs.append(LocatorCost(
+                page=page,
+                element=element,
+                by=by,
+                value=value,
+                median=median,
+                max=slowest,
+                matches=matches,
+                error=error,
+                warnings=locator_warnings(by, value),
+                css=xpath_to_css(value) if by == 'xpath' else None))
+    switch_context(driver, ())
+    costs.sort(key=lambda cost: (-cost.median, -cost.matches))
+    return costs
+
+
+def format_report(costs: List[LocatorCost]) -> str:
+    """
+    Return text table of locator costs with warnings and suggestions.
+    """
+    lines: List[str] = [f'{"median ms":>10} {"max ms":>8} {"matches":>7}  '
+                        'page.element  locator']
+    for cost in costs:
+        lines.append(f'{cost.median:>10.3f} {cost.max:>8.3f} '
+                     f'{cost.matches:>7}  {cost.page}.{cost.element}  '
+                     f'{cost.by}={cost.value}')
+        if cost.error:
+            lines.append(f'{"":>29}error: {cost.error}')
+        for warning in cost.warnings:
+            lines.append(f'{"":>29}slow: {warning}')
+        if cost.css:
+            lines.append(f'{"":>29}css selector: {cost.css}')
+    return '\n'.join(lines)
+
+
+__all__ = [
+    'LocatorCost',
+    'PageLocator',
+    'format_report',
+    'locator_warnings',
+    'page_locators',
+    'profile_locators',
+    'xpath_to_css'
+    ]
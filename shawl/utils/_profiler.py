@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=too-many-instance-attributes
+import json
+import os
+from collections import namedtuple
+from contextlib import ContextDecorator
+from inspect import currentframe
+from threading import Lock, get_ident
+from time import perf_counter
+from types import FrameType
+from typing import Any, Dict, List, Optional, Tuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from ._commands import (
+    CommandHook,
+    add_global_command_hook,
+    remove_global_command_hook
+)
+from ._waits import add_wait_listener, current_poll, remove_wait_listener
+
+CommandRecord = namedtuple('CommandRecord', ['command',
+                                             'page',
+                                             'element',
+                                             'start',
+                                             'elapsed',
+                                             'request_bytes',
+                                             'response_bytes',
+                                             'poll',
+                                             'attempt',
+                                             'error',
+                                             'thread'])
+WaitRecord = namedtuple('WaitRecord', ['page',
+                                       'element',
+                                       'start',
+                                       'elapsed',
+                                       'sleep',
+                                       'timeout',
+                                       'polls',
+                                       'result',
+                                       'thread'])
+
+# Upper bounds of histogram buckets in milliseconds
+HISTOGRAM_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+_MAX_STACK_DEPTH = 64
+
+
+def _find_callers(frame: Optional[FrameType]) -> Tuple[str, str]:
+    """
+    Return `repr_name` of page and element, which methods are
+    on the call stack starting from `frame`.
+    """
+    # pylint: disable=import-outside-toplevel,cyclic-import
+    from ..core._base_collection import BaseCollection
+    from ..core._base_element import BaseElement
+    from ..core._base_page import BasePage
+
+    page: str = ''
+    element: str = ''
+    depth: int = 0
+    while frame is not None and depth < _MAX_STACK_DEPTH:
+        owner: Any = frame.f_locals.get('self')
+        if not element and isinstance(owner, (BaseElement, BaseCollection)):
+            element = repr(owner)
+        elif not page and isinstance(owner, BasePage):
+            page = repr(owner)
+            break
+        frame = frame.f_back
+        depth += 1
+    return page, element
+
+
+def _element_ids(value: Any) -> List[str]:
+    if isinstance(value, WebElement):
+        return [value.id]
+    if isinstance(value, list):
+        return [id_ for item in value for id_ in _element_ids(item)]
+    return []
+
+
+def _size(value: Any) -> int:
+    if value is None:
+        return 0
+    return len(json.dumps(value, default=str))
+
+
+def _bucket(elapsed: float) -> str:
+    milliseconds: float = elapsed * 1000
+    for bound in HISTOGRAM_BUCKETS:
+        if milliseconds <= bound:
+            return f'<={bound}ms'
+    return f'>{HISTOGRAM_BUCKETS[-1]}ms'
+
+
+def _percentile(values: List[float], percent: int) -> float:
+    index: int = max(0, -(-len(values) * percent // 100) - 1)
+    return values[index]
+
+
+class Profiler(CommandHook, ContextDecorator):
+    """
+    Recorder of all WebDriver commands and waits of all drivers,
+    which are issued while profiler is enabled.
+
+    Each command record has `repr_name` of calling page and element,
+    command name, latency, sizes of request and response, number of poll
+    of surrounding wait and number of attempt (same command of the same
+    element sent several times in a row, e.g. lazy load of an element).
+
+    Profiler can be used as context manager or decorator, WebDriver
+    commands are sent without any overhead when there is no enabled
+    profiler.
+
+    For example::
+
+
+        profiler = Profiler()
+        with profiler:
+            page.click_on_search_btn()
+        print(profiler.summary())
+        profiler.export_chrome_trace('trace.json')
+    """
+
+    def __init__(self):
+        self.commands: List[CommandRecord] = []
+        self.waits: List[WaitRecord] = []
+        self._lock: Lock = Lock()
+        self._origin: float = perf_counter()
+        self._started: Optional[float] = None
+        self._wall: float = 0.0
+        self._last: Dict[int, Tuple[Tuple[Any, ...], int]] = dict()
+        # Names of elements by id of found WebElement, so that commands
+        # of WebElement are attributed to the element which found it
+        self._names: Dict[str, str] = dict()
+
+    def __enter__(self) -> 'Profiler':
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any):
+        self.stop()
+
+    @property
+    def enabled(self) -> bool:
+        return self._started is not None
+
+    def start(self):
+        if self.enabled:
+            return
+        self._started = perf_counter()
+        add_global_command_hook(self)
+        add_wait_listener(self._on_wait)
+
+    def stop(self):
+        if self._started is None:
+            return
+        remove_global_command_hook(self)
+        remove_wait_listener(self._on_wait)
+        self._wall += perf_counter() - self._started
+        self._started = None
+
+    def clear(self):
+        with self._lock:
+            self.commands = []
+            self.waits = []
+            self._last.clear()
+            self._names.clear()
+            self._origin = perf_counter()
+            self._wall = 0.0
+            if self._started is not None:
+                self._started = self._origin
+
+    def after(self,
+              driver: WebDriver,
+              command: str,
+              params: Optional[Dict[str, Any]],
+              response: Optional[Dict[str, Any]],
+              elapsed: float):
+        end: float = perf_counter()
+        page, element = _find_callers(currentframe())
+        request_bytes: int = _size(params)
+        thread: int = get_ident()
+        with self._lock:
+            if not element and params and 'id' in params:
+                element = self._names.get(str(params['id']), '')
+            elif element and response is not None:
+                for id_ in _element_ids(response.get('value')):
+                    self._names[id_] = element
+            key: Tuple[Any, ...] = (command, element, request_bytes)
+            last_key, attempt = self._last.get(thread, ((), 0))
+            attempt = attempt + 1 if last_key == key else 1
+            self._last[thread] = (key, attempt)
+            self.commands.append(CommandRecord(
+                command=command,
+                page=page,
+                element=element,
+                start=end - elapsed - self._origin,
+                elapsed=elapsed,
+                request_bytes=request_bytes,
+                response_bytes=_size(response),
+                poll=current_poll(),
+                attempt=attempt,
+                error=response is None,
+                thread=thread))
+
+    def _on_wait(self,
+                 driver: WebDriver,
+                 timeout: float,
+                 polls: int,
+                 elapsed: float,
+                 sleep: float,
+                 result: bool):
+        # pylint: disable=too-many-arguments,unused-argument
+        end: float = perf_counter()
+        page, element = _find_callers(currentframe())
+        with self._lock:
+            self.waits.append(WaitRecord(page=page,
+                                         element=element,
+                                         start=end - elapsed - self._origin,
+                                         elapsed=elapsed,
+                                         sleep=sleep,
+                                         timeout=timeout,
+                                         polls=polls,
+                                         result=result,
+                                         thread=get_ident()))
+
+    @property
+    def wall_time(self) -> float:
+        if self._started is None:
+            return self._wall
+        return self._wall + perf_counter() - self._started
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Return totals of profiled time: time spent on the wire (commands),
+        time spent sleeping between polls of waits and the rest, which is
+        Python overhead. Latency statistics are grouped by command name.
+        """
+        command_time: float = sum(c.elapsed for c in self.commands)
+        sleep_time: float = sum(w.sleep for w in self.waits)
+        by_command: Dict[str, List[float]] = dict()
+        for record in self.commands:
+            by_command.setdefault(record.command, []).append(record.elapsed)
+
+        stats: Dict[str, Dict[str, float]] = dict()
+        for command, latencies in sorted(by_command.items()):
+            latencies.sort()
+            stats[command] = {'count': len(latencies),
+                              'total': sum(latencies),
+                              'p50': _percentile(latencies, 50),
+                              'p95': _percentile(latencies, 95),
+                              'max': latencies[-1]}
+        return {'wall_time': self.wall_time,
+                'commands': len(self.commands),
+                'command_time': command_time,
+                'waits': len(self.waits),
+                'polls': sum(w.polls for w in self.waits),
+                'sleep_time': sleep_time,
+                'overhead_time': max(0.0, self.wall_time
+                                     - command_time - sleep_time),
+                'by_command': stats}
+
+    def histograms(self, key: str = 'command') -> Dict[str, Dict[str, int]]:
+        """
+        Return counts of command latencies by buckets of HISTOGRAM_BUCKETS
+        grouped by `key`, which is one of `command`, `page` or `element`.
+        """
+        result: Dict[str, Dict[str, int]] = dict()
+        for record in self.commands:
+            buckets: Dict[str, int] = result.setdefault(
+                getattr(record, key), dict())
+            bucket: str = _bucket(record.elapsed)
+            buckets[bucket] = buckets.get(bucket, 0) + 1
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'summary': self.summary(),
+                'histograms': self.histograms(),
+                'commands': [c._asdict() for c in self.commands],
+                'waits': [w._asdict() for w in self.waits]}
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """
+        Return records in Chrome trace event format,
+        which can be opened in chrome://tracing or Perfetto.
+        """
+        pid: int = os.getpid()
+        events: List[Dict[str, Any]] = []
+        for wait in self.waits:
+            events.append({'name': f'wait {wait.element or wait.page}',
+                           'cat': 'wait',
+                           'ph': 'X',
+                           'ts': wait.start * 1e6,
+                           'dur': wait.elapsed * 1e6,
+                           'pid': pid,
+                           'tid': wait.thread,
+                           'args': wait._asdict()})
+        for command in self.commands:
+            events.append({'name': command.command,
+                           'cat': 'command',
+                           'ph': 'X',
+                           'ts': command.start * 1e6,
+                           'dur': command.elapsed * 1e6,
+                           'pid': pid,
+                           'tid': command.thread,
+                           'args': command._asdict()})
+        events.sort(key=lambda event: event['ts'])
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export_json(self, path: str):
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    def export_chrome_trace(self, path: str):
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.chrome_trace(), file)
+
+
+__all__ = [
+    'CommandRecord',
+    'HISTOGRAM_BUCKETS',
+    'Profiler',
+    'WaitRecord'
+    ]
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+from contextlib import contextmanager
+from copy import copy
+from typing import Any, Dict, Iterator, Optional
+
+import wrapt
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from ._commands import (
+    CommandHook,
+    add_command_hook,
+    get_command_hooks,
+    remove_command_hook
+)
+
+_CACHED_COMMANDS = frozenset((
+    Command.GET_TITLE,
+    Command.GET_CURRENT_URL,
+    Command.GET_WINDOW_HANDLES,
+    Command.W3C_GET_WINDOW_HANDLES
+    ))
+
+# Commands which do not change state of a browser,
+# so cached values stay valid after them
+_READ_COMMANDS = frozenset((
+    Command.FIND_ELEMENT,
+    Command.FIND_ELEMENTS,
+    Command.FIND_CHILD_ELEMENT,
+    Command.FIND_CHILD_ELEMENTS,
+    Command.GET_ACTIVE_ELEMENT,
+    Command.W3C_GET_ACTIVE_ELEMENT,
+    Command.GET_CURRENT_WINDOW_HANDLE,
+    Command.W3C_GET_CURRENT_WINDOW_HANDLE,
+    Command.GET_PAGE_SOURCE,
+    Command.GET_LOG,
+    Command.GET_AVAILABLE_LOG_TYPES,
+    Command.GET_ALL_COOKIES,
+    Command.GET_COOKIE,
+    Command.SCREENSHOT,
+    Command.ELEMENT_SCREENSHOT,
+    Command.GET_WINDOW_RECT,
+    Command.GET_WINDOW_SIZE,
+    Command.W3C_GET_WINDOW_SIZE,
+    Command.GET_WINDOW_POSITION,
+    Command.W3C_GET_WINDOW_POSITION,
+    Command.GET_ELEMENT_TEXT,
+    Command.GET_ELEMENT_VALUE,
+    Command.GET_ELEMENT_TAG_NAME,
+    Command.GET_ELEMENT_ATTRIBUTE,
+    Command.GET_ELEMENT_PROPERTY,
+    Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY,
+    Command.GET_ELEMENT_LOCATION,
+    Command.GET_ELEMENT_SIZE,
+    Command.GET_ELEMENT_RECT,
+    Command.IS_ELEMENT_SELECTED,
+    Command.IS_ELEMENT_ENABLED,
+    Command.IS_ELEMENT_DISPLAYED
+    ))
+
+
+class ReadCache(CommandHook):
+    """
+    Command hook which memoizes title, current url and window handles
+    while caching is enabled. Any command, which may change state of
+    a browser (navigation, click, script, window switch, etc.),
+    invalidates memoized values.
+    """
+
+    def __init__(self):
+        self.enabled: bool = False
+        self.hits: int = 0
+        self.misses: int = 0
+        self._responses: Dict[str, Dict[str, Any]] = dict()
+
+    def invalidate(self):
+        self._responses.clear()
+
+    def before(self,
+               driver: WebDriver,
+               command: str,
+               params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if command not in _CACHED_COMMANDS:
+            if command not in _READ_COMMANDS:
+                self.invalidate()
+            return None
+        if self.enabled and command in self._responses:
+            self.hits += 1
+            response: Dict[str, Any] = self._responses[command]
+            return dict(response, value=copy(response.get('value')))
+        return None
+
+    def after(self,
+              driver: WebDriver,
+              command: str,
+              params: Optional[Dict[str, Any]],
+              response: Optional[Dict[str, Any]],
+              elapsed: float):
+        if self.enabled and command in _CACHED_COMMANDS:
+            self.misses += 1
+            if response is not None:
+                self._responses[command] = dict(
+                    response, value=copy(response.get('value')))
+
+
+class CachingDriver(wrapt.ObjectProxy):  # type: ignore
+    """
+    Proxy over WebDriver which memoizes `title`, `current_url` and
+    `window_handles` for the duration of a step.
+
+    Memoized values are dropped at the start and the end of the outermost
+    step and after any command which may change state of a browser. Proxy
+    can be used anywhere instead of WebDriver, e.g. passed to a BasePage.
+
+    For example::
+
+
+        driver = CachingDriver(webdriver.Chrome())
+        page = CustomPage(driver)
+        with driver.step():
+            page.validate_current_page(page_name='Home', url=url)
+        print(driver.hits, driver.misses)
+    """
+
+    def __init__(self, driver: WebDriver):
+        super().__init__(driver)
+        self._self_cache: ReadCache = ReadCache()
+        self._self_depth: int = 0
+        add_command_hook(driver, self._self_cache)
+
+    @property
+    def hits(self) -> int:
+        return self._self_cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self._self_cache.misses
+
+    @contextmanager
+    def step(self) -> Iterator['CachingDriver']:
+        """
+        Enable memoizing of reads inside `with` block. Only the outermost
+        step drops memoized values, nested steps reuse them.
+        """
+        if not self._self_depth:
+            self._self_cache.invalidate()
+        self._self_depth += 1
+        self._self_cache.enabled = True
+        try:
+            yield self
+        finally:
+            self._self_depth -= 1
+            if not self._self_depth:
+                self._self_cache.enabled = False
+                self._self_cache.invalidate()
+
+    def invalidate(self):
+        """
+        Drop all memoized values.
+        """
+        self._self_cache.invalidate()
+
+    def reset_counters(self):
+        self._self_cache.hits = 0
+        self._self_cache.misses = 0
+
+    def detach(self):
+        """
+        Stop memoizing reads, proxy will just pass commands to a driver.
+        """
+        remove_command_hook(self.__wrapped__, self._self_cache)
+
+
+@contextmanager
+def read_step(driver: Any) -> Iterator[Any]:
+    """
+    Memoize reads inside `with` block if `driver` is CachingDriver.
+    """
+    if isinstance(driver, CachingDriver):
+        with driver.step():
+            yield driver
+    else:
+        yield driver
+
+
+def invalidate_reads(driver: Any):
+    """
+    Drop memoized reads of `driver`, so that next read
+    will be sent to a browser.
+    """
+    if isinstance(driver, WebDriver):
+        for hook in get_command_hooks(driver):
+            if isinstance(hook, ReadCache):
+                hook.invalidate()
+
+
+__all__ = ['CachingDriver', 'ReadCache', 'invalidate_reads', 'read_step']
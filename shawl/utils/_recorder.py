@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+import gzip
+import json
+from collections import namedtuple
+from contextlib import ContextDecorator
+from copy import deepcopy
+from inspect import currentframe
+from threading import Lock
+from time import perf_counter
+from typing import IO, Any, Counter, Dict, Iterable, List, Optional, cast
+
+from ._commands import unwrap_driver
+from ._profiler import _find_callers
+
+RecordedCommand = namedtuple('RecordedCommand', ['command',
+                                                 'params',
+                                                 'response',
+                                                 'start',
+                                                 'elapsed',
+                                                 'page',
+                                                 'element'])
+
+_FORMAT_VERSION = 1
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path.endswith('.gz'):
+        return cast(IO[str], gzip.open(path, mode + 't', encoding='utf-8'))
+    return open(path, mode, encoding='utf-8')
+
+
+def strip_session(params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Return copy of command parameters without session id,
+    so that commands of different sessions can be compared.
+    """
+    return {key: value for key, value in (params or dict()).items()
+            if key != 'sessionId'}
+
+
+class Recording:
+    """
+    WebDriver commands with raw responses of remote end and their
+    durations, attributed to pages and elements which sent them.
+
+    Recording is stored as JSON lines, compressed by gzip
+    if file name ends with `.gz`.
+    """
+
+    def __init__(self,
+                 capabilities: Optional[Dict[str, Any]] = None,
+                 w3c: bool = True,
+                 commands: Optional[Iterable[RecordedCommand]] = None):
+        self.capabilities: Dict[str, Any] = dict(capabilities or dict())
+        self.w3c: bool = w3c
+        self.commands: List[RecordedCommand] = list(commands or [])
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+    def counts(self, key: str = 'command') -> Counter[str]:
+        """
+        Return numbers of commands grouped by `key`, which is one of
+        `command`, `page` or `element`.
+        """
+        return Counter(getattr(record, key) for record in self.commands)
+
+    def save(self, path: str):
+        with _open(path, 'w') as file:
+            file.write(json.dumps({'version': _FORMAT_VERSION,
+                                   'capabilities': self.capabilities,
+                                   'w3c': self.w3c},
+                                  separators=(',', ':'),
+                                  default=str) + '\n')
+            for record in self.commands:
+                file.write(json.dumps(list(record),
+                                      separators=(',', ':'),
+                                      default=str) + '\n')
+
+    @classmethod
+    def load(cls, path: str) -> 'Recording':
+        with _open(path, 'r') as file:
+            header: Dict[str, Any] = json.loads(file.readline())
+            if header.get('version') != _FORMAT_VERSION:
+                raise ValueError(f'Unsupported recording version '
+                                 f'{header.get("version")} in "{path}"')
+            return cls(capabilities=header.get('capabilities'),
+                       w3c=header.get('w3c', True),
+                       commands=[RecordedCommand(*json.loads(line))
+                                 for line in file if line.strip()])
+
+
+class _RecordingExecutor:
+    """
+    Proxy over command executor of a driver,
+    which passes commands to `recorder`.
+    """
+
+    def __init__(self, executor: Any, recorder: 'Recorder'):
+        self.executor: Any = executor
+        self.recorder: Recorder = recorder
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.executor, name)
+
+    def execute(self,
+                command: str,
+                params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        # Executor may change parameters, e.g. drop session id
+        sent: Dict[str, Any] = strip_session(params)
+        start: float = perf_counter()
+        response: Dict[str, Any] = self.executor.execute(command, params)
+        # Driver replaces element references of response with WebElement
+        self.recorder.add(command,
+                          sent,
+                          deepcopy(response),
+                          start,
+                          perf_counter() - start)
+        return response
+
+
+class Recorder(ContextDecorator):
+    """
+    Recorder of WebDriver traffic of a driver: commands, which are sent
+    to the remote end, and its raw responses, including errors. Each
+    command is attributed to page and element, which sent it.
+
+    Recording can be saved to a file and replayed without browser by
+    `shawl.testing.replay`.
+
+    For example::
+
+
+        recorder = Recorder(driver)
+        with recorder:
+            page.click_on_search_btn()
+        recorder.recording.save('search.jsonl.gz')
+    """
+
+    def __init__(self, driver: Any):
+        self._driver: Any = unwrap_driver(driver)
+        self.recording: Recording = Recording(
+            capabilities=self._driver.capabilities,
+            w3c=getattr(self._driver, 'w3c', True))
+        self._lock: Lock = Lock()
+        self._origin: float = perf_counter()
+        self._executor: Optional[_RecordingExecutor] = None
+
+    def __enter__(self) -> 'Recorder':
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any):
+        self.stop()
+
+    @property
+    def enabled(self) -> bool:
+        return self._executor is not None
+
+    def start(self):
+        if self._executor is not None:
+            return
+        self._executor = _RecordingExecutor(self._driver.command_executor,
+                                            self)
+        self._driver.command_executor = self._executor
+
+    def stop(self):
+        if self._executor is None:
+            return
+        if self._driver.command_executor is self._executor:
+            self._driver.command_executor = self._executor.executor
+        self._executor = None
+
+    def add(self,
+            command: str,
+            params: Dict[str, Any],
+            response: Dict[str, Any],
+            start: float,
+            elapsed: float):
+        # pylint: disable=too-many-arguments
+        page, element = _find_callers(currentframe())
+        with self._lock:
+            self.recording.commands.append(RecordedCommand(
+                command=command,
+                params=params,
+                response=response,
+                start=round(start - self._origin, 6),
+                elapsed=round(elapsed, 6),
+                page=page,
+                element=element))
+
+    def save(self, path: str):
+        self.recording.save(path)
+
+
+__all__ = [
+    'RecordedCommand',
+    'Recorder',
+    'Recording',
+    'strip_session'
+    ]
@@ -1,23 +1,40 @@
 # -*- coding: utf-8 -*-
+import hashlib
 import importlib.util
 import inspect
-from os import walk
-from os.path import isabs, join
+import json
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from os import cpu_count, walk
+from os.path import abspath, basename, dirname, isabs, isfile, join, relpath
 from types import ModuleType
-from typing import Any, Callable, Dict, Set, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple
+)
 
 import shawl
 
 from ..config import SHAWL_CONFIG as CONFIG
+from ..core._page_spec import get_element_modules, tracking_yaml_files
+
+# File of class root package with hashes of stubbed modules
+STUBS_MANIFEST = '.shawl-stubs.json'
+# Version of stubs format, stubs of all modules are created again
+# when it changes
+STUBS_FORMAT = 1
 
 
 def is_type_of(class_: type, type_: str) -> bool:
     if class_.__name__ != type_:
-        buf_cls = class_
-        while buf_cls.__name__ != 'object':
-            if buf_cls.__name__ == type_:
-                return True
-            buf_cls, = buf_cls.__bases__
+        return any(buf_cls.__name__ == type_ for buf_cls in class_.__mro__)
     return False
 
 
@@ -45,10 +62,13 @@ def get_func_declaration(fun_name: str, function_: Callable[..., Any]) -> str:
 
 def load_class(class_: type,
                is_elements: bool = False) -> Tuple[Dict[str, Set[str]],
-                                                   Set[str]]:
+                                                   Set[str],
+                                                   Set[type]]:
     imports: Set[str] = set()
     attributes: Set[str] = set()
     methods: Set[str] = set()
+    # Classes of attributes, e.g. classes of elements of a page
+    classes: Set[type] = set()
 
     if not is_elements:
         page = class_('driver')
@@ -63,19 +83,22 @@ def load_class(class_: type,
             attributes.add(
                 f'    {attr} = None '
                 f'# type: {attr_value.__class__.__name__}')
+            classes.add(attr_value.__class__)
     for attr, attr_value in class_.__dict__.items():
         if callable(attr_value) and not attr.startswith('_'):
             methods.add(f'    {get_func_declaration(attr, attr_value)}')
-    return {'methods': methods, 'attributes': attributes}, imports
+    return {'methods': methods, 'attributes': attributes}, imports, classes
 
 
 def read_module(module_: ModuleType,
                 cur_module: str) -> Tuple[Set[str],
                                           Set[str],
-                                          Dict[type, Dict[str, Set[str]]]]:
+                                          Dict[type, Dict[str, Set[str]]],
+                                          Set[type]]:
     imports: Set[str] = set()
     functions: Set[str] = set()
     declared_classes: Dict[type, Dict[str, Set[str]]] = dict()
+    attribute_classes: Set[type] = set()
 
     for name, obj in inspect.getmembers(module_):
         if inspect.isfunction(obj) and obj.__module__ == cur_module:
@@ -86,75 +109,261 @@ def read_module(module_: ModuleType,
                 continue
 
             if is_type_of(obj, 'BasePage'):
-                received_attrs, received_imports = load_class(obj)
+                received_attrs, received_imports, classes = load_class(obj)
             elif (is_type_of(obj, 'BaseElement')
                   or is_type_of(obj, 'BaseCollection')):
-                received_attrs, received_imports = load_class(obj,
-                                                              is_elements=True)
+                received_attrs, received_imports, classes = load_class(
+                    obj, is_elements=True)
             else:
                 continue
             declared_classes[obj] = received_attrs
             imports.update(received_imports)
+            attribute_classes.update(classes)
+
+    return imports, functions, declared_classes, attribute_classes
+
+
+def _source_files(classes: Iterable[type],
+                  attribute_classes: Iterable[type],
+                  module_path: str) -> Set[str]:
+    """
+    Return source files in the project, which stub of `classes` depends
+    on: files of their bases, of `attribute_classes` and their bases and
+    of modules, where classes of elements are looked up. So stub is
+    created again when one of them changes.
+    """
+    # Declared classes are in the stubbed module itself
+    sources: List[Any] = [base for class_ in classes
+                          for base in class_.__mro__[1:]]
+    sources.extend(base for class_ in attribute_classes
+                   for base in class_.__mro__)
+    for class_ in classes:
+        if is_type_of(class_, 'BasePage'):
+            base_module, init_module = get_element_modules(class_)
+            sources.append(base_module)
+            if CONFIG.use_package_init_first:
+                sources.append(init_module)
+
+    files: Set[str] = set()
+    root: str = join(CONFIG.project_root_path, '')
+    for source in sources:
+        with suppress(TypeError):
+            path: Optional[str] = inspect.getsourcefile(source)
+            if path and path.startswith(root) and path != module_path:
+                files.add(path)
+    return files
+
+
+def render_stub(imports: Set[str],
+                functions: Set[str],
+                declared_classes: Dict[type, Dict[str, Set[str]]]) -> str:
+    """
+    Return content of stub file. Lines are sorted, so that the same
+    module always gives the same stub.
+    """
+    lines: List[str] = [f'{import_}\n' for import_ in sorted(imports)]
+    lines.append('\n\n')
+    lines.extend(f'{function_}\n\n\n' for function_ in sorted(functions))
+    for class_, attrs in sorted(declared_classes.items(),
+                                key=lambda item: item[0].__name__):
+        if class_.__bases__[0] != 'object':  # type: ignore
+            bases: str = ', '.join(base.__name__
+                                   for base in class_.__bases__)
+            lines.append(f'class {class_.__name__}({bases}):\n')
+        else:
+            lines.append(f'class {class_.__name__}:\n')
+
+        if not any(attrs.values()):
+            lines.append('    pass\n')
+            continue
 
-    return imports, functions, declared_classes
-
-
-def stub_file(dir_with_src: str, src: str):
-    cur_module: str = path_to_module(dir_with_src)
-    spec = importlib.util.spec_from_file_location(cur_module,
-                                                  f'{dir_with_src}/{src}')
+        attributes: List[str] = sorted(attrs.get('attributes', ()))
+        methods: List[str] = sorted(attrs.get('methods', ()))
+        lines.extend(f'{attr}\n' for attr in attributes)
+        lines.append('\n')
+        lines.extend(f'{method}\n\n' for method in methods)
+    return ''.join(lines)
+
+
+def read_stub(dir_with_src: str,
+              src: str,
+              cur_module: Optional[str] = None) -> Tuple[str, List[str]]:
+    """
+    Execute module `src` and return content of its stub file and sorted
+    paths of files it was created from: yaml files of its pages and
+    source files of their bases. Name of the package of module is
+    `dir_with_src` path by default.
+    """
+    cur_module = cur_module or path_to_module(dir_with_src)
+    module_path: str = join(dir_with_src, src)
+    spec = importlib.util.spec_from_file_location(cur_module, module_path)
     buf_module = importlib.util.module_from_spec(spec)  # type: ignore
-    spec.loader.exec_module(buf_module)  # type: ignore
-
-    imports, functions, declared_classes = read_module(buf_module, cur_module)
-
-    with open(f'{dir_with_src}/{src}i', 'w+', encoding='utf-8') as st_file:
-        for import_ in imports:
-            st_file.write(f'{import_}\n')
-        st_file.write('\n\n')
-
-        for function_ in functions:
-            st_file.write(f'{function_}\n\n\n')
-
-        for class_, attrs in declared_classes.items():
-            if class_.__bases__[0] != 'object':  # type: ignore
-                st_file.write(f'class {class_.__name__}'
-                              f'({class_.__bases__[0].__name__}):\n')
-            else:
-                st_file.write(f'class {class_.__name__}:\n')
-
-            if not any(attrs.values()):
-                st_file.write('    pass\n')
-                continue
-
-            for attr in attrs.get('attributes', []):
-                st_file.write(f'{attr}\n')
-
-            st_file.write('\n')
-
-            for method in attrs.get('methods', []):
-                st_file.write(f'{method}\n\n')
-
-
-def create_stubs(yaml_path: str, class_root_path: str):
+    # Yaml files may be edited between runs in the same process
+    with CONFIG.override(reload_yaml=True):
+        with tracking_yaml_files() as yaml_files:
+            spec.loader.exec_module(buf_module)  # type: ignore
+            imports, functions, declared_classes, attribute_classes = (
+                read_module(buf_module, cur_module))
+    inputs: Set[str] = set(yaml_files)
+    inputs.update(_source_files(declared_classes,
+                                attribute_classes,
+                                abspath(module_path)))
+    return (render_stub(imports, functions, declared_classes),
+            sorted(inputs))
+
+
+def _write_if_changed(path: str, content: str) -> bool:
+    with suppress(OSError):
+        with open(path, encoding='utf-8') as file:
+            if file.read() == content:
+                return False
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(content)
+    return True
+
+
+def stub_file(dir_with_src: str, src: str) -> bool:
+    """
+    Create stub file of module `src`.
+    Returns True if stub file was written, False if it is up to date.
+    """
+    content, _ = read_stub(dir_with_src, src)
+    return _write_if_changed(join(dir_with_src, f'{src}i'), content)
+
+
+def _inputs_hash(source: str, inputs: Iterable[str]) -> str:
+    digest = hashlib.sha256(f'{STUBS_FORMAT}\0'.encode())
+    for path in (source, *inputs):
+        # Paths are relative, so that manifest is valid in other checkouts
+        digest.update(f'{relpath(path, CONFIG.project_root_path)}\0'.encode())
+        try:
+            with open(path, 'rb') as file:
+                digest.update(file.read())
+        except OSError:
+            digest.update(b'\0missing')
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _load_manifest(path: str) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(path, encoding='utf-8') as file:
+            manifest: Dict[str, Any] = json.load(file)
+    except (OSError, ValueError):
+        return dict()
+    if manifest.get('format') != STUBS_FORMAT:
+        return dict()
+    return dict(manifest.get('files', dict()))
+
+
+def _is_fresh(source: str, entry: Optional[Dict[str, Any]]) -> bool:
+    if entry is None or not isfile(f'{source}i'):
+        return False
+    inputs: List[str] = [join(CONFIG.project_root_path, path)
+                         for path in entry.get('inputs', ())]
+    return bool(entry.get('hash') == _inputs_hash(source, inputs))
+
+
+def _stub_source(source: str) -> Tuple[str, str, List[str]]:
+    package: str = path_to_module(relpath(dirname(source),
+                                          CONFIG.project_root_path))
+    content, inputs = read_stub(dirname(source), basename(source), package)
+    return source, content, inputs
+
+
+def _init_worker(options: Dict[str, Any], package: str):
+    # Workers started by spawn have config of environment
+    for name, value in options.items():
+        setattr(CONFIG, name, value)
+    importlib.import_module(package)
+
+
+def _stub_sources(sources: List[str],
+                  jobs: int,
+                  package: str) -> Iterator[Tuple[str, str, List[str]]]:
+    if jobs < 2 or len(sources) < 2:
+        yield from map(_stub_source, sources)
+        return
+    options: Dict[str, Any] = {
+        'project_root_path': CONFIG.project_root_path,
+        'source_yaml_path': CONFIG.source_yaml_path,
+        'elements_classes_module': CONFIG.elements_classes_module,
+        'use_package_init_first': CONFIG.use_package_init_first
+        }
+    workers: int = min(jobs, len(sources))
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_worker,
+                             initargs=(options, package)) as executor:
+        yield from executor.map(_stub_source,
+                                sources,
+                                chunksize=max(1, len(sources) // workers // 4))
+
+
+def create_stubs(yaml_path: str,
+                 class_root_path: str,
+                 jobs: Optional[int] = None,
+                 force: bool = False) -> List[str]:
+    """
+    Create stub files of modules with pages and elements, which mirror
+    directories of `yaml_path` in `class_root_path` package.
+
+    Hashes of modules and files they were created from are kept in
+    `STUBS_MANIFEST` file of the package, stub files of unchanged modules
+    are not created again unless `force` is set. Modules are executed in
+    `jobs` processes (number of CPUs by default) and stub file is written
+    only if its content changed. Returns paths of written stub files.
+    """
+    # pylint: disable=too-many-locals
     if isabs(class_root_path):
         raise ValueError('Class root path must be relative '
                          'to project root dir')
 
-    importlib.import_module(path_to_module(class_root_path))
+    package: str = path_to_module(class_root_path)
+    importlib.import_module(package)
 
     if not isabs(yaml_path):
         yaml_path = join(CONFIG.project_root_path, yaml_path)
 
     class_root_path = join(CONFIG.project_root_path, class_root_path)
 
-    for root_path, _, files in walk(yaml_path.replace(CONFIG.source_yaml_path,
+    sources: List[str] = []
+    for root_path, _, names in walk(yaml_path.replace(CONFIG.source_yaml_path,
                                                       class_root_path)):
         if '__pycache__' in root_path:
             continue
-        for file in (f for f in files
-                     if not f.endswith('.pyi') and f.endswith('.py')):
-            stub_file(root_path, file)
-
-
-__all__ = ['create_stubs']
+        sources.extend(join(root_path, name) for name in names
+                       if not name.endswith('.pyi') and name.endswith('.py'))
+    sources.sort()
+
+    def relative(path: str) -> str:
+        return relpath(path, CONFIG.project_root_path)
+
+    manifest_path: str = join(class_root_path, STUBS_MANIFEST)
+    manifest: Dict[str, Dict[str, Any]] = (
+        dict() if force else _load_manifest(manifest_path))
+    stale: List[str] = [source for source in sources
+                        if not _is_fresh(source,
+                                         manifest.get(relative(source)))]
+
+    written: List[str] = []
+    for source, content, inputs in _stub_sources(stale,
+                                                 jobs or cpu_count() or 1,
+                                                 package):
+        if _write_if_changed(f'{source}i', content):
+            written.append(f'{source}i')
+        manifest[relative(source)] = {
+            'hash': _inputs_hash(source, inputs),
+            'inputs': [relative(path) for path in inputs]
+            }
+
+    # Modules, which were removed, are dropped from manifest
+    entries: Dict[str, Dict[str, Any]] = {
+        relative(source): manifest[relative(source)] for source in sources}
+    _write_if_changed(manifest_path,
+                      json.dumps({'format': STUBS_FORMAT, 'files': entries},
+                                 indent=2,
+                                 sort_keys=True))
+    return written
+
+
+__all__ = ['STUBS_MANIFEST', 'create_stubs', 'render_stub', 'stub_file']
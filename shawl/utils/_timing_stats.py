@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+import atexit
+import json
+import os
+from contextlib import contextmanager
+from threading import Lock
+from typing import Any, Counter, Dict, Iterator, List, Optional, Tuple
+
+from ..config import SHAWL_CONFIG as CONFIG
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+# Number of latest samples, which are kept for each locator
+MAX_SAMPLES = 200
+# Number of samples, which is required to adapt timeout of a locator
+MIN_SAMPLES = 20
+# Adapted timeouts are never shorter than this value in seconds
+MIN_TIMEOUT = 0.5
+ADAPTIVE_PERCENTILE = 99
+
+
+def locator_key(selector: Tuple[str, str]) -> str:
+    return f'{selector[0]}={selector[1]}'
+
+
+class TimingStats:
+    """
+    Durations of waits and numbers of timed out waits by locator.
+    Only latest `MAX_SAMPLES` durations are kept.
+
+    Timed out lazy load is kept as a censored sample: element took at
+    least as long as the wait, so cut off lazy loads raise learned timeout
+    back. Timed out checks only count timeouts, as element may be absent.
+
+    For elements with alternative locators, numbers of lookups won by
+    each locator are kept by the first declared locator of element.
+    """
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = dict()
+        self.timeouts: Counter[str] = Counter()
+        self.locators: Dict[str, Counter[str]] = dict()
+
+    def __bool__(self) -> bool:
+        return bool(self.samples or self.timeouts or self.locators)
+
+    def add(self,
+            key: str,
+            elapsed: float,
+            satisfied: bool = True,
+            censored: bool = False):
+        if not satisfied:
+            self.timeouts[key] += 1
+            if not censored:
+                return
+        samples: List[float] = self.samples.setdefault(key, [])
+        samples.append(round(elapsed, 4))
+        del samples[:-MAX_SAMPLES]
+
+    def add_locator(self, key: str, winner: str):
+        self.locators.setdefault(key, Counter())[winner] += 1
+
+    def merge(self, other: 'TimingStats'):
+        for key, samples in other.samples.items():
+            merged: List[float] = self.samples.setdefault(key, [])
+            merged.extend(samples)
+            del merged[:-MAX_SAMPLES]
+        self.timeouts.update(other.timeouts)
+        for key, wins in other.locators.items():
+            self.locators.setdefault(key, Counter()).update(wins)
+
+    def order(self,
+              selectors: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """
+        Return `selectors` of an element ordered by number of won lookups,
+        declared order is kept for selectors with the same number.
+        """
+        wins: Counter[str] = self.locators.get(locator_key(selectors[0]),
+                                               Counter())
+        return sorted(selectors,
+                      key=lambda selector: -wins[locator_key(selector)])
+
+    def fallbacks(self) -> Dict[str, str]:
+        """
+        Return locators, which won most of lookups, by first declared
+        locator of elements, for which it is not the first one.
+        """
+        result: Dict[str, str] = dict()
+        for key, wins in self.locators.items():
+            winner: str = wins.most_common(1)[0][0]
+            if winner != key:
+                result[key] = winner
+        return result
+
+    def percentile(self, key: str, percent: int) -> Optional[float]:
+        samples: List[float] = sorted(self.samples.get(key, []))
+        if not samples:
+            return None
+        index: int = max(0, -(-len(samples) * percent // 100) - 1)
+        return samples[index]
+
+    def timeout(self, key: str, default: float, factor: float) -> float:
+        """
+        Return `ADAPTIVE_PERCENTILE` of durations of `key` multiplied by
+        `factor`, but not shorter than `MIN_TIMEOUT` and not longer than
+        `default`. If there are less than `MIN_SAMPLES` durations,
+        `default` is returned.
+        """
+        if len(self.samples.get(key, [])) < MIN_SAMPLES:
+            return default
+        slowest: float = self.percentile(key, ADAPTIVE_PERCENTILE) or 0.0
+        return min(default, max(MIN_TIMEOUT, slowest * factor))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'samples': self.samples,
+                'timeouts': dict(self.timeouts),
+                'locators': {key: dict(wins) for key, wins
+                             in self.locators.items()}}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TimingStats':
+        stats: TimingStats = cls()
+        stats.samples = {key: list(samples) for key, samples
+                         in data.get('samples', dict()).items()}
+        stats.timeouts = Counter(data.get('timeouts', dict()))
+        stats.locators = {key: Counter(wins) for key, wins
+                          in data.get('locators', dict()).items()}
+        return stats
+
+    @classmethod
+    def load(cls, path: str) -> 'TimingStats':
+        try:
+            with open(path, encoding='utf-8') as file:
+                return cls.from_dict(json.load(file))
+        except (OSError, ValueError):
+            return cls()
+
+    def save(self, path: str):
+        """
+        Merge stats into `path` file. Several processes can save
+        into the same file: file is locked while it is merged
+        and replaced at once.
+        """
+        with _locked(path):
+            stats: TimingStats = TimingStats.load(path)
+            stats.merge(self)
+            temp: str = f'{path}.{os.getpid()}.tmp'
+            with open(temp, 'w', encoding='utf-8') as file:
+                json.dump(stats.to_dict(), file)
+            os.replace(temp, path)
+
+
+@contextmanager
+def _locked(path: str) -> Iterator[None]:
+    with open(f'{path}.lock', 'w', encoding='utf-8') as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+_LOCK = Lock()
+# Durations of current run, which are saved at exit
+_RUN = TimingStats()
+# Durations of previous runs, which adaptive timeouts are based on
+_HISTORY: Dict[str, TimingStats] = dict()
+_SAVE_AT_EXIT: List[bool] = []
+
+
+def _save_at_exit():
+    if not _SAVE_AT_EXIT:
+        _SAVE_AT_EXIT.append(True)
+        atexit.register(save_timing_stats)
+
+
+def record_wait(key: str,
+                elapsed: float,
+                satisfied: bool,
+                censored: bool = False):
+    """
+    Record duration of a wait for `key` locator,
+    if `SHAWL_TIMING_STATS_PATH` is set. Duration of timed out wait
+    is kept as a sample only if it is `censored`.
+    """
+    if not CONFIG.timing_stats_path:
+        return
+    with _LOCK:
+        _RUN.add(key, elapsed, satisfied, censored)
+        _save_at_exit()
+
+
+def record_locator(key: str, winner: str):
+    """
+    Record that `winner` locator found element with first declared
+    locator `key`, if `SHAWL_TIMING_STATS_PATH` is set.
+    """
+    if not CONFIG.timing_stats_path:
+        return
+    with _LOCK:
+        _RUN.add_locator(key, winner)
+        _save_at_exit()
+
+
+def _history() -> TimingStats:
+    path: str = CONFIG.timing_stats_path
+    with _LOCK:
+        if path not in _HISTORY:
+            _HISTORY[path] = TimingStats.load(path)
+        return _HISTORY[path]
+
+
+def adaptive_timeout(key: str, default: float) -> float:
+    """
+    Return timeout of a wait for `key` locator, which is learned from
+    stats of previous runs, if adaptive timeouts are enabled,
+    otherwise `default`.
+    """
+    if not (CONFIG.adaptive_timeouts and CONFIG.timing_stats_path):
+        return default
+    return _history().timeout(key, default, CONFIG.adaptive_timeout_factor)
+
+
+def order_locators(
+        selectors: Tuple[Tuple[str, str], ...]
+        ) -> Tuple[Tuple[str, str], ...]:
+    """
+    Return alternative `selectors` of an element, so that the one, which
+    found element most often in previous runs, goes first.
+    """
+    if len(selectors) < 2 or not CONFIG.timing_stats_path:
+        return selectors
+    return tuple(_history().order(list(selectors)))
+
+
+def save_timing_stats(path: Optional[str] = None):
+    """
+    Merge durations of current run into stats file.
+    """
+    path = path or CONFIG.timing_stats_path
+    with _LOCK:
+        if not (path and _RUN):
+            return
+        _RUN.save(path)
+        _RUN.samples.clear()
+        _RUN.timeouts.clear()
+        _RUN.locators.clear()
+
+
+__all__ = [
+    'TimingStats',
+    'adaptive_timeout',
+    'locator_key',
+    'order_locators',
+    'record_locator',
+    'record_wait',
+    'save_timing_stats'
+    ]
@@ -1,17 +1,113 @@
 # -*- coding: utf-8 -*-
 from contextlib import suppress
-from typing import Any, Callable
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Callable, List, Optional
 
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.wait import WebDriverWait
+from selenium.webdriver.support.wait import POLL_FREQUENCY, WebDriverWait
+
+from ..config import SHAWL_CONFIG as CONFIG
+from ._read_cache import invalidate_reads
+
+# Called with driver, timeout, number of polls, duration of wait,
+# time spent between polls and result of wait
+WaitListener = Callable[[WebDriver, float, int, float, float, bool], None]
+
+_WAIT_LISTENERS: List[WaitListener] = []
+_CURRENT_POLL: ContextVar[int] = ContextVar('shawl_current_poll', default=0)
+
+
+def add_wait_listener(listener: WaitListener):
+    _WAIT_LISTENERS.append(listener)
+
+
+def remove_wait_listener(listener: WaitListener):
+    if listener in _WAIT_LISTENERS:
+        _WAIT_LISTENERS.remove(listener)
+
+
+def current_poll() -> int:
+    """
+    Return number of current poll of `wait_until`, which is observed
+    by wait listeners, or 0 outside of such wait.
+    """
+    return _CURRENT_POLL.get()
+
+
+def _observed_wait_for(driver: WebDriver,
+                       wait: float,
+                       method: Callable[..., Any],
+                       poll_frequency: float) -> Any:
+    polls: int = 0
+    poll_time: float = 0.0
+
+    def poll(driver_: WebDriver) -> Any:
+        nonlocal polls, poll_time
+        polls += 1
+        token = _CURRENT_POLL.set(polls)
+        start: float = perf_counter()
+        try:
+            return method(driver_)
+        finally:
+            poll_time += perf_counter() - start
+            _CURRENT_POLL.reset(token)
+
+    result: bool = False
+    start: float = perf_counter()
+    try:
+        value: Any = WebDriverWait(driver, wait, poll_frequency).until(poll)
+        result = bool(value)
+        return value
+    finally:
+        elapsed: float = perf_counter() - start
+        for listener in list(_WAIT_LISTENERS):
+            listener(driver, wait, polls, elapsed, elapsed - poll_time, result)
+
+
+def wait_for(driver: WebDriver,
+             wait: Optional[float],
+             method: Callable[..., Any],
+             poll_frequency: float = POLL_FREQUENCY) -> Any:
+    """
+    Wait for `method` to return truthy value during `wait` seconds
+    (`SHAWL_WAIT_TIMEOUT` at the time of the call by default).
+    Returns the value, raises TimeoutException if it was not returned
+    in time. Wait listeners are notified about the wait.
+    """
+    if wait is None:
+        wait = CONFIG.wait_timeout
+
+    def poll(driver_: WebDriver) -> Any:
+        # Each poll must see actual state of a browser,
+        # not memoized by CachingDriver
+        invalidate_reads(driver_)
+        return method(driver_)
+
+    if _WAIT_LISTENERS:
+        return _observed_wait_for(driver, wait, poll, poll_frequency)
+    return WebDriverWait(driver, wait, poll_frequency).until(poll)
 
 
 def wait_until(driver: WebDriver,
-               wait: int,
-               method: Callable[..., Any]) -> bool:
+               wait: Optional[float],
+               method: Callable[..., Any],
+               poll_frequency: float = POLL_FREQUENCY) -> bool:
+    """
+    Wait for `method` to return truthy value during `wait` seconds
+    (`SHAWL_WAIT_TIMEOUT` at the time of the call by default).
+    Returns True if it did, False otherwise.
+    """
     with suppress(Exception):
-        return bool(WebDriverWait(driver, wait).until(method))
+        return bool(wait_for(driver, wait, method, poll_frequency))
     return False
 
 
-__all__ = ['wait_until']
+__all__ = [
+    'WaitListener',
+    'add_wait_listener',
+    'current_poll',
+    'remove_wait_listener',
+    'wait_for',
+    'wait_until'
+    ]
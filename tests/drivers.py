@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+from typing import Any, Dict, List, Optional, Tuple
+
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from shawl.config import SHAWL_CONFIG as CONFIG
+from tests.elements.elements import ButtonElement
+from tests.elements.pages import CustomPage
+
+# W3C reference of the element, which fake drivers find
+ELEMENT = {'element-6066-11e4-a52e-4f735466cecf': 'id'}
+
+
+class FakeExecutor:
+    """
+    Command executor which answers WebDriver commands with canned values
+    and records every command it received.
+
+    Values in `responses` can be callables, they will be called with
+    command parameters.
+    """
+
+    def __init__(self, **responses):
+        self.responses: Dict[str, Any] = responses
+        self.commands: List[Tuple[str, Dict[str, Any]]] = []
+        self.w3c: bool = True
+
+    def execute(self, command: str,
+                params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if command == Command.NEW_SESSION:
+            return {'value': {'sessionId': 'fake', 'capabilities': {}}}
+        self.commands.append((command, params or dict()))
+        value = self.responses.get(command)
+        if callable(value):
+            value = value(params)
+        return {'value': value}
+
+    @property
+    def names(self) -> List[str]:
+        return [command for command, _ in self.commands]
+
+
+def fake_driver(**responses) -> WebDriver:
+    return WebDriver(command_executor=FakeExecutor(**responses))
+
+
+def create_page(**responses) -> CustomPage:
+    """
+    Create CustomPage of tests with buttons over fake driver, which finds
+    ELEMENT and answers script calls, rects of elements and title.
+    `responses` are added to (or override) these ones.
+    """
+    CONFIG.elements_classes_module = ButtonElement.__module__
+    return CustomPage(fake_driver(**{Command.FIND_ELEMENT: ELEMENT,
+                                     Command.W3C_EXECUTE_SCRIPT: True,
+                                     Command.GET_ELEMENT_RECT: {'x': 0,
+                                                                'y': 0},
+                                     Command.GET_TITLE: 'Title',
+                                     **responses}))
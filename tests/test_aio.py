@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+# pylint:disable=protected-access
+# pylint:disable=redefined-outer-name
+# pylint:disable=unused-argument
+import asyncio
+from os import remove
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+pytest.importorskip('aiohttp')
+
+# pylint:disable=wrong-import-position
+from shawl.aio import (
+    AsyncBaseCollection,
+    AsyncBaseElement,
+    AsyncBasePage,
+    AsyncWebDriver,
+    AsyncWebElement
+)
+from shawl.config import SHAWL_CONFIG as CONFIG
+from shawl.exceptions import (
+    InvalidComponentException,
+    NoSuchElementsException
+)
+from tests.drivers import ELEMENT
+
+
+class FakeAsyncDriver(AsyncWebDriver):
+    """
+    Asynchronous driver which answers WebDriver commands with canned values
+    instead of sending them to a remote end. Keys of `responses` are
+    `METHOD /command` strings, e.g. `GET /title`.
+    """
+
+    def __init__(self, **responses):
+        super().__init__('http://fake', session_id='fake')
+        self.responses: Dict[str, Any] = responses
+        self.commands: List[Tuple[str, Any]] = []
+
+    async def request(self,
+                      method: str,
+                      path: str,
+                      body: Optional[Dict[str, Any]] = None) -> Any:
+        command: str = f'{method} {path[len("/session/fake"):]}'
+        self.commands.append((command, body))
+        value = self.responses.get(command)
+        if callable(value):
+            value = value(body)
+        return value
+
+    @property
+    def names(self) -> List[str]:
+        return [command for command, _ in self.commands]
+
+
+class CustomPage(AsyncBasePage):
+    pass
+
+
+def test_page_uses_yaml_spec():
+    page = CustomPage(FakeAsyncDriver())
+    assert repr(page) == 'Page description'
+    assert isinstance(page.search_input, AsyncBaseElement)
+    assert isinstance(page.all_div, AsyncBaseCollection)
+    assert repr(page.search_input) == 'Search input'
+    assert page.page_strings['title_text'] == 'Hello there'
+
+
+def test_element_methods_are_awaited():
+    driver = FakeAsyncDriver(**{'POST /element': ELEMENT,
+                                'GET /element/id/text': 'Search'})
+    page = CustomPage(driver)
+    element = asyncio.run(page.search_input.element())
+    assert isinstance(element, AsyncWebElement)
+    assert asyncio.run(page.search_input.text()) == 'Search'
+    assert driver.commands[0] == ('POST /element',
+                                  {'using': 'css selector',
+                                   'value': '[id="search_form_input_homepage"]'})
+
+
+def test_wait_does_not_block_other_sessions():
+    visible = FakeAsyncDriver(**{'POST /element': ELEMENT,
+                                 'GET /element/id/displayed': True})
+    hidden = FakeAsyncDriver(**{'POST /element': ELEMENT,
+                                'GET /element/id/displayed': False})
+
+    async def check():
+        return await asyncio.gather(
+            CustomPage(visible).search_input.is_visible(wait=1),
+            CustomPage(hidden).search_input.is_visible(wait=1),
+            CustomPage(hidden).search_input.is_invisible(wait=1))
+
+    assert asyncio.run(check()) == [True, False, True]
+    assert len(visible.commands) == 2
+
+
+def test_collection_and_page_checks():
+    driver = FakeAsyncDriver(**{'POST /elements': [ELEMENT, ELEMENT],
+                                'GET /title': 'Hello there',
+                                'GET /url': 'http://example.com/'})
+    page = CustomPage(driver)
+    assert asyncio.run(page.many_a.count()) == 2
+    assert asyncio.run(page.title_contains('Hello', wait=0))
+    assert not asyncio.run(page.url_to_be('http://other.com/', wait=0))
+    asyncio.run(page.validate_current_page(page_name='Hello',
+                                           url='http://example.com/'))
+
+
+def test_empty_collection_raises(monkeypatch):
+    monkeypatch.setattr('shawl.config.SHAWL_CONFIG._lazy_load_timeout', 0)
+    page = CustomPage(FakeAsyncDriver(**{'POST /elements': []}))
+    with pytest.raises(NoSuchElementsException):
+        asyncio.run(page.many_a.collection())
+
+
+def test_frames_are_entered_once():
+    driver = FakeAsyncDriver(**{'POST /element': ELEMENT,
+                                'GET /element/id/enabled': True})
+    element = AsyncBaseElement(driver,
+                               frame={'css selector': 'iframe#pay'},
+                               **{'css selector': 'input'})
+    asyncio.run(element.element())
+    asyncio.run(element.element())
+    assert driver.names.count('POST /frame') == 2
+
+
+def frame_rendered_after(polls: int):
+    """
+    Return response of element lookup, which finds the pay frame
+    only after `polls` failed lookups of it.
+    """
+    lookups = []
+
+    def find(body: Dict[str, str]) -> Dict[str, str]:
+        if body['value'] == 'iframe#pay' and len(lookups) < polls:
+            lookups.append(body)
+            raise NoSuchElementException()
+        return ELEMENT
+
+    return find
+
+
+def test_missing_frame_is_waited_for():
+    driver = FakeAsyncDriver(**{'POST /element': frame_rendered_after(2),
+                                'GET /element/id/enabled': True})
+    element = AsyncBaseElement(driver,
+                               frame={'css selector': 'iframe#pay'},
+                               poll=0.1,
+                               **{'css selector': 'input'})
+    assert asyncio.run(element.is_present(1))
+    assert isinstance(asyncio.run(element.element()), AsyncWebElement)
+
+    driver = FakeAsyncDriver(**{'POST /element': frame_rendered_after(2),
+                                'GET /element/id/enabled': True})
+    element = AsyncBaseElement(driver,
+                               frame={'css selector': 'iframe#pay'},
+                               poll=0.1,
+                               **{'css selector': 'input'})
+    assert isinstance(asyncio.run(element.element()), AsyncWebElement)
+
+
+def test_missing_frame_is_not_present():
+    driver = FakeAsyncDriver(**{'POST /element': frame_rendered_after(1000),
+                                'POST /elements': [ELEMENT]})
+    element = AsyncBaseElement(driver,
+                               frame={'css selector': 'iframe#pay'},
+                               **{'css selector': 'input'})
+    assert not asyncio.run(element.is_present(0.5))
+    assert not asyncio.run(element.is_visible(0.5))
+    assert asyncio.run(element.is_invisible(0.5))
+    collection = AsyncBaseCollection(driver,
+                                     frame={'css selector': 'iframe#pay'},
+                                     **{'css selector': 'li'})
+    assert not asyncio.run(collection.any_is_present(0.5))
+
+
+def test_alternatives_are_tried_in_order():
+
+    def find(body: Dict[str, str]) -> Dict[str, str]:
+        if body['value'] != '#search':
+            raise NoSuchElementException()
+        return ELEMENT
+
+    driver = FakeAsyncDriver(**{'POST /element': find})
+    element = AsyncBaseElement(driver,
+                               alternatives=[{'css selector': '#search'}],
+                               **{'css selector': '#query'})
+    assert asyncio.run(element.is_present(0))
+    assert element.selector == ('css selector', '#search')
+    assert driver.names.count('POST /element') == 2
+    asyncio.run(element.element())
+    assert driver.names.count('POST /element') == 3
+
+
+def test_collection_alternatives_are_tried_in_order():
+
+    def find_all(body: Dict[str, str]) -> List[Dict[str, str]]:
+        return [ELEMENT] if body['value'] == 'li' else []
+
+    driver = FakeAsyncDriver(**{'POST /elements': find_all})
+    collection = AsyncBaseCollection(driver,
+                                     alternatives=[{'css selector': 'li'}],
+                                     **{'css selector': 'li.item'})
+    assert asyncio.run(collection.count()) == 1
+    assert collection.selector == ('css selector', 'li')
+
+
+@pytest.fixture()
+def component_page_yaml_file():
+    file_name = f'{CONFIG.source_yaml_path}/AsyncComponentPage.yaml'
+    with open(file_name, 'w+') as file:
+        file.write('components:\n'
+                   '  header:\n'
+                   '    component: Header\n')
+    yield
+    remove(file_name)
+
+
+def test_components_are_not_supported(component_page_yaml_file):
+    class AsyncComponentPage(AsyncBasePage):
+        pass
+
+    with pytest.raises(InvalidComponentException, match='header'):
+        AsyncComponentPage(FakeAsyncDriver())
+
+
+@pytest.fixture()
+def template_page_yaml_file():
+    file_name = f'{CONFIG.source_yaml_path}/AsyncTemplatePage.yaml'
+    with open(file_name, 'w+') as file:
+        file.write('templates:\n'
+                   '  row:\n'
+                   '    css selector: "tr[data-id=\'{id}\']"\n'
+                   '  cells:\n'
+                   '    css selector: "tr:nth-child({0}) td"\n'
+                   '    collection: true\n')
+    yield
+    remove(file_name)
+
+
+def test_templated_elements(template_page_yaml_file):
+    class AsyncTemplatePage(AsyncBasePage):
+        pass
+
+    page = AsyncTemplatePage(FakeAsyncDriver())
+    row = page.row(id=42)
+    assert isinstance(row, AsyncBaseElement)
+    assert row.selector == ('css selector', "tr[data-id='42']")
+    assert page.row(id=42) is row
+    assert isinstance(page.cells(2), AsyncBaseCollection)
+    assert page.cells(2).selector == ('css selector', 'tr:nth-child(2) td')
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# pylint:disable=redefined-outer-name
+# pylint:disable=unused-argument
+from os import remove
+
+import pytest
+
+from shawl import ActionQueue, BaseComponent, BaseElement, BasePage
+from shawl.config import SHAWL_CONFIG as CONFIG
+from shawl.exceptions import InvalidComponentException
+from shawl.testing import FakeRemoteEnd
+from shawl.transport import clear_pools, connect
+
+URL = 'http://app/'
+HTML = '''
+<header><a class="link" href="#top">Top</a><ul><li>1</li><li>2</li></ul>
+<input class="query"></header>
+<main><a class="link" href="#main">Main</a></main>
+<footer><a class="link" href="#bottom">Bottom</a><ul><li>3</li></ul>
+<input class="query"></footer>
+'''
+
+
+@pytest.fixture()
+def component_yaml_files():
+    files = {
+        'Toolbar.yaml': ('component_repr: Toolbar\n'
+                         'root:\n'
+                         '  css selector: header\n'
+                         'link:\n'
+                         '  a:\n'
+                         '    css selector: a.link\n'
+                         'query:\n'
+                         '  input:\n'
+                         '    css selector: input.query\n'
+                         'collections:\n'
+                         '  items:\n'
+                         '    li:\n'
+                         '      xpath: .//li\n'),
+        'ComponentPage.yaml': ('link:\n'
+                               '  a:\n'
+                               '    css selector: a.link\n'
+                               'components:\n'
+                               '  top:\n'
+                               '    component: Toolbar\n'
+                               '  bottom:\n'
+                               '    component: Toolbar\n'
+                               '    repr: Footer\n'
+                               '    root:\n'
+                               '      css selector: footer\n'
+                               'fields:\n'
+                               '  top_query:\n'
+                               '    read: value\n'
+                               '  bottom_query:\n'
+                               '    read: value\n'),
+        'BrokenPage.yaml': ('components:\n'
+                            '  missing:\n'
+                            '    component: Missing\n'),
+        }
+    CONFIG.elements_classes_module = 'default'
+    for name, content in files.items():
+        with open(f'{CONFIG.source_yaml_path}/{name}', 'w+') as file:
+            file.write(content)
+    yield
+    for name in files:
+        remove(f'{CONFIG.source_yaml_path}/{name}')
+
+
+class ComponentPage(BasePage):
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self.top_query = self.top.query_input
+        self.bottom_query = self.bottom.query_input
+
+
+class BrokenPage(BasePage):
+    pass
+
+
+def test_component_lookups_are_scoped(component_yaml_files):
+    with FakeRemoteEnd({URL: HTML}) as remote:
+        driver = connect(remote.url, {'browserName': 'fake'})
+        driver.get(URL)
+        page = ComponentPage(driver)
+        assert isinstance(page.top, BaseComponent)
+        assert isinstance(page.top.link_a, BaseElement)
+        assert page.top.spec is page.bottom.spec
+        assert (repr(page.top), repr(page.bottom)) == ('Toolbar', 'Footer')
+
+        assert page.link_a.text == 'Top'
+        assert page.top.link_a.text == 'Top'
+        assert page.bottom.link_a.text == 'Bottom'
+        assert len(page.top.items_li) == 2
+        assert len(page.bottom.items_li) == 1
+        assert page.bottom.items_li.any_is_present(wait=0)
+
+        # Root element is cached, children are looked up under it
+        requests = remote.requests
+        assert page.bottom.link_a.is_present(wait=0)
+        assert remote.requests - requests == 1
+
+        # Stale root element is looked up again
+        driver.refresh()
+        assert page.bottom.link_a.is_visible(wait=0)
+        assert page.bottom.link_a.text == 'Bottom'
+        driver.quit()
+    clear_pools()
+
+
+def test_component_elements_are_filled_and_read_under_root(
+        component_yaml_files):
+    with FakeRemoteEnd({URL: HTML}) as remote:
+        driver = connect(remote.url, {'browserName': 'fake'})
+        driver.get(URL)
+        page = ComponentPage(driver)
+        page.fill({'bottom_query': 'shawl'})
+        with ActionQueue(page.top) as queue:
+            queue.fill('query_input', 'top')
+        assert page.extract(['top_query', 'bottom_query']) == ('top',
+                                                               'shawl')
+        driver.quit()
+    clear_pools()
+
+
+def test_unknown_component(component_yaml_files):
+    with pytest.raises(InvalidComponentException):
+        BrokenPage('driver')
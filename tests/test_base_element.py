@@ -1,6 +1,18 @@
 # -*- coding: utf-8 -*-
 # pylint:disable=protected-access
+from selenium.webdriver.remote.command import Command
+
 from shawl import BaseElement
+from shawl.config import SHAWL_CONFIG as CONFIG
+from shawl.testing import FakeRemoteEnd
+from shawl.transport import clear_pools, connect
+from shawl.utils import TimingStats, save_timing_stats
+from shawl.utils._timing_stats import _HISTORY
+from tests.drivers import ELEMENT, fake_driver
+from tests.elements.elements import InputElement
+
+URL = 'http://app/'
+HTML = '<button>Search</button><a href="#web">Web</a>'
 
 
 def test_load_elements():
@@ -22,3 +34,100 @@ def test_check_repr():
 
     c_element = BaseElement('driver', repr_name='Test', **{'xpath': '//div'})
     assert repr(c_element) == 'Test'
+
+
+def test_elements_are_slotted():
+    first = BaseElement('driver', **{'xpath': '//div'})
+    second = BaseElement('driver', **{'xpath': '//div'})
+    assert not hasattr(first, '__dict__')
+    assert first._selectors is second._selectors
+    assert first._selector is second._selector
+    assert first._repr_name is None
+    assert repr(BaseElement('driver', 'Div', **{'xpath': '//div'})) == 'Div'
+
+    input_ = InputElement('driver', **{'xpath': '//div'})
+    input_.custom = 'value'
+    assert input_._selectors is first._selectors
+
+
+def test_type_text_by_chunks():
+    driver = fake_driver(findElement={'element-6066-11e4-a52e-4f735466cecf':
+                                      'input-id'},
+                         isElementEnabled=True,
+                         getElementRect={'x': 0, 'y': 0})
+    b_element = BaseElement(driver, **{'id': 'input'})
+    b_element.type_text('a' * 600, chunk_size=256)
+    typed = [params['text'] for command, params
+             in driver.command_executor.commands
+             if command == 'sendKeysToElement']
+    assert typed == ['a' * 256, 'a' * 256, 'a' * 88]
+    assert driver.command_executor.names.count('clearElement') == 1
+
+
+def test_scroll_to_element():
+    driver = fake_driver(findElement={'element-6066-11e4-a52e-4f735466cecf':
+                                      'div-id'},
+                         isElementEnabled=True,
+                         getElementRect={'x': 0, 'y': 0})
+    BaseElement(driver, **{'id': 'div'}).scroll_to()
+    command, params = driver.command_executor.commands[-1]
+    assert command == 'w3cExecuteScript'
+    assert params['args'][1] == 'scrollTo'
+    assert params['args'][2][1] == 150
+
+
+def test_alternative_selectors(tmp_path):
+    CONFIG.timing_stats_path = str(tmp_path / 'timings.json')
+    try:
+        with FakeRemoteEnd({URL: HTML}) as remote:
+            driver = connect(remote.url, {'browserName': 'fake'})
+            driver.get(URL)
+            button = BaseElement(driver,
+                                 id='missing',
+                                 alternatives=[{'xpath': '//nav/button'},
+                                               {'css selector': 'button'}])
+            assert button.text == 'Search'
+            assert button.selector == ('css selector', 'button')
+            link = BaseElement(driver, id='no-link', **{'link text': 'Web'})
+            assert link.is_visible(wait=1)
+            driver.quit()
+        clear_pools()
+        save_timing_stats()
+
+        stats = TimingStats.load(CONFIG.timing_stats_path)
+        assert stats.fallbacks() == {'id=missing': 'css selector=button',
+                                     'id=no-link': 'link text=Web'}
+        _HISTORY.clear()
+        button = BaseElement('driver',
+                             id='missing',
+                             alternatives=[{'css selector': 'button'}])
+        assert button.selector == ('css selector', 'button')
+    finally:
+        CONFIG.timing_stats_path = ''
+        _HISTORY.clear()
+
+
+def test_alternative_selectors_are_waited_for():
+    found = []
+
+    def find_first(params):
+        # Element is found by the second selector on the second poll
+        found.append(params)
+        return [1, ELEMENT] if len(found) > 1 else [-1, None]
+
+    driver = fake_driver(**{Command.W3C_EXECUTE_SCRIPT: find_first,
+                            Command.FIND_ELEMENT: ELEMENT})
+    button = BaseElement(driver,
+                         id='missing',
+                         alternatives=[{'css selector': 'button'}],
+                         poll=0.01)
+    assert button.is_present(wait=1)
+    assert button.selector == ('css selector', 'button')
+    assert len(found) == 2
+
+    driver = fake_driver(**{Command.W3C_EXECUTE_SCRIPT: [-1, None]})
+    button = BaseElement(driver,
+                         id='missing',
+                         alternatives=[{'css selector': 'button'}])
+    assert button.is_invisible(wait=0)
+    assert driver.command_executor.names == [Command.W3C_EXECUTE_SCRIPT]
@@ -4,14 +4,24 @@
 # pylint:disable=unused-argument
 # pylint:disable=wrong-import-order
 from os import remove
+from time import perf_counter
 
 import pytest
+from selenium.common.exceptions import NoSuchElementException
 
 import tests.elements as init
 from shawl import BaseCollection, BaseElement, BasePage
 from shawl.config import SHAWL_CONFIG as CONFIG
-from shawl.core._base_page import _check_not_none_values, _merge_page_dicts
-from shawl.exceptions import NoneValuesInYamlException
+import shawl.core._page_spec as page_spec
+from shawl.core._page_spec import _check_not_none_values, _merge_page_dicts
+from shawl.exceptions import (
+    InvalidFieldException,
+    InvalidIncludeException,
+    NoneValuesInYamlException
+)
+from shawl.testing import FakeRemoteEnd
+from shawl.transport import clear_pools, connect
+from tests.drivers import fake_driver
 from tests.elements.elements import (
     ButtonElement,
     DivCollection,
@@ -20,6 +30,8 @@ from tests.elements.elements import (
 )
 from tests.elements.pages import CustomPage
 
+URL = 'http://app/'
+
 
 @pytest.fixture()
 def create_yaml_file():
@@ -41,6 +53,27 @@ def create_yaml_file_with_url():
     remove(file_name)
 
 
+@pytest.fixture()
+def create_yaml_file_with_timeouts():
+    file_name = f'{CONFIG.source_yaml_path}/TimeoutsPage.yaml'
+    with open(file_name, 'w+') as file:
+        file.write('element_defaults:\n'
+                   '  timeout: 1\n'
+                   '  poll: 0.1\n'
+                   'report:\n'
+                   '  table:\n'
+                   '    id: report\n'
+                   '    timeout: 30\n'
+                   '    lazy_timeout: 20\n'
+                   'collections:\n'
+                   '  rows:\n'
+                   '    tr:\n'
+                   '      css selector: tr\n'
+                   '      poll: 0.2\n')
+    yield
+    remove(file_name)
+
+
 def test_check_none():
     dict_one = {
         'search': None,
@@ -242,6 +275,142 @@ def test_load_parent_element(create_yaml_file):
     assert p_page.search_input._selector == ('class', '.input_homepage')
 
 
+def test_load_element_timeouts(create_yaml_file_with_timeouts):
+    class TimeoutsPage(CustomPage):
+        pass
+
+    CONFIG.elements_classes_module = 'default'
+    page = TimeoutsPage(fake_driver())
+    assert page.report_table.selector == ('id', 'report')
+    assert (page.report_table._timeout,
+            page.report_table._poll,
+            page.report_table._lazy_timeout) == (30, 0.1, 20)
+    assert (page.search_input._timeout,
+            page.search_input._poll,
+            page.search_input._lazy_timeout) == (1, 0.1, None)
+    assert page.rows_tr.selector == ('css selector', 'tr')
+    assert (page.rows_tr._timeout, page.rows_tr._poll) == (1, 0.2)
+
+    start = perf_counter()
+    assert not page.search_input.is_present()
+    assert 1 <= perf_counter() - start < 2
+
+
+@pytest.fixture()
+def create_yaml_files_with_includes():
+    files = {
+        'SearchForm.yaml': ('search:\n'
+                            '  input:\n'
+                            '    id: included_input\n'
+                            'results:\n'
+                            '  div:\n'
+                            '    id: results\n'
+                            'page_strings:\n'
+                            '  placeholder: Search\n'),
+        'FooterMixin.yaml': ('footer:\n'
+                             '  div:\n'
+                             '    css selector: footer\n'),
+        'IncludingPage.yaml': ('include: SearchForm\n'
+                               'results:\n'
+                               '  div:\n'
+                               '    id: own_results\n'),
+        'CyclePage.yaml': 'include: CycleFragment\n',
+        'CycleFragment.yaml': 'include: [CyclePage]\n',
+        }
+    for name, content in files.items():
+        with open(f'{CONFIG.source_yaml_path}/{name}', 'w+') as file:
+            file.write(content)
+    yield
+    for name in files:
+        remove(f'{CONFIG.source_yaml_path}/{name}')
+
+
+def test_load_includes_and_mixins(create_yaml_files_with_includes,
+                                  monkeypatch):
+    class FooterMixin:
+        pass
+
+    class IncludingPage(FooterMixin, CustomPage):
+        pass
+
+    page = IncludingPage('driver')
+    assert page.results_div.selector == ('id', 'own_results')
+    assert page.search_input.selector == ('id', 'included_input')
+    assert page.search_button.selector == ('id', 'search_button_homepage')
+    assert page.footer_div.selector == ('css selector', 'footer')
+    assert page.page_strings['placeholder'] == 'Search'
+
+    # Resolved files are memoized, pages are built without reading them
+    loads = []
+    load_page = page_spec._load_page
+    monkeypatch.setattr(page_spec, '_load_page',
+                        lambda *args: loads.append(args) or load_page(*args))
+    assert IncludingPage('driver').search_input.selector == (
+        'id', 'included_input')
+    assert not loads
+
+    # Files are not checked for modification unless reload is enabled
+    checks = []
+    modified = page_spec._modified
+    monkeypatch.setattr(page_spec, '_modified',
+                        lambda path: checks.append(path) or modified(path))
+    with open(f'{CONFIG.source_yaml_path}/SearchForm.yaml', 'a') as file:
+        file.write('extra:\n  div:\n    id: extra\n')
+    assert not hasattr(IncludingPage('driver'), 'extra_div')
+    assert not checks
+    with CONFIG.override(reload_yaml=True):
+        assert IncludingPage('driver').extra_div.selector == ('id', 'extra')
+    assert checks
+
+    class CyclePage(BasePage):
+        pass
+
+    with pytest.raises(InvalidIncludeException):
+        CyclePage('driver')
+
+
+@pytest.fixture()
+def create_yaml_file_with_templates():
+    file_name = f'{CONFIG.source_yaml_path}/TemplatePage.yaml'
+    with open(file_name, 'w+') as file:
+        file.write('element_defaults:\n'
+                   '  timeout: 3\n'
+                   'templates:\n'
+                   '  row:\n'
+                   '    xpath: "//tr[@data-id=\'{id}\']"\n'
+                   '    repr: Row {id}\n'
+                   '    tag: button\n'
+                   '    cache_size: 2\n'
+                   '  cells:\n'
+                   '    css selector: "tr:nth-child({0}) td"\n'
+                   '    collection: true\n')
+    yield
+    remove(file_name)
+
+
+def test_templated_elements(create_yaml_file_with_templates):
+    class TemplatePage(BasePage):
+        pass
+
+    CONFIG.elements_classes_module = ButtonElement.__module__
+    page = TemplatePage('driver')
+    row = page.row(id=42)
+    assert isinstance(row, ButtonElement)
+    assert row.selector == ('xpath', "//tr[@data-id='42']")
+    assert (repr(row), row._timeout) == ('Row 42', 3)
+    assert page.row(id=42) is row
+    assert isinstance(page.cells(2), BaseCollection)
+    assert page.cells(2).selector == ('css selector', 'tr:nth-child(2) td')
+
+    first = page.row(id=1)
+    page.row(id=42)
+    page.row(id=2)
+    assert page.row(id=42) is row
+    assert page.row.cache_info() == (3, 3, 2, 2)
+    assert page.row(id=1) is not first
+    assert TemplatePage('driver').row(id=42) is not row
+
+
 def test_load_url(create_yaml_file_with_url):
     class UrlPage(CustomPage):
         domain = 'google.com'
@@ -302,6 +471,18 @@ def test_check_repr():
     assert repr(ep_two) == 'EmptyPageTwo'
 
 
+def test_pages_have_own_dicts():
+    c_page = CustomPage('driver')
+    c_page.page_strings['title_text'] = 'Changed'
+    c_page.fields['query']['read'] = 'text'
+    c_page._element_defaults['timeout'] = 1
+
+    other = CustomPage('driver')
+    assert other.page_strings['title_text'] == 'Hello there'
+    assert other.fields['query']['read'] == 'value'
+    assert 'timeout' not in other._element_defaults
+
+
 def test_check_driver_prop():
     c_page = CustomPage('driver')
     assert c_page.driver == 'driver'
@@ -311,3 +492,157 @@ def test_load_elements():
     b_element = BaseElement('driver', **{'xpath': '//div'})
     assert b_element._element is None
     assert b_element.selector == ('xpath', '//div')
+
+
+def test_extract_fields():
+    driver = fake_driver(
+        w3cExecuteScript=['python', 'true', 3, ['Web', 'Maps']])
+    c_page = CustomPage(driver)
+    record = c_page.extract(['query', 'search_enabled',
+                             'links_count', 'all_li'])
+    assert record.query == 'python'
+    assert record.search_enabled is True
+    assert record.links_count == 3
+    assert record.all_li == ['Web', 'Maps']
+
+    (command, params), = driver.command_executor.commands
+    assert command == 'w3cExecuteScript'
+    assert params['args'][1:] == ['readFields', [[
+        [[['id', 'search_form_input_homepage']], False, 'value', '', None],
+        [[['id', 'search_button_homepage']], False, 'attribute',
+         'data-enabled', None],
+        [[['css selector', 'a']], True, 'count', '', None],
+        [[['xpath', '//li']], True, 'text', '', None]
+        ]]]
+    assert type(record) is type(c_page.extract(['query', 'search_enabled',
+                                                'links_count', 'all_li']))
+
+
+def test_extract_unknown_field():
+    c_page = CustomPage(fake_driver())
+    with pytest.raises(InvalidFieldException):
+        c_page.extract('not_existing')
+    c_page._fields['bad_type'] = {'element': 'search_input', 'type': 'list'}
+    with pytest.raises(InvalidFieldException):
+        c_page.extract('bad_type')
+
+
+@pytest.fixture()
+def create_form_yaml_file():
+    file_name = f'{CONFIG.source_yaml_path}/FormPage.yaml'
+    with open(file_name, 'w+') as file:
+        file.write('name:\n')
+        file.write('  input:\n')
+        file.write('    id: name\n')
+        file.write('agree:\n')
+        file.write('  input:\n')
+        file.write('    id: agree\n')
+        file.write('code:\n')
+        file.write('  input:\n')
+        file.write('    id: code\n')
+        file.write('    keystrokes: true\n')
+        file.write('card:\n')
+        file.write('  input:\n')
+        file.write('    id: card\n')
+        file.write('    frame:\n')
+        file.write('      css selector: iframe#pay\n')
+        file.write('send:\n')
+        file.write('  button:\n')
+        file.write('    id: send\n')
+        file.write('email:\n')
+        file.write('  input:\n')
+        file.write('    id: email\n')
+        file.write('    alternatives:\n')
+        file.write('      - name: mail\n')
+        file.write('fields:\n')
+        file.write('  email:\n')
+        file.write('    element: email_input\n')
+        file.write('    read: value\n')
+    yield
+    remove(file_name)
+
+
+def test_fill_with_one_script(create_form_yaml_file):
+    class FormPage(BasePage):
+        pass
+
+    driver = fake_driver(w3cExecuteScript=-1)
+    f_page = FormPage(driver)
+    assert f_page.code_input.keystrokes is True
+    assert f_page.code_input.selector == ('id', 'code')
+    assert f_page.name_input.keystrokes is False
+    assert f_page.card_input.frames == (('css selector', 'iframe#pay'),)
+    assert f_page.card_input.selector == ('id', 'card')
+
+    f_page.fill({'name_input': 'Bob', 'agree_input': True})
+    (command, params), = driver.command_executor.commands
+    assert command == 'w3cExecuteScript'
+    assert params['args'][1:] == ['runActions',
+                                  [[['fill', [['id', 'name']], 'Bob', None],
+                                    ['fill', [['id', 'agree']], True,
+                                     None]]]]
+
+
+def test_action_queue(create_form_yaml_file):
+    class FormPage(BasePage):
+        pass
+
+    typed = []
+    # Instances of user element classes have __dict__ unlike BaseElement
+    CONFIG.elements_classes_module = InputElement.__module__
+    driver = fake_driver(w3cExecuteScript=-1)
+    f_page = FormPage(driver)
+    f_page.code_input.type_text = typed.append
+
+    with f_page.actions() as queue:
+        queue.fill('name_input', 42).fill('code_input', 1234)
+        queue.click('send_button')
+        assert len(queue) == 3
+        assert not driver.command_executor.commands
+
+    assert typed == ['1234']
+    assert [params['args'][2] for _, params
+            in driver.command_executor.commands] == [
+                [[['fill', [['id', 'name']], '42', None]]],
+                [[['click', [['id', 'send']], None, None]]]]
+
+    driver.command_executor.responses['w3cExecuteScript'] = 0
+    with CONFIG.override(lazy_load_timeout=1):
+        with pytest.raises(NoSuchElementException):
+            f_page.fill({'name_input': 'Bob'})
+    with pytest.raises(AttributeError):
+        f_page.fill({'not_existing': 'Bob'})
+    with pytest.raises(TypeError):
+        f_page.fill({'name_input': None})
+
+
+def test_action_queue_waits_for_missing_element(create_form_yaml_file):
+    class FormPage(BasePage):
+        pass
+
+    # Button is rendered after the click on the first poll
+    failed = iter((1, -1))
+    driver = fake_driver(w3cExecuteScript=lambda _: next(failed))
+    f_page = FormPage(driver)
+    with f_page.actions() as queue:
+        queue.click('send_button').fill('name_input', 'Bob')
+
+    assert [params['args'][2] for _, params
+            in driver.command_executor.commands] == [
+                [[['click', [['id', 'send']], None, None],
+                  ['fill', [['id', 'name']], 'Bob', None]]],
+                [[['fill', [['id', 'name']], 'Bob', None]]]]
+
+
+def test_fill_and_extract_alternatives(create_form_yaml_file):
+    class FormPage(BasePage):
+        pass
+
+    with FakeRemoteEnd({URL: '<input name="mail">'}) as remote:
+        driver = connect(remote.url, {'browserName': 'fake'})
+        driver.get(URL)
+        f_page = FormPage(driver)
+        f_page.fill({'email_input': 'bob@example.com'})
+        assert f_page.extract('email').email == 'bob@example.com'
+        driver.quit()
+    clear_pools()
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+from selenium.common.exceptions import NoSuchElementException
+
+from shawl import BaseElement
+from shawl.utils._browser_context import (
+    find_browser_context,
+    get_browser_context,
+    parse_frames
+)
+from tests.drivers import ELEMENT, fake_driver
+
+PAY_FRAME = {'css selector': 'iframe#pay'}
+CARD_FRAME = {'css selector': 'iframe#card'}
+
+
+def test_parse_frames():
+    assert parse_frames(None) == ()
+    assert parse_frames(PAY_FRAME) == (('css selector', 'iframe#pay'),)
+    assert parse_frames([PAY_FRAME, CARD_FRAME]) == (
+        ('css selector', 'iframe#pay'), ('css selector', 'iframe#card'))
+
+
+def test_switch_only_when_frame_differs():
+    driver = fake_driver(findElement=ELEMENT,
+                         isElementEnabled=True,
+                         getElementRect={'x': 0, 'y': 0})
+    executor = driver.command_executor
+    in_frame = BaseElement(driver, frame=PAY_FRAME, **{'id': 'card'})
+    nested = BaseElement(driver, frame=[PAY_FRAME, CARD_FRAME],
+                         **{'id': 'number'})
+    on_top = BaseElement(driver, **{'id': 'total'})
+
+    assert find_browser_context(driver) is None
+    assert in_frame.element
+    assert in_frame.element
+    assert executor.names.count('switchToFrame') == 2
+
+    executor.commands.clear()
+    assert nested.element
+    assert executor.names.count('switchToFrame') == 1
+    assert in_frame.element
+    assert executor.names.count('switchToParentFrame') == 1
+
+    executor.commands.clear()
+    assert on_top.element
+    assert on_top.element
+    assert executor.names.count('switchToFrame') == 1
+    assert get_browser_context(driver).frames == ()
+
+
+def test_track_direct_switches_and_navigation():
+    driver = fake_driver(findElement=ELEMENT)
+    context = get_browser_context(driver)
+    context.switch(driver, parse_frames(PAY_FRAME))
+    driver.switch_to.frame(0)
+    assert context.frames is None
+    driver.get('http://home/')
+    assert context.frames == ()
+    driver.switch_to.window('second')
+    assert context.window == 'second'
+
+    driver.command_executor.commands.clear()
+    context.switch(driver, window='second')
+    with context.scope(driver, window='first'):
+        assert context.window == 'first'
+    assert context.window == 'second'
+    assert driver.command_executor.names == ['switchToWindow',
+                                             'switchToWindow']
+
+
+def test_unknown_frame_is_kept_for_elements_without_frame():
+    driver = fake_driver(findElement=ELEMENT,
+                         isElementEnabled=True,
+                         getElementRect={'x': 0, 'y': 0})
+    context = get_browser_context(driver)
+    driver.switch_to.frame(driver.find_element('id', 'frm'))
+    assert context.frames is None
+
+    driver.command_executor.commands.clear()
+    assert BaseElement(driver, **{'id': 'inside'}).element
+    assert 'switchToFrame' not in driver.command_executor.names
+
+
+def frame_rendered_after(polls: int):
+    """
+    Return findElement response, which finds the pay frame
+    only after `polls` failed lookups of it.
+    """
+    lookups = []
+
+    def find_element(params):
+        if params['value'] == 'iframe#pay' and len(lookups) < polls:
+            lookups.append(params)
+            raise NoSuchElementException('no such element: iframe#pay')
+        return ELEMENT
+
+    return find_element
+
+
+def test_missing_frame_is_waited_for():
+    driver = fake_driver(findElement=frame_rendered_after(2),
+                         isElementEnabled=True,
+                         getElementRect={'x': 0, 'y': 0})
+    element = BaseElement(driver, frame=PAY_FRAME, **{'id': 'card'})
+    assert element.is_present(wait=2)
+    assert get_browser_context(driver).frames == parse_frames(PAY_FRAME)
+
+
+def test_missing_frame_is_not_present():
+    driver = fake_driver(findElement=frame_rendered_after(1000))
+    element = BaseElement(driver, frame=PAY_FRAME, **{'id': 'card'})
+    assert not element.is_present(wait=0.5)
+    assert element.is_invisible(wait=0.5)
+
+
+def test_lazy_load_waits_for_frame():
+    driver = fake_driver(findElement=frame_rendered_after(2),
+                         isElementEnabled=True,
+                         getElementRect={'x': 0, 'y': 0})
+    element = BaseElement(driver, frame=PAY_FRAME, **{'id': 'card'})
+    assert element.element
+    assert get_browser_context(driver).frames == parse_frames(PAY_FRAME)
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+from threading import Barrier, Thread
+
+import pytest
+from selenium.webdriver.remote.command import Command
+
+import shawl
+from shawl.exceptions import BudgetExceededException
+from tests.drivers import create_page
+
+
+def test_budget_as_context_manager():
+    page = create_page()
+    with shawl.budget(max_commands=10, max_wait_seconds=1) as budget:
+        page.click_on_search_btn()
+    assert budget.commands[Command.CLICK_ELEMENT] == 1
+    assert budget.wait_seconds > 0
+
+    with pytest.raises(BudgetExceededException, match='clickElement: 1'):
+        with shawl.budget(max_commands=2):
+            page.click_on_search_btn()
+
+
+def test_budget_counts_lazy_load_of_element():
+    page = create_page()
+    with shawl.budget(max_wait_seconds=1) as budget:
+        page.search_button.click()
+    assert budget.wait_seconds > 0
+
+    with pytest.raises(BudgetExceededException, match='waits took'):
+        with shawl.budget(max_wait_seconds=0):
+            create_page().search_button.click()
+
+
+def test_budget_as_decorator():
+    page = create_page()
+
+    @shawl.budget(max_commands=1)
+    def read_title():
+        return page.driver.title
+
+    assert read_title() == 'Title'
+
+    @shawl.budget(max_commands=1)
+    def read_title_twice():
+        return page.driver.title + page.driver.title
+
+    with pytest.raises(BudgetExceededException):
+        read_title_twice()
+
+
+def test_decorated_function_calls_have_own_budgets():
+    page = create_page()
+    barrier = Barrier(2)
+    errors = []
+
+    @shawl.budget(max_commands=1)
+    def read_title():
+        title = page.driver.title
+        # Both calls are inside the budget at the same time
+        barrier.wait(5)
+        return title
+
+    def call():
+        try:
+            read_title()
+        except Exception as error:  # pylint: disable=broad-except
+            errors.append(error)
+
+    threads = [Thread(target=call) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+
+
+def test_budget_counts_only_own_thread():
+    page = create_page()
+    other = create_page()
+    with shawl.budget(max_commands=1) as budget:
+        thread = Thread(target=lambda: [other.driver.title
+                                        for _ in range(5)])
+        thread.start()
+        thread.join()
+        assert page.driver.title == 'Title'
+    assert budget.total_commands == 1
@@ -2,8 +2,12 @@
 # pylint:disable=redefined-outer-name
 # pylint:disable=protected-access
 # pylint:disable=unused-argument
+import asyncio
+import subprocess
+import sys
 from os import environ, getcwd, mkdir, remove, rmdir
 from os.path import join
+from threading import Thread
 
 import pytest
 
@@ -132,3 +136,55 @@ def test_yaml_map():
         }
     new_conf = ShawlConfig()
     assert file_map == new_conf.yaml_map
+
+
+def test_override_is_local_to_context():
+    default = CONFIG.wait_timeout
+    seen = dict()
+
+    def worker():
+        seen['thread'] = CONFIG.wait_timeout
+
+    with CONFIG.override(wait_timeout=30, use_allure='false'):
+        assert CONFIG.wait_timeout == 30
+        assert CONFIG.use_allure is False
+        with CONFIG.override(wait_timeout=1):
+            assert CONFIG.wait_timeout == 1
+            assert CONFIG.use_allure is False
+        assert CONFIG.wait_timeout == 30
+        thread = Thread(target=worker)
+        thread.start()
+        thread.join()
+    assert seen['thread'] == default
+    assert CONFIG.wait_timeout == default
+    assert CONFIG.use_allure is True
+
+    async def task(timeout):
+        with CONFIG.override(wait_timeout=timeout):
+            await asyncio.sleep(0)
+            return CONFIG.wait_timeout
+
+    async def tasks():
+        return await asyncio.gather(task(1), task(2))
+
+    assert asyncio.run(tasks()) == [1, 2]
+
+    with pytest.raises(ShawlConfigError):
+        with CONFIG.override(wait_timeout=0):
+            pass
+    with pytest.raises(ShawlConfigError):
+        with CONFIG.override(yaml_map=dict()):
+            pass
+
+
+def test_import_is_lazy():
+    script = (
+        'import sys, shawl\n'
+        'from shawl.config import SHAWL_CONFIG\n'
+        'heavy = {"selenium", "yaml", "dotenv", "allure_commons", "wrapt"}\n'
+        'assert not heavy & set(sys.modules), heavy & set(sys.modules)\n'
+        'assert "_rc_file" not in SHAWL_CONFIG.__dict__\n'
+        'assert SHAWL_CONFIG.wait_timeout > 0\n'
+        'assert shawl.BasePage.__name__ == "BasePage"\n'
+        'assert "allure_commons" not in sys.modules\n')
+    subprocess.run([sys.executable, '-c', script], check=True, cwd=CWD)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# pylint:disable=redefined-outer-name
+import pytest
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException
+)
+
+from shawl.config import SHAWL_CONFIG as CONFIG
+from shawl.testing import Document, FakeRemoteEnd
+from shawl.testing._dom import find
+from shawl.transport import clear_pools, connect
+from tests.elements.elements import ButtonElement
+from tests.elements.pages import CustomPage
+
+URL = 'http://app/'
+HTML = '''
+<html>
+  <head><title>Hello there</title></head>
+  <body>
+    <form>
+      <input id="search_form_input_homepage" name="q" value="">
+      <button id="search_button_homepage">Search</button>
+    </form>
+    <a class="js-zci-link--web" href="#web">Web</a>
+    <div><li>One</li><li style="display: none">Two</li></div>
+  </body>
+</html>
+'''
+
+
+@pytest.fixture()
+def driver():
+    with FakeRemoteEnd({URL: HTML}) as remote:
+        driver = connect(remote.url, {'browserName': 'fake'})
+        driver.get(URL)
+        yield driver
+        driver.quit()
+    clear_pools()
+
+
+def test_document_selectors():
+    document = Document(HTML, URL)
+    assert document.title == 'Hello there'
+    for by, value, count in (('css selector', 'form > input[name=q]', 1),
+                             ('css selector', 'div li, a', 3),
+                             ('xpath', '//div/li[2]', 1),
+                             ('xpath', "//*[contains(@class, 'zci')]", 1),
+                             ('link text', 'Web', 1),
+                             ('tag name', 'li', 2)):
+        assert len(find(document, by, value)) == count
+
+
+def test_page_over_fake_remote_end(driver):
+    CONFIG.elements_classes_module = ButtonElement.__module__
+    page = CustomPage(driver)
+    assert page.title_is('Hello there')
+    page.search_input.send_keys('shawl')
+    assert page.search_input.get_attribute('value') == 'shawl'
+    assert page.search_button.text == 'Search'
+    assert len(page.all_li.collection) == 2
+    assert [li.is_displayed() for li in page.all_li.collection] == [True,
+                                                                    False]
+    with pytest.raises(NoSuchElementException):
+        driver.find_element_by_id('missing')
+
+
+def test_elements_become_stale_after_navigation(driver):
+    button = driver.find_element_by_id('search_button_homepage')
+    driver.refresh()
+    with pytest.raises(StaleElementReferenceException):
+        button.click()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# pylint:disable=redefined-outer-name
+import gc
+
+import pytest
+
+from shawl import BaseCollection, BaseElement
+from shawl.config import SHAWL_CONFIG as CONFIG
+from shawl.testing import FakeRemoteEnd
+from shawl.transport import clear_pools, connect
+from shawl.utils import registered_pages
+from shawl.utils._handles import handle_registry
+from tests.elements.elements import ButtonElement
+from tests.elements.pages import CustomPage
+
+URL = 'http://app/'
+HTML = '''
+<title>Handles</title>
+<input id="search_form_input_homepage">
+<button id="search_button_homepage">Search</button>
+<ul><li>one</li><li>two</li><li>three</li></ul>
+'''
+
+
+@pytest.fixture()
+def driver():
+    CONFIG.max_cached_handles = 3
+    with FakeRemoteEnd({URL: HTML}) as remote:
+        driver = connect(remote.url, {'browserName': 'fake'})
+        driver.get(URL)
+        yield driver
+        driver.quit()
+    clear_pools()
+    CONFIG.max_cached_handles = 0
+
+
+def test_handles_are_bounded_and_released_on_navigation(driver):
+    button = BaseElement(driver, id='search_button_homepage')
+    items = BaseCollection(driver, **{'tag name': 'li'})
+    registry = handle_registry(driver)
+
+    assert button.text == 'Search'
+    assert registry.handles == 1
+    assert len(items) == 3
+    # Least recently used button is released to stay within the limit
+    assert registry.handles == 3
+    assert str(button).endswith('Element: None')
+
+    assert button.text == 'Search'
+    assert registry.handles == 1
+    assert str(items).endswith('Collection: []')
+
+    driver.refresh()
+    assert registry.handles == 0
+    assert str(button).endswith('Element: None')
+    assert button.text == 'Search'
+    assert registry.released == 3
+
+
+def test_pages_are_kept_by_weak_references(driver):
+    CONFIG.elements_classes_module = ButtonElement.__module__
+    page = CustomPage(driver)
+    assert page.search_button.text == 'Search'
+    assert registered_pages(driver) == [page]
+
+    del page
+    gc.collect()
+    assert not registered_pages(driver)
+    assert handle_registry(driver).handles == 0
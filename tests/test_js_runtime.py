@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+# pylint:disable=protected-access
+from shawl.utils._js_runtime import _MISSING, RUNTIME_VERSION, call_helper
+from tests.drivers import fake_driver
+
+
+def test_call_installed_helper():
+    driver = fake_driver(w3cExecuteScript=5)
+    assert call_helper(driver, 'readFields', [1, 2]) == 5
+    (_, params), = driver.command_executor.commands
+    assert params['args'] == [RUNTIME_VERSION, 'readFields', [[1, 2]]]
+    assert 'window.__shawl =' not in params['script']
+
+
+def test_install_runtime_when_missing():
+    responses = iter((_MISSING, 5, 6))
+    driver = fake_driver(w3cExecuteScript=lambda _: next(responses))
+    assert call_helper(driver, 'find', 'id', 'name', False) == 5
+    assert call_helper(driver, 'find', 'id', 'name', False) == 6
+    scripts = [params['script'] for _, params
+               in driver.command_executor.commands]
+    assert len(scripts) == 3
+    assert 'window.__shawl =' not in scripts[0]
+    assert 'window.__shawl =' in scripts[1]
+    assert scripts[2] == scripts[0]
+
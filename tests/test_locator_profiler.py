@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+from shawl.config import SHAWL_CONFIG as CONFIG
+from shawl.testing import FakeRemoteEnd
+from shawl.transport import clear_pools, connect
+from shawl.utils import profile_locators
+from shawl.utils._locator_profiler import (format_report, locator_warnings,
+                                           xpath_to_css)
+
+URL = 'http://app/'
+HTML = '''
+<title>Hello there</title>
+<input id="search_form_input_homepage">
+<div><ul><li>one</li><li>two</li></ul></div>
+'''
+
+
+def test_xpath_to_css():
+    assert xpath_to_css("//div[@id='a']//li") == 'div#a li'
+    assert xpath_to_css('//ul/li[@class="item"]') == 'ul > li[class="item"]'
+    assert xpath_to_css("//a[contains(@href, 'maps')]") == 'a[href*="maps"]'
+    assert xpath_to_css('//ul/li[2]') is None
+    assert xpath_to_css("//a[text()='Maps']") is None
+    # Quotes and backslashes of values are escaped in CSS strings
+    assert xpath_to_css("""//a[@title='Say "hi"']""") == (
+        'a[title="Say \\"hi\\""]')
+    assert xpath_to_css("//a[contains(@href, 'C:\\')]") == (
+        'a[href*="C:\\\\"]')
+
+
+def test_locator_warnings():
+    assert locator_warnings('id', 'button') == []
+    assert 'leading // scans the whole document' in locator_warnings(
+        'xpath', "//*[contains(@class, 'x')]")
+    assert locator_warnings('css selector', 'div > *[data-x]') == [
+        'universal selector scan']
+    assert locator_warnings('partial link text', 'Maps')
+    # Child and sibling combinators are not descendant steps
+    assert not locator_warnings('css selector', 'ul > li + li ~ li')
+    assert not locator_warnings('css selector', 'a [title="x y z w"]')
+    assert locator_warnings('css selector', 'main div ul li') == [
+        'deep descendant path']
+
+
+def test_profile_locators():
+    with FakeRemoteEnd({URL: HTML}) as remote:
+        driver = connect(remote.url, {'browserName': 'fake'})
+        driver.get(URL)
+        costs = profile_locators(driver, ['CustomPage'], repeat=3)
+        driver.quit()
+    clear_pools()
+
+    by_element = {cost.element: cost for cost in costs}
+    assert by_element['search_input'].matches == 1
+    assert by_element['search_button'].matches == 0
+    assert by_element['all_li'].matches == 2
+    assert by_element['all_li'].css == 'li'
+    assert all(cost.median >= 0 and not cost.error for cost in costs)
+    assert costs == sorted(costs, key=lambda cost: -cost.median)
+    assert 'CustomPage.all_li' in format_report(costs)
+
+
+def test_profile_locators_of_components(tmp_path):
+    (tmp_path / 'Toolbar.yaml').write_text('component_repr: Toolbar\n'
+                                           'root:\n'
+                                           '  css selector: div\n'
+                                           'item:\n'
+                                           '  li:\n'
+                                           '    xpath: .//li\n')
+    (tmp_path / 'ToolbarPage.yaml').write_text('search:\n'
+                                               '  input:\n'
+                                               '    id: search\n')
+    with CONFIG.override(source_yaml_path=str(tmp_path)):
+        with FakeRemoteEnd({URL: HTML}) as remote:
+            driver = connect(remote.url, {'browserName': 'fake'})
+            driver.get(URL)
+            costs = profile_locators(driver, repeat=3)
+            driver.quit()
+    clear_pools()
+
+    by_element = {(cost.page, cost.element): cost for cost in costs}
+    assert set(by_element) == {('Toolbar', 'root'),
+                               ('Toolbar', 'item_li'),
+                               ('ToolbarPage', 'search_input')}
+    assert by_element['Toolbar', 'root'].matches == 1
+    # Locators of components are relative to their root element
+    assert by_element['Toolbar', 'item_li'].matches == 2
+    assert not any(cost.error for cost in costs)
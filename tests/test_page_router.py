@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# pylint:disable=redefined-outer-name
+# pylint:disable=unused-argument
+from os import remove
+
+import pytest
+
+from shawl import BasePage, PageRouter
+from shawl.config import SHAWL_CONFIG as CONFIG
+from shawl.exceptions import RouteConflictException
+from tests.drivers import fake_driver
+
+PATTERNS = {
+    'RouterHomePage': 'http://{}/',
+    'RouterLoginPage': 'https://{}/login',
+    'RouterUserPage': 'http://{}/users/{}',
+    'RouterSettingsPage': 'http://{}/users/settings',
+    'RouterItemPage': 'http://{}/items/item-{}.html',
+    'RouterTwinPage': 'http://{}/login',
+    'RouterLoginSubPage': 'http://{}/login',
+    }
+
+
+class RouterHomePage(BasePage):
+    pass
+
+
+class RouterLoginPage(BasePage):
+    pass
+
+
+class RouterUserPage(BasePage):
+    pass
+
+
+class RouterSettingsPage(BasePage):
+    pass
+
+
+class RouterItemPage(BasePage):
+    pass
+
+
+class RouterTwinPage(BasePage):
+    pass
+
+
+class RouterLoginSubPage(RouterLoginPage):
+    pass
+
+
+@pytest.fixture()
+def router_yaml_files():
+    CONFIG.elements_classes_module = 'default'
+    for name, pattern in PATTERNS.items():
+        with open(f'{CONFIG.source_yaml_path}/{name}.yaml', 'w+') as file:
+            file.write(f'url_pattern: "{pattern}"\n')
+    yield
+    for name in PATTERNS:
+        remove(f'{CONFIG.source_yaml_path}/{name}.yaml')
+
+
+def test_resolve_page_by_url(router_yaml_files):
+    router = PageRouter([RouterHomePage,
+                         RouterLoginPage,
+                         RouterUserPage,
+                         RouterSettingsPage,
+                         RouterItemPage,
+                         BasePage])
+    assert len(router) == 5
+    assert BasePage not in router
+    assert router.resolve('http://shop.com') is RouterHomePage
+    assert router.resolve('http://shop.com/login?next=/') is RouterLoginPage
+    assert router.resolve('http://shop.com/users/42#top') is RouterUserPage
+    assert router.resolve('http://shop.com/users/settings/') is (
+        RouterSettingsPage)
+    assert router.resolve('http://shop.com/items/item-7.html') is (
+        RouterItemPage)
+    assert router.resolve('http://shop.com/items/item-7.htm') is None
+    assert router.resolve('http://shop.com/users/42/edit') is None
+
+    page = router.current_page(
+        fake_driver(getCurrentUrl='http://shop.com/users/42'))
+    assert isinstance(page, RouterUserPage)
+    assert router.current_page(
+        fake_driver(getCurrentUrl='http://shop.com/cart')) is None
+
+
+def test_route_conflicts(router_yaml_files):
+    class RouterLoginNoYamlPage(RouterLoginSubPage):
+        pass
+
+    router = PageRouter([RouterLoginSubPage, RouterLoginPage])
+    assert router.resolve('http://shop.com/login') is RouterLoginSubPage
+    assert RouterLoginPage not in router
+    assert len(PageRouter.from_subclasses(RouterLoginPage)) == 1
+    assert RouterLoginNoYamlPage not in router
+    with pytest.raises(RouteConflictException):
+        router.register(RouterTwinPage)
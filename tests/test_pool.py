@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# pylint:disable=protected-access
+# pylint:disable=too-few-public-methods
+from threading import Thread
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+
+from shawl.exceptions import PoolClosedException, PoolTimeoutException
+from shawl.pool import SessionPool
+from tests.drivers import fake_driver
+
+
+class CustomPage:
+
+    def __init__(self, driver):
+        self.driver = driver
+
+
+class OtherPage(CustomPage):
+    pass
+
+
+def create_driver():
+    return fake_driver(**{Command.W3C_GET_WINDOW_HANDLES: ['w1']})
+
+
+def test_lease_resets_session():
+    pool = SessionPool(create_driver, size=1)
+    with pool.lease() as driver:
+        assert pool.leased == 1
+    assert pool.idle == 1
+    names = driver.command_executor.names
+    assert Command.DELETE_ALL_COOKIES in names
+    assert Command.W3C_EXECUTE_SCRIPT in names
+    with pool.lease() as same_driver:
+        assert same_driver is driver
+
+
+def test_dead_session_is_replaced():
+    pool = SessionPool(create_driver, size=1)
+    pool.warm()
+    dead = pool._idle[0].driver
+    dead.command_executor.responses[Command.W3C_GET_WINDOW_HANDLES] = []
+    with pool.lease() as driver:
+        assert driver is not dead
+    assert Command.QUIT in dead.command_executor.names
+
+
+def test_warm_raises_factory_error():
+    created = []
+
+    def factory():
+        created.append(None)
+        if len(created) > 1:
+            raise WebDriverException('Browser is not started')
+        return create_driver()
+
+    pool = SessionPool(factory, size=3)
+    with pytest.raises(WebDriverException, match='Browser is not started'):
+        pool.warm()
+    # Created session is kept, places of failed ones are free
+    assert pool.idle == 1
+    created.clear()
+    with pool.lease(), pool.lease():
+        assert pool.leased == 2
+
+
+def test_page_affinity():
+    pool = SessionPool(create_driver, size=2)
+    with pool.page(CustomPage) as custom, pool.page(OtherPage) as other:
+        assert isinstance(custom, CustomPage)
+    with pool.page(CustomPage) as page:
+        assert page.driver is custom.driver
+    with pool.page(OtherPage) as page:
+        assert page.driver is other.driver
+
+
+def test_exhausted_pool_waits():
+    pool = SessionPool(create_driver, size=1, timeout=0.1)
+    driver = pool.acquire()
+    with pytest.raises(PoolTimeoutException):
+        pool.acquire()
+
+    acquired = []
+    waiter = Thread(target=lambda: acquired.append(pool.acquire(timeout=5)))
+    waiter.start()
+    pool.release(driver)
+    waiter.join()
+    assert acquired == [driver]
+
+
+def test_failed_lease_quits_session():
+    pool = SessionPool(create_driver, size=1)
+    with pytest.raises(WebDriverException):
+        with pool.lease() as driver:
+            raise WebDriverException('browser crashed')
+    assert pool.idle == 0
+    assert Command.QUIT in driver.command_executor.names
+    pool.close()
+    with pytest.raises(PoolClosedException):
+        pool.acquire()
+
+
+def test_failed_health_check_frees_place():
+
+    def health_check(driver):
+        raise WebDriverException('session is gone')
+
+    pool = SessionPool(create_driver, size=1, timeout=0.1,
+                       health_check=health_check)
+    pool.warm()
+    dead = pool._idle[0].driver
+    driver = pool.acquire()
+    assert driver is not dead
+    assert Command.QUIT in dead.command_executor.names
+    assert pool.leased == 1
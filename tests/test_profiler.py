@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+import json
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from shawl import Profiler
+from tests.drivers import ELEMENT, create_page
+
+
+def test_records_commands_of_page_methods(tmp_path):
+    page = create_page()
+    with Profiler() as profiler:
+        page.click_on_search_btn()
+
+    assert WebDriver.execute.__name__ == 'execute'
+    commands = [record.command for record in profiler.commands]
+    assert Command.CLICK_ELEMENT in commands
+    click = profiler.commands[commands.index(Command.CLICK_ELEMENT)]
+    assert (click.page, click.element) == ('Page description',
+                                           "ButtonElement: "
+                                           "('id', 'search_button_homepage')")
+    assert click.request_bytes > 0
+
+    visible, load = profiler.waits
+    assert visible.polls == 1 and visible.result
+    assert load.polls == 1 and load.result
+    assert profiler.commands[0].poll == 1
+
+    summary = profiler.summary()
+    assert summary['commands'] == len(commands)
+    assert summary['by_command'][Command.CLICK_ELEMENT]['count'] == 1
+    assert sum(profiler.histograms()[Command.CLICK_ELEMENT].values()) == 1
+
+    profiler.export_chrome_trace(str(tmp_path / 'trace.json'))
+    with open(tmp_path / 'trace.json', encoding='utf-8') as file:
+        events = json.load(file)['traceEvents']
+    assert {event['cat'] for event in events} == {'wait', 'command'}
+    profiler.export_json(str(tmp_path / 'profile.json'))
+
+
+def test_disabled_profiler_records_nothing():
+    page = create_page()
+    profiler = Profiler()
+    page.search_button.click()
+    assert not profiler.commands
+
+    @profiler
+    def click():
+        page.search_button.click()
+
+    click()
+    assert profiler.commands[-1].command == Command.CLICK_ELEMENT
+    assert not profiler.enabled
+
+
+def test_records_lazy_load_of_element():
+    page = create_page()
+    found = []
+
+    def find_element(params):
+        # Element appears on the second poll
+        found.append(params)
+        if len(found) < 2:
+            raise NoSuchElementException()
+        return ELEMENT
+
+    page.driver.command_executor.responses[Command.FIND_ELEMENT] = (
+        find_element)
+    with Profiler() as profiler:
+        page.search_button.click()
+
+    wait, = profiler.waits
+    assert wait.polls == 2 and wait.result
+    assert wait.sleep > 0
+    assert wait.element == "ButtonElement: ('id', 'search_button_homepage')"
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from shawl import CachingDriver
+from shawl.utils import wait_until
+from tests.drivers import fake_driver
+
+
+def test_memoize_reads_in_step():
+    driver = CachingDriver(fake_driver(getTitle='Home',
+                                       getCurrentUrl='http://home/'))
+    assert isinstance(driver, WebDriver)
+    executor = driver.command_executor
+
+    assert driver.title == 'Home'
+    assert driver.title == 'Home'
+    assert executor.names == ['getTitle', 'getTitle']
+
+    executor.commands.clear()
+    with driver.step():
+        assert driver.title == 'Home'
+        assert driver.current_url == 'http://home/'
+        assert driver.title == 'Home'
+        assert driver.current_url == 'http://home/'
+    assert executor.names == ['getTitle', 'getCurrentUrl']
+    assert (driver.hits, driver.misses) == (2, 2)
+
+
+def test_invalidate_after_mutating_command():
+    driver = CachingDriver(fake_driver(getTitle='Home',
+                                       w3cGetWindowHandles=['one', 'two']))
+    executor = driver.command_executor
+    with driver.step():
+        assert driver.window_handles == ['one', 'two']
+        driver.window_handles.append('three')
+        assert driver.window_handles == ['one', 'two']
+        assert driver.title == 'Home'
+        driver.find_element_by_id('read_only')
+        assert driver.title == 'Home'
+        driver.execute_script('return 1')
+        assert driver.title == 'Home'
+        driver.switch_to.window('two')
+        assert driver.window_handles == ['one', 'two']
+    assert executor.names == ['w3cGetWindowHandles', 'getTitle',
+                              'findElement', 'w3cExecuteScript', 'getTitle',
+                              'switchToWindow', 'w3cGetWindowHandles']
+
+
+def test_wait_polls_are_not_memoized():
+    titles = iter(('Loading', 'Loading', 'Home'))
+    driver = CachingDriver(fake_driver(getTitle=lambda _: next(titles)))
+    with driver.step():
+        assert driver.title == 'Loading'
+        assert wait_until(driver, 2, lambda d: d.title == 'Home')
+
+
+def test_detach():
+    driver = CachingDriver(fake_driver(getTitle='Home'))
+    driver.detach()
+    assert 'execute' not in driver.__wrapped__.__dict__
+    with driver.step():
+        assert driver.title == 'Home'
+        assert driver.title == 'Home'
+    assert driver.command_executor.names == ['getTitle', 'getTitle']
+
+
+def test_nested_step_keeps_memoized_reads():
+    driver = CachingDriver(fake_driver(getTitle='Home'))
+    with driver.step():
+        assert driver.title == 'Home'
+        with driver.step():
+            assert driver.title == 'Home'
+        assert driver.title == 'Home'
+    assert driver.title == 'Home'
+    assert driver.command_executor.names == ['getTitle', 'getTitle']
+    assert (driver.hits, driver.misses) == (2, 1)
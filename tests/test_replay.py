@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+from shawl.config import SHAWL_CONFIG as CONFIG
+from shawl.exceptions import ReplayMismatchException
+from shawl.testing import FakeRemoteEnd, replay
+from shawl.transport import clear_pools, connect
+from shawl.utils import Recorder, Recording
+from tests.elements.elements import ButtonElement
+from tests.elements.pages import CustomPage
+
+URL = 'http://app/'
+HTML = '''
+<title>Hello there</title>
+<input id="search_form_input_homepage">
+<button id="search_button_homepage">Search</button>
+'''
+
+
+def search(driver, text='shawl'):
+    page = CustomPage(driver)
+    page.search_input.send_keys(text)
+    text = page.search_button.text
+    with pytest.raises(NoSuchElementException):
+        driver.find_element_by_id('missing')
+    return text
+
+
+def test_record_and_replay(tmp_path):
+    CONFIG.elements_classes_module = ButtonElement.__module__
+    path = str(tmp_path / 'search.jsonl.gz')
+    with FakeRemoteEnd({URL: HTML}) as remote:
+        driver = connect(remote.url, {'browserName': 'fake'})
+        driver.get(URL)
+        with Recorder(driver) as recorder:
+            assert search(driver) == 'Search'
+        recorder.save(path)
+        driver.quit()
+    clear_pools()
+
+    recording = Recording.load(path)
+    assert recording.counts() == recorder.recording.counts()
+    assert recording.counts()['sendKeysToElement'] == 1
+    assert any('Search input' in element
+               for element in recording.counts('element'))
+
+    replayed = replay(path, time_scale=0)
+    assert search(replayed) == 'Search'
+    connection = replayed.command_executor
+    assert connection.skipped == 0
+    assert connection.position == len(recording)
+    with pytest.raises(ReplayMismatchException):
+        replayed.title  # pylint: disable=pointless-statement
+    replayed.quit()
+
+    strict = replay(recording, time_scale=0)
+    with pytest.raises(ReplayMismatchException, match='sendKeysToElement'):
+        search(strict, 'other')
+
+    relaxed = replay(recording, time_scale=0, strict=False)
+    assert search(relaxed, 'other') == 'Search'
+    assert relaxed.command_executor.skipped == 0
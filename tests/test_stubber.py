@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# pylint:disable=redefined-outer-name
+import importlib
+import json
+import sys
+
+import pytest
+
+from shawl.config import SHAWL_CONFIG as CONFIG
+from shawl.utils import create_stubs
+from shawl.utils._stubber import STUBS_MANIFEST
+
+PAGES = '''
+from shawl import BasePage
+
+
+class StubbedPage(BasePage):
+
+    def search(self, text: str):
+        self.query_input.send_keys(text)
+'''
+ELEMENTS = '''
+from shawl import BaseElement
+
+
+class InputElement(BaseElement):
+    pass
+'''
+YAML = '''
+query:
+  input:
+    id: query
+search:
+  button:
+    id: search
+'''
+
+
+@pytest.fixture()
+def project(tmp_path, monkeypatch):
+    root = CONFIG.project_root_path
+    (tmp_path / 'yaml').mkdir()
+    (tmp_path / 'yaml' / 'StubbedPage.yaml').write_text(YAML)
+    package = tmp_path / 'stubbed'
+    package.mkdir()
+    (package / '__init__.py').touch()
+    (package / 'pages.py').write_text(PAGES)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    CONFIG.elements_classes_module = 'default'
+    CONFIG.project_root_path = str(tmp_path)
+    with CONFIG.override(source_yaml_path=str(tmp_path / 'yaml')):
+        yield tmp_path
+    CONFIG.project_root_path = root
+    CONFIG.elements_classes_module = 'default'
+    for module in ('stubbed', 'stubbed.elements', 'stubbed.pages'):
+        sys.modules.pop(module, None)
+
+
+def test_stubs_are_created_for_changed_modules_only(project):
+    yaml_path = str(project / 'yaml')
+    stub = project / 'stubbed' / 'pages.pyi'
+    assert create_stubs(yaml_path, 'stubbed', jobs=1) == [
+        str(project / 'stubbed' / '__init__.pyi'), str(stub)]
+    content = stub.read_text()
+    assert 'class StubbedPage(BasePage):' in content
+    assert content.index('query_input') < content.index('search_button')
+    manifest = json.loads((project / 'stubbed' / STUBS_MANIFEST).read_text())
+    # Missing yaml files of bases are inputs too
+    assert manifest['files']['stubbed/pages.py']['inputs'] == [
+        'yaml/BasePage.yaml', 'yaml/StubbedPage.yaml']
+
+    assert not create_stubs(yaml_path, 'stubbed', jobs=1)
+
+    (project / 'yaml' / 'StubbedPage.yaml').write_text(
+        YAML + 'reset:\n  button:\n    id: reset\n')
+    assert create_stubs(yaml_path, 'stubbed', jobs=1) == [str(stub)]
+    assert 'reset_button' in stub.read_text()
+
+    # Unchanged stubs are not written even if they are created again
+    assert not create_stubs(yaml_path, 'stubbed', jobs=1, force=True)
+
+
+def test_stubs_are_created_in_processes(project):
+    yaml_path = str(project / 'yaml')
+    (project / 'stubbed' / 'more.py').write_text(
+        PAGES.replace('StubbedPage', 'MorePage'))
+    (project / 'yaml' / 'MorePage.yaml').write_text(YAML)
+    written = create_stubs(yaml_path, 'stubbed', jobs=2)
+    assert written == [str(project / 'stubbed' / name)
+                       for name in ('__init__.pyi', 'more.pyi', 'pages.pyi')]
+    assert 'class MorePage(BasePage):' in (
+        project / 'stubbed' / 'more.pyi').read_text()
+    assert not create_stubs(yaml_path, 'stubbed', jobs=2)
+
+
+def test_stubs_are_created_again_if_element_classes_change(project):
+    yaml_path = str(project / 'yaml')
+    elements = project / 'stubbed' / 'elements.py'
+    elements.write_text(ELEMENTS)
+    CONFIG.elements_classes_module = 'stubbed.elements'
+    module = importlib.import_module('stubbed.elements')
+    stub = project / 'stubbed' / 'pages.pyi'
+    assert str(stub) in create_stubs(yaml_path, 'stubbed', jobs=1)
+    assert 'query_input = None # type: InputElement' in stub.read_text()
+    manifest = json.loads((project / 'stubbed' / STUBS_MANIFEST).read_text())
+    assert 'stubbed/elements.py' in (
+        manifest['files']['stubbed/pages.py']['inputs'])
+
+    elements.write_text(
+        ELEMENTS + '\n\nclass ButtonElement(BaseElement):\n    pass\n')
+    importlib.reload(module)
+    assert str(stub) in create_stubs(yaml_path, 'stubbed', jobs=1)
+    assert 'search_button = None # type: ButtonElement' in stub.read_text()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# pylint:disable=redefined-outer-name
+from time import perf_counter
+
+import pytest
+
+from shawl import BaseElement
+from shawl.config import SHAWL_CONFIG as CONFIG
+from shawl.utils import TimingStats, save_timing_stats
+from shawl.utils._timing_stats import MAX_SAMPLES, MIN_TIMEOUT, _HISTORY
+from tests.drivers import ELEMENT, fake_driver
+
+
+@pytest.fixture()
+def stats_path(tmp_path):
+    path = str(tmp_path / 'timings.json')
+    CONFIG.timing_stats_path = path
+    yield path
+    CONFIG.timing_stats_path = ''
+    CONFIG.adaptive_timeouts = False
+    _HISTORY.clear()
+
+
+def test_timeout_is_learned_within_bounds():
+    stats = TimingStats()
+    assert stats.timeout('id=button', 5, 3) == 5
+    for _ in range(MAX_SAMPLES + 10):
+        stats.add('id=button', 0.1)
+        stats.add('id=slow', 4)
+    assert len(stats.samples['id=button']) == MAX_SAMPLES
+    assert stats.timeout('id=button', 5, 3) == MIN_TIMEOUT
+    assert stats.timeout('id=slow', 5, 3) == 5
+    stats.add('id=button', 0, satisfied=False)
+    assert stats.timeouts['id=button'] == 1
+    assert len(stats.samples['id=button']) == MAX_SAMPLES
+
+
+def test_stats_of_workers_are_merged(stats_path):
+    first, second = TimingStats(), TimingStats()
+    first.add('id=button', 0.1)
+    second.add('id=button', 0.2)
+    second.add('id=link', 1, satisfied=False)
+    first.save(stats_path)
+    second.save(stats_path)
+    merged = TimingStats.load(stats_path)
+    assert merged.samples == {'id=button': [0.1, 0.2]}
+    assert merged.timeouts == {'id=link': 1}
+
+
+def test_waits_are_recorded_and_adapted(stats_path):
+    driver = fake_driver(findElement=ELEMENT,
+                         isElementEnabled=True,
+                         getElementRect={'x': 0, 'y': 0})
+    button = BaseElement(driver, **{'id': 'button'})
+    for _ in range(20):
+        assert button.is_present()
+    save_timing_stats()
+    assert len(TimingStats.load(stats_path).samples['id=button']) == 20
+
+    CONFIG.adaptive_timeouts = True
+    driver.command_executor.responses['findElement'] = None
+    start = perf_counter()
+    assert not button.is_present()
+    assert perf_counter() - start < 2
+    save_timing_stats()
+    assert TimingStats.load(stats_path).timeouts['id=button'] == 1
+
+
+def test_timeout_grows_back_after_cut_off_lazy_loads():
+    stats = TimingStats()
+    for _ in range(MAX_SAMPLES):
+        stats.add('id=button', 0.1)
+    assert stats.timeout('id=button', 5, 3) == MIN_TIMEOUT
+    for _ in range(3):
+        stats.add('id=button', MIN_TIMEOUT, satisfied=False, censored=True)
+    assert stats.timeout('id=button', 5, 3) == MIN_TIMEOUT * 3
+    for _ in range(3):
+        stats.add('id=button', 1.5, satisfied=False, censored=True)
+    assert stats.timeout('id=button', 5, 3) == 4.5
+
+
+def test_negative_checks_keep_learned_timeout(stats_path):
+    driver = fake_driver(findElement=ELEMENT,
+                         isElementEnabled=True,
+                         getElementRect={'x': 0, 'y': 0})
+    button = BaseElement(driver, **{'id': 'button'})
+    for _ in range(20):
+        assert button.is_present()
+    save_timing_stats()
+
+    CONFIG.adaptive_timeouts = True
+    driver.command_executor.responses['findElement'] = None
+    for _ in range(3):
+        start = perf_counter()
+        assert not button.is_present()
+        assert perf_counter() - start < 2
+        save_timing_stats()
+        _HISTORY.clear()
+    stats = TimingStats.load(stats_path)
+    assert stats.timeouts['id=button'] == 3
+    assert stats.timeout('id=button', 5, 3) == MIN_TIMEOUT
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# pylint:disable=protected-access
+# pylint:disable=redefined-outer-name
+import json
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import pytest
+from selenium.webdriver.remote.command import Command
+
+from shawl.transport import PooledConnection, clear_pools, connect
+from shawl.transport._pooled_connection import get_json_codec
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    clients = set()
+
+    def _answer(self, value):
+        self.clients.add(self.client_address)
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        data = json.dumps({'value': value}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        # pylint:disable=invalid-name
+        if self.path == '/session':
+            self._answer({'sessionId': 'fake', 'capabilities': {}})
+        else:
+            self._answer(None)
+
+    def do_GET(self):
+        # pylint:disable=invalid-name
+        self._answer('Title')
+
+    def log_message(self, *args):
+        # pylint:disable=arguments-differ
+        pass
+
+
+@pytest.fixture()
+def server_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    Handler.clients.clear()
+    yield f'http://127.0.0.1:{server.server_port}'
+    clear_pools()
+    server.shutdown()
+    server.server_close()
+
+
+def test_sessions_share_connections(server_url):
+    first = connect(server_url, {'browserName': 'chrome'})
+    second = connect(server_url, {'browserName': 'chrome'}, fast_json=True)
+    for _ in range(5):
+        assert first.title == 'Title'
+        assert second.title == 'Title'
+    assert first.command_executor._conn is second.command_executor._conn
+    assert len(Handler.clients) == 1
+
+
+def test_latency_hooks(server_url):
+    executor = PooledConnection(server_url)
+    calls = []
+    executor.add_latency_hook(lambda *args: calls.append(args))
+    executor.execute(Command.GET_TITLE, {'sessionId': 'fake'})
+    command, status, elapsed = calls[0]
+    assert (command, status) == (Command.GET_TITLE, 200)
+    assert elapsed > 0
+
+
+@pytest.mark.parametrize('installed', [('orjson', 'ujson'), ('ujson',), ()])
+def test_fast_json_codec(server_url, monkeypatch, installed):
+    for name in ('orjson', 'ujson'):
+        if name not in installed:
+            # Import of None module raises ImportError
+            monkeypatch.setitem(sys.modules, name, None)
+    codec = get_json_codec(fast=True)
+    assert codec.name == 'json' or codec.name in installed
+    assert codec.loads(codec.dumps({'value': [1, 'a']})) == {'value': [1, 'a']}
+
+    executor = PooledConnection(server_url, fast_json=True)
+    assert executor.json_module == codec.name
+    response = executor.execute(Command.GET_TITLE, {'sessionId': 'fake'})
+    assert response['value'] == 'Title'
+    assert get_json_codec(fast=False).name == 'json'